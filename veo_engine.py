@@ -0,0 +1,4503 @@
+# ==============================================================================
+# Video Encoding Optimizer - 인코딩 엔진
+# ==============================================================================
+# 인코딩 작업 정의(EncodingTask), 코덱 설정 스키마(CODEC_CONFIG), FFmpeg 명령어 빌더와
+# 멀티프로세싱 워커 함수를 담은 모듈.
+# GUI(tkinter)나 그래프(matplotlib) 의존성이 없어, 워커 프로세스는 메인 스크립트 대신 이 모듈만 임포트함.
+
+
+
+# ==============================================================================
+# 1. 임포트 및 기본 설정
+# ==============================================================================
+
+# ------------------------------------------------------------------------------
+# 표준 라이브러리 (Standard Library)
+# ------------------------------------------------------------------------------
+# 데이터 구조 및 타입
+from array import array  # 같은 타입의 숫자를 압축된 형태로 저장하는 배열 (프레임별 VMAF 점수 저장용)
+from dataclasses import dataclass, field  # 상용구 코드 없이 클래스를 단순하게 작성하기 위한 데이터 클래스 데코레이터
+from typing import Any, Dict, List, Tuple  # 타입 힌트(type hint)를 지원하기 위한 모듈
+
+# 시스템, 프로세스, 동시성 관리
+import logging  # 애플리케이션의 정보, 경고, 오류 등 이벤트 스트림을 로그 파일에 기록하기 위한 모듈
+import multiprocessing  # CPU 집약적 인코딩 작업을 별도의 프로세스에서 병렬로 실행하기 위한 모듈
+import os  # 운영 체제 서비스와 상호작용하기 위한 모듈 (파일 경로 조작, 프로세스 ID 획득 등)
+import pickle  # 파이썬 객체를 직렬화하기 위한 모듈 (실행 컨텍스트를 워커와 한 번만 공유하는 데 사용)
+import shlex  # 쉘(shell)과 유사한 문법으로 문자열을 파싱하는 모듈 (FFmpeg 명령어 문자열을 인자 리스트로 안전하게 분리하는 데 사용)
+import shutil  # 고수준 파일 작업 모듈 (하드 링크를 만들 수 없을 때 샘플 저장소의 파일 복사용)
+import subprocess  # 새로운 프로세스를 생성하고 입출력 파이프에 연결하며 반환 코드를 얻기 위한 모듈 (FFmpeg 실행용)
+import threading  # 스레드 기반 병렬 처리를 위한 모듈 (파이프 중계 시 stderr 수집 등)
+
+# 유틸리티 및 기타
+import re  # 정규 표현식(Regular Expression) 작업을 위한 모듈 (FFmpeg 로그에서 특정 텍스트 패턴 추출용)
+import gzip  # gzip 압축 파일을 읽고 쓰기 위한 모듈 (작업별 FFmpeg 로그 저장용)
+import hashlib  # 해시 함수 모듈 (결과 캐시 키와 VMAF 모델 파일 지문 계산용)
+import heapq  # 힙 큐 알고리즘 모듈 (전체 정렬 없이 하위 1% VMAF 점수를 선택하는 데 사용)
+import json  # JSON 형식의 파일을 읽고 쓰기 위한 모듈 (작업 소요 시간 기록 저장용)
+import math  # 기본적인 수학 함수를 제공하는 모듈 (표준편차 계산용)
+import time  # 시간 관련 기능을 제공하는 모듈 (인코딩/분석 단계별 소요 시간 측정용)
+import uuid  # 고유 식별자 생성 모듈 (실행 컨텍스트 파일 이름을 실행마다 다르게 하는 데 사용)
+import sqlite3  # 내장 SQL 데이터베이스 모듈 (실행 간에 공유하는 작업 결과 캐시 저장용)
+from datetime import datetime  # 날짜와 시간을 조작하기 위한 클래스를 제공하는 모듈 (작업 소요 시간 측정용)
+
+
+
+# ------------------------------------------------------------------------------
+# 로깅 기본 설정
+# ------------------------------------------------------------------------------
+def configure_logging():
+    """
+    애플리케이션 로그를 'Video Encoding Optimizer.log' 파일에 추가(append) 모드로 기록하도록 설정.
+
+    메인 프로세스와 워커 프로세스가 같은 로그 파일을 사용하도록 양쪽에서 호출됨.
+    이미 핸들러가 설정된 프로세스(fork 방식으로 생성된 워커 등)에서는 아무 동작도 하지 않음.
+    로그 형식: [시간] - [로그 레벨] - [메시지]
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        filename="Video Encoding Optimizer.log",
+        filemode="a",
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+
+
+
+# ==============================================================================
+# 상수 정의
+# ==============================================================================
+
+# 애플리케이션 설정 상수
+APP_CONFIG = {
+    # ==============================================================================
+    # 1. 핵심 동작 및 기본값
+    # ==============================================================================
+    "default_sample_duration": 10.0,  # 기본 샘플 지속 시간 (초)
+    "default_target_vmaf": 95.0,      # 기본 목표 VMAF 값
+    "default_vmaf_threshold": 90.0,   # 기본 VMAF 임계값
+    "default_parallel_jobs": 4,       # 기본 병렬 작업 수
+
+    # ==============================================================================
+    # 2. 성능 및 자원 관리
+    # ==============================================================================
+    "max_parallel_jobs": 8,           # NVENC 최대 병렬 작업 수
+    "chunk_size": 10000,              # 프레임 처리 청크 크기
+    "memory_check_interval": 5,       # 메모리 체크 간격 (청크 단위)
+    "progress_update_interval": 4,    # 진행률 업데이트 간격 (워커 단위)
+    "max_eta_display_seconds": 86400, # ETA 표시 최대 시간 (24시간)
+    "fused_metric_analysis": True,    # VMAF/PSNR/SSIM/블록 분석을 한 번의 디코딩으로 통합 실행할지 여부
+    "pipe_encode_to_analysis": True,  # 인코딩 결과를 디스크에 쓰지 않고 파이프로 통합 분석에 직접 전달할지 여부
+    "pipe_buffer_size": 1024 * 1024,  # 인코더 -> 분석 파이프 중계 시 한 번에 읽는 바이트 수
+    "decoded_reference_enabled": True,  # 원본 샘플을 실행당 한 번만 디코딩하여 원시(y4m) 기준 영상으로 공유할지 여부
+    "decoded_reference_memory_ratio": 0.25,  # 디코딩된 기준 영상이 차지할 수 있는 가용 메모리 비율 상한
+    "max_task_chunk_size": 8,         # 워커에 한 번에 전달하는 (프리셋, CRF) 작업 묶음의 최대 크기
+    "task_log_folder_name": "task_logs",  # 작업별 FFmpeg 로그(gzip)를 저장할 리소스 하위 폴더명
+    "core_budget_scheduling": True,   # CPU 코어를 병렬 작업 간에 나누어 인코더/libvmaf 스레드 수를 지정할지 여부
+    "core_budget_pipe_encoder_share": 0.5,  # 파이프 모드에서 인코더와 libvmaf가 동시에 실행될 때 작업 슬롯의 코어 예산 중 인코더에 할당할 비율
+    "admission_control_enabled": True,  # 메모리/CPU/디스크 상태를 확인하여 작업 시작을 보류할지 여부
+    "admission_poll_interval": 0.5,   # 작업 시작이 보류된 동안 시스템 상태를 다시 확인하는 간격 (초)
+    "admission_memory_reserve_mb": 1024,  # 작업을 시작한 후에도 남겨둘 최소 가용 메모리 (MB)
+    "admission_memory_safety_factor": 1.25,  # 학습된 코덱별 최대 메모리 사용량에 곱하는 안전 계수
+    "admission_default_task_memory_mb": 768,  # 코덱의 메모리 사용량을 아직 학습하지 못했을 때의 작업당 예상치 (MB)
+    "admission_cpu_overload_ratio": 2.0,  # 1분 평균 부하가 논리 코어 수의 이 배수를 넘으면 작업 시작을 보류
+    "admission_disk_reserve_mb": 512,  # 임시 디렉토리 디스크에 남겨둘 최소 여유 공간 (MB)
+    "pipeline_stages_enabled": False,  # Range Test에서 인코딩과 분석을 별도 워커 풀로 나누어 겹쳐 실행할지 여부 (파일 기반)
+    "pipeline_encode_jobs": 0,        # 인코딩 단계의 동시 실행 수 (0이면 병렬 작업 수, 하드웨어 인코더 세션 수에 맞출 때 사용)
+    "pipeline_analysis_jobs": 0,      # 분석 단계의 동시 실행 수 (0이면 병렬 작업 수)
+    "pipeline_queue_size": 4,         # 분석을 기다리며 디스크에 남겨둘 수 있는 인코딩 결과의 최대 개수
+    "adaptive_range_coarse_intervals": 8,  # Adaptive Range 모드에서 조건 없이 이등분하여 만드는 프리셋별 성긴 격자의 구간 수 (2의 거듭제곱으로 올림)
+    "successive_halving_fidelities": (0.25, 0.5),  # Successive Halving 모드의 선별 단계별 샘플 길이 비율 (마지막에는 항상 전체 샘플로 평가)
+    "successive_halving_eta": 3,      # 단계마다 다음 단계로 올리는 후보의 비율 (상위 1/eta)
+    "successive_halving_min_candidates": 5,  # 다음 단계로 올리는 최소 후보 수 (스위트 스팟 계산에는 프론트의 점이 3개 이상 필요)
+    "successive_halving_min_seconds": 1.0,  # 선별용 샘플의 최소 길이 (초)
+    "prune_frontier_filename": "pruning_frontier.json",  # 지배 작업 조기 중단을 위해 완료된 결과를 워커와 공유하는 임시 파일명
+    "prune_poll_interval": 0.5,       # 진행 중인 인코딩의 출력 크기와 공유 결과를 확인하는 간격 (초)
+    "target_vmaf_model_search": True,  # Target VMAF 탐색에 로지스틱 모델과 다른 프리셋의 측정값을 사용할지 여부 (False면 기존 양 끝 + 보간 탐색)
+    "target_vmaf_points_filename": "target_vmaf_points.jsonl",  # 프리셋 간에 측정한 (프리셋, CRF, VMAF)를 공유하는 임시 파일명
+    "target_vmaf_initial_guess": 0.45,  # 참고할 측정값이 없을 때 첫 탐색 지점 (품질 범위 내 상대 위치)
+    "target_vmaf_default_slope": 8.0,  # 참고할 측정값이 없을 때 품질 범위 전체에 걸친 logit(VMAF) 변화량
+    "target_vmaf_max_probes": 12,     # 프리셋당 최대 탐색 횟수
+    "target_vmaf_probe_scheduler": True,  # 프리셋 단위 대신 CRF 테스트 단위로 작업을 배치하여 남는 작업 슬롯으로 같은 프리셋의 여러 CRF를 동시에 평가할지 여부 (모델 기반 탐색 필요)
+    "target_vmaf_sequential_test": True,  # Target VMAF 탐색에서 프레임 일부만 먼저 분석하여 목표와의 대소가 확실하면 전체 분석을 생략할지 여부
+    "sequential_test_subsample": 8,   # 1차 분석에서 VMAF를 계산할 프레임 간격 (libvmaf n_subsample)
+    "sequential_test_batches": 6,     # 프레임 점수 간의 상관을 고려하여 평균의 표준오차를 구할 때 나누는 묶음 수 (batch means)
+    "sequential_test_critical_value": 4.0,  # 평균이 목표에서 표준오차의 몇 배 이상 떨어져야 판정을 확정할지 (묶음 6개 기준 t분포 99% 수준)
+    "cost_model_enabled": True,       # 학습된 작업 비용 모델로 오래 걸리는 작업부터 실행하고 ETA를 계산할지 여부
+    "cost_history_filename": "task_cost_history.json",  # 작업별 소요 시간 기록을 저장할 리소스 폴더 내 파일명
+    "cost_history_smoothing": 0.3,    # 소요 시간 기록 갱신 시 새 측정값의 가중치 (지수 이동 평균)
+    "cost_default_preset_growth": 1.6,  # 기록이 없을 때 프리셋이 한 단계 느려질 때마다 늘어나는 인코딩 비용 배수
+    "cost_default_quality_slope": 1.5,  # 기록이 없을 때 품질 범위 전체에 걸친 인코딩 비용의 로그 변화량 (낮은 CRF일수록 느림)
+    "time_budget_crf_steps": (1, 2, 3, 4),  # 시간 예산에 맞추기 위해 차례로 시도하는 Range Test의 CRF 간격 (격자 밀도)
+    "time_budget_min_sample_seconds": 2.0,  # 시간 예산에 맞추기 위해 샘플을 줄일 수 있는 최소 길이 (초)
+    "time_budget_vmaf_subsamples": (1, 2, 4),  # 시간 예산에 맞추기 위해 차례로 시도하는 VMAF 계산 프레임 간격 (분석 정밀도)
+    "time_budget_vmaf_share": 0.7,    # 분석 시간 중 libvmaf 계산이 차지하는 비율 (프레임 간격을 늘려도 디코딩 비용은 남음)
+    "result_cache_enabled": True,     # 같은 샘플과 설정으로 이미 테스트한 (프리셋, CRF) 결과를 실행 간에 재사용할지 여부
+    "result_cache_filename": "result_cache.sqlite",  # 작업 결과 캐시를 저장할 리소스 폴더 내 SQLite 파일명
+    "result_cache_max_mb": 256,       # 결과 캐시의 최대 크기 (MB, 넘으면 가장 오래 사용하지 않은 결과부터 삭제)
+    "result_cache_timeout": 10.0,     # 다른 인스턴스가 캐시에 쓰는 동안 잠금 해제를 기다리는 최대 시간 (초)
+    "sample_store_enabled": True,     # 추출한 무손실 샘플을 보관하여 같은 원본 구간의 추출(최적화, A/B 비교, 재실행)에 재사용할지 여부
+    "sample_store_folder_name": "sample_cache",  # 샘플 저장소로 사용할 리소스 하위 폴더명
+    "sample_store_max_gb": 10.0,      # 샘플 저장소의 최대 크기 (GB, 넘으면 가장 오래 사용하지 않은 샘플부터 삭제)
+    "source_fingerprint_chunk_kb": 1024,  # 원본 지문 계산 시 파일의 처음, 가운데, 끝에서 읽는 구간의 크기 (KB)
+    "scene_index_enabled": True,      # 원본별 초당 프레임 크기 지도와 키프레임 목록을 저장하여 다음 장면 분석에 재사용할지 여부
+    "scene_index_folder_name": "scene_index",  # 장면 분석 인덱스를 저장할 리소스 하위 폴더명
+    "scene_index_max_entries": 200,   # 보관할 원본별 인덱스의 최대 개수 (넘으면 가장 오래 사용하지 않은 인덱스부터 삭제)
+
+    # ==============================================================================
+    # 3. 장면 분석 알고리즘
+    # ==============================================================================
+    "overlap_keyframes": 2,           # 병렬 분석 시 키프레임 중첩 수
+    "min_data_points_for_iqr": 10,    # IQR 아웃라이어 제거 최소 데이터 포인트 수
+    "q1_percentile": 0.15,            # Q1 계산용 하위 백분율
+    "q3_percentile": 0.85,            # Q3 계산용 상위 백분율
+    "iqr_multiplier": 3.0,            # IQR 아웃라이어 제거 승수
+
+    # ==============================================================================
+    # 4. 시스템 및 외부 연동
+    # ==============================================================================
+    "data_folder_name": "VEO_Resource",  # 리소스 데이터 폴더명
+    "max_filename_length": 200,       # 최대 파일명 길이 (임시 디렉토리 생성용)
+    "ffmpeg_download_url": "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip",  # FFmpeg 다운로드 URL
+    "vmaf_repo_api_url": "https://api.github.com/repos/Netflix/vmaf/contents/model",  # VMAF 모델 저장소 API URL
+    "max_download_workers": 16,       # VMAF 모델 병렬 다운로드에 사용할 최대 스레드 수
+    "subprocess_timeout": 2,          # 서브프로세스 종료 대기 시간 (초)
+    "subprocess_poll_interval": 0.1,  # 서브프로세스 상태 확인 간격 (초)
+
+    # ==============================================================================
+    # 5. GUI 및 표시 형식
+    # ==============================================================================
+    "window_size": (800, 600),        # 메인 윈도우 크기 (너비, 높이)
+    "time_selector_window_size": (400, 150),  # 시간 선택 윈도우 크기 (너비, 높이)
+    "preview_window_size": (800, 600),  # 미리보기 윈도우 크기 (너비, 높이)
+    "vmaf_model_selector_window_size": (360, 320),  # VMAF 모델 선택 윈도우 크기 (너비, 높이)
+    "advanced_settings_window_size": (700, 300),  # 고급 설정 윈도우 크기 (너비, 높이)
+    "graph_window_size": (900, 700),  # 그래프 윈도우 크기 (너비, 높이)
+    "log_window_size": (700, 500),    # 로그 윈도우 크기 (너비, 높이)
+    "command_window_size": (700, 200),# 명령어 윈도우 크기 (너비, 높이)
+    "tooltip_offset": 25,             # 툴팁 오프셋 (픽셀)
+    "tooltip_padding": 40,            # 툴팁 패딩 (픽셀)
+    "metric_formats": {
+        "vmaf": ".6f",                # VMAF 점수 (소수점 6자리)
+        "vmaf_1_low": ".6f",          # VMAF 하위 1% 점수 (소수점 6자리)
+        "psnr": ".4f",                # PSNR 점수 (소수점 4자리)
+        "ssim": ".6f",                # SSIM 점수 (소수점 6자리)
+        "block_score": ".7f",         # 블록 점수 (소수점 7자리)
+        "size_mb": ".4f",             # 파일 크기 (소수점 4자리)
+        "efficiency": ".6f",          # 효율성 (소수점 6자리)
+    },
+
+    # ==============================================================================
+    # 6. 수치 정밀도 관련 상수
+    # ==============================================================================
+    "numerical_tolerance": {
+        "relative": 1e-6,  # 상대 오차 허용치 (상대적 정밀도 기준)
+        "absolute": 1e-8,  # 절대 오차 허용치 (절대적 정밀도 기준)
+        "convergence": 1e-4,  # 수렴 판정 허용치 (최적화 알고리즘의 수렴 여부 판정)
+    },
+
+    # ==============================================================================
+    # 7. 메시지 박스 관련 상수
+    # ==============================================================================
+    "message_titles": {
+        "error": "Error",  # 일반적인 오류 상황을 알리는 메시지 박스의 제목
+        "warning": "Warning",  # 사용자에게 잠재적인 문제를 경고하는 메시지 박스의 제목
+        "info": "Information",  # 사용자에게 단순 정보를 제공하는 메시지 박스의 제목
+        "input_error": "Input Error",  # 사용자가 입력한 값(예: 품질 범위)에 오류가 있을 때 표시되는 메시지 박스의 제목
+        "selection_error": "Selection Error",  # 사용자가 항목(예: 결과 테이블의 행, 코덱)을 잘못 선택했을 때 표시되는 메시지 박스의 제목
+    },
+
+    "message_texts": {
+        # 비디오 파일이 선택되지 않았거나 지정된 경로에 파일이 없을 때 사용되는 메시지
+        "file_not_found": "Please select a valid video file.",
+
+        # 인코딩 코덱이 선택되지 않은 상태에서 작업을 시작하려 할 때의 메시지
+        "codec_not_selected": "Please select a codec.",
+
+        # 수동 샘플 시간 범위가 설정되지 않았거나, 종료 시간이 시작 시간보다 빠를 때의 메시지
+        "invalid_time_range": "Manual sample time has not been set or is invalid. Please use the 'Set Range...' button.",
+
+        # 품질(CRF/CQ 등) 설정 범위가 유효하지 않을 때(예: 시작 값이 종료 값보다 클 때)의 메시지
+        "invalid_quality_range": "Quality range is invalid.",
+
+        # 'Target VMAF' 모드에서 목표 VMAF 값이 0-100 범위를 벗어났을 때의 메시지
+        "invalid_target_vmaf": "Target VMAF must be between 0 and 100.",
+
+        # 프리셋 범위 설정 시, 시작 프리셋이 종료 프리셋보다 느린(순서상 뒤에 있는) 값일 경우의 메시지
+        "invalid_preset_order": "Preset start value cannot be slower than the end value.",
+
+        # .format()을 사용하여 동적인 값을 메시지에 포함시켜야 할 때 사용되는 범용 오류 메시지 템플릿
+        "invalid_setting_value": "Invalid setting value: {}",
+    },
+
+    # ==============================================================================
+    # 8. 프로그램 정보 상수
+    # ==============================================================================
+    "about_info": {
+        "program": "Video Encoding Optimizer",          # 프로그램 이름
+        "version": "1.1.0",                             # 버전
+        "updated": "2025-09-07",                        # 업데이트 날짜
+        "license": "GNU General Public License v3.0",   # 라이선스
+        "developer": "(Github) IZH318",                 # 개발자 정보
+        "website": "https://github.com/IZH318",         # 웹사이트
+    },
+
+    # ==============================================================================
+    # 9. 파일 확장자 및 형식 정의
+    # ==============================================================================
+    "supported_video_extensions": (
+        "*.mp4 *.mkv *.avi *.mov *.webm *.flv *.mpg *.mpeg *.wmv *.vob *.mts *.m2ts *.ts"
+    ),
+
+    "file_type_filters": [
+        ("Supported Media Files", "*.mp4 *.mkv *.avi *.mov *.webm *.flv *.mpg *.mpeg *.wmv *.vob *.mts *.m2ts *.ts"),
+        ("All files", "*.*"),
+    ],
+
+    # ==============================================================================
+    # 10. 디버깅
+    # ==============================================================================
+    "enable_debug_logging": False,     # True로 설정 시 장면 분석 결과가 JSON 파일로 저장됨
+}
+
+
+
+# ==============================================================================
+# 2. 데이터 클래스 및 헬퍼
+# ==============================================================================
+# 인코딩 작업을 위한 데이터 클래스
+@dataclass
+class EncodingTask:
+    """
+    단일 인코딩 및 분석 작업에 필요한 모든 매개변수를 구조화하여 저장하는 데이터 클래스.
+    
+    FFmpeg 명령어 생성, 결과 분석, 파일 경로 관리 등에 필요한 모든 정보를
+    하나의 객체에 통합하여 관리함으로써 코드의 가독성과 유지보수성을 향상시킴.
+    """
+    ffmpeg_path: str # ffmpeg.exe 실행 파일의 전체 절대 경로
+    sample_path: str # 인코딩 및 분석의 기준이 되는 원본 샘플 영상 파일의 경로
+    temp_dir: str # 인코딩 결과물, 로그 파일 등 임시 파일들을 저장할 디렉토리 경로
+    codec: str # 사용할 비디오 코덱 이름 (예: 'libx265', 'h264_nvenc')
+    preset: str # 인코딩 속도/압축률 트레이드오프를 결정하는 프리셋 (예: 'slow', 'medium')
+    crf: int # CRF(Constant Rate Factor) 또는 그에 상응하는 품질 제어 값 (CQ, QP 등)
+    audio_option: str # 오디오 스트림 처리 방식 지정 ('Copy Audio', 'Remove Audio')
+    adv_opts: Dict[str, Any] # 사용자 정의 고급 인코딩 옵션을 담고 있는 딕셔너리
+
+    metrics: Dict[str, bool] = field(default_factory=dict) # PSNR, SSIM 등 추가적인 품질 메트릭의 계산 여부를 지정하는 딕셔너리
+    vmaf_model_path: str = "" # 사용할 특정 VMAF 모델 파일의 경로 (지정하지 않으면 FFmpeg 내장 모델 사용)
+    color_info: Dict[str, str] = field(default_factory=dict) # 비디오의 색상 정보(색공간, 색상 프라이머리, 전송 특성 등)를 담고 있는 딕셔너리
+    reference_path: str = "" # 분석 시 기준 영상으로 사용할 디코딩된 원시(y4m) 샘플 경로 (비어 있으면 sample_path를 디코딩)
+    log_dir: str = "" # 작업 로그를 압축하여 저장할 디렉토리 (비어 있으면 로그를 결과에 직접 포함)
+    encoder_threads: int = 0 # 인코더에 할당된 스레드 수 (0이면 코덱 기본값)
+    analysis_threads: int = 0 # libvmaf에 할당된 스레드 수 (0이면 libvmaf 기본값)
+    prune_frontier_path: str = "" # 완료된 결과 목록 파일 경로 (지정된 경우 지배당하는 인코딩을 조기 중단)
+    cancellable: bool = False # True이면 취소 표시 파일(cancel_flag_path)이 생기는 즉시 인코딩을 중단
+    vmaf_subsample: int = 1 # VMAF를 계산할 프레임 간격 (1이면 모든 프레임, 시간 예산에 맞춰 분석 정밀도를 낮출 때 사용)
+    sample_fingerprint: str = "" # 샘플 영상의 패킷 내용 지문 (fingerprint_sample, 결과 캐시 키에 사용)
+    result_cache_path: str = "" # 실행 간에 공유하는 결과 캐시 파일 경로 (비어 있으면 캐시를 사용하지 않음)
+
+    @property
+    def encoded_filename(self) -> str:
+        """
+        이 작업으로 생성될 인코딩된 결과물의 파일명을 생성.
+        
+        파일명 형식: encoded_{preset}_{crf}.mkv
+        예시: encoded_slow_23.mkv, encoded_medium_28.mkv
+        """
+        return f"encoded_{self.preset}_{self.crf}.mkv"
+
+    @property
+    def encoded_path(self) -> str:
+        """
+        인코딩된 결과물의 전체 절대 경로를 반환.
+        
+        임시 디렉토리와 인코딩된 파일명을 결합하여 완전한 파일 경로를 생성함.
+        """
+        return os.path.join(self.temp_dir, self.encoded_filename)
+
+    @property
+    def vmaf_log_filename(self) -> str:
+        """
+        VMAF 분석 결과(CSV)를 저장할 로그 파일의 이름을 생성.
+        
+        파일명 형식: vmaf_{preset}_{crf}.csv
+        예시: vmaf_slow_23.csv, vmaf_medium_28.csv
+        """
+        return f"vmaf_{self.preset}_{self.crf}.csv"
+
+    @property
+    def vmaf_log_path(self) -> str:
+        """
+        VMAF 분석 결과 로그 파일의 전체 절대 경로를 반환.
+        
+        임시 디렉토리와 VMAF 로그 파일명을 결합하여 완전한 파일 경로를 생성함.
+        """
+        return os.path.join(self.temp_dir, self.vmaf_log_filename)
+
+    @property
+    def psnr_stats_filename(self) -> str:
+        """
+        PSNR 필터의 프레임별 통계(stats_file)를 저장할 파일의 이름을 생성.
+
+        파일명 형식: psnr_{preset}_{crf}.log
+        """
+        return f"psnr_{self.preset}_{self.crf}.log"
+
+    @property
+    def psnr_stats_path(self) -> str:
+        """PSNR 프레임별 통계 파일의 전체 절대 경로를 반환."""
+        return os.path.join(self.temp_dir, self.psnr_stats_filename)
+
+    @property
+    def ssim_stats_filename(self) -> str:
+        """
+        SSIM 필터의 프레임별 통계(stats_file)를 저장할 파일의 이름을 생성.
+
+        파일명 형식: ssim_{preset}_{crf}.log
+        """
+        return f"ssim_{self.preset}_{self.crf}.log"
+
+    @property
+    def ssim_stats_path(self) -> str:
+        """SSIM 프레임별 통계 파일의 전체 절대 경로를 반환."""
+        return os.path.join(self.temp_dir, self.ssim_stats_filename)
+
+    @property
+    def cancel_flag_path(self) -> str:
+        """
+        메인 프로세스가 이 작업을 더 이상 필요로 하지 않을 때 생성하는 취소 표시 파일의 전체 절대 경로를 반환.
+
+        파일명 형식: cancel_{preset}_{crf}.flag
+        """
+        return os.path.join(self.temp_dir, f"cancel_{self.preset}_{self.crf}.flag")
+
+# 한 번의 최적화 실행에서 공유되는 설정을 위한 데이터 클래스
+@dataclass
+class RunContext:
+    """
+    한 번의 최적화 실행에 포함된 모든 작업이 공유하는 설정을 저장하는 데이터 클래스.
+
+    프리셋과 CRF를 제외한 설정(경로, 코덱, 고급 옵션, 메트릭 등)은 실행 내내 변하지 않으므로,
+    작업마다 EncodingTask 전체를 직렬화하여 전달하는 대신 이 객체를 실행당 한 번만 공유하고
+    개별 작업은 (프리셋, CRF) 쌍으로만 전달함.
+    """
+    ffmpeg_path: str # ffmpeg.exe 실행 파일의 전체 절대 경로
+    sample_path: str # 인코딩 및 분석의 기준이 되는 원본 샘플 영상 파일의 경로
+    temp_dir: str # 인코딩 결과물, 로그 파일 등 임시 파일들을 저장할 디렉토리 경로
+    codec: str # 사용할 비디오 코덱 이름
+    audio_option: str # 오디오 스트림 처리 방식 지정 ('Copy Audio', 'Remove Audio')
+    adv_opts: Dict[str, Any] # 사용자 정의 고급 인코딩 옵션을 담고 있는 딕셔너리
+
+    metrics: Dict[str, bool] = field(default_factory=dict) # 추가적인 품질 메트릭의 계산 여부를 지정하는 딕셔너리
+    vmaf_model_path: str = "" # 사용할 특정 VMAF 모델 파일의 경로
+    color_info: Dict[str, str] = field(default_factory=dict) # 비디오의 색상 정보를 담고 있는 딕셔너리
+    reference_path: str = "" # 분석 시 기준 영상으로 사용할 디코딩된 원시(y4m) 샘플 경로
+    target_vmaf: float = 0.0 # Target VMAF 모드의 목표 VMAF 값
+    log_dir: str = "" # 작업 로그를 압축하여 저장할 디렉토리
+    target_points_path: str = "" # Target VMAF 탐색에서 프리셋 간에 측정값을 공유하는 파일 경로 (비어 있으면 공유 안 함)
+    prune_frontier_path: str = "" # 지배 작업 조기 중단에 사용할 완료된 결과 목록 파일 경로 (비어 있으면 사용 안 함)
+    vmaf_subsample: int = 1 # VMAF를 계산할 프레임 간격 (1이면 모든 프레임)
+    sample_fingerprint: str = "" # 샘플 영상의 패킷 내용 지문 (샘플을 바꾸면 함께 갱신해야 함)
+    result_cache_path: str = "" # 실행 간에 공유하는 결과 캐시 파일 경로 (비어 있으면 캐시를 사용하지 않음)
+    encoder_threads: int = 0 # 실행 전체에서 모든 작업에 같게 적용하는 인코더 스레드 수 (0이면 코덱 기본값)
+
+    def make_task(self, preset: str, crf: int, threads: int = 0) -> EncodingTask:
+        """
+        공유 설정에 프리셋과 CRF를 결합하여 단일 작업용 EncodingTask를 생성.
+
+        인코더 스레드 수는 출력 비트스트림에 영향을 주므로 작업별 값이 아닌 실행 전체의 고정값(encoder_threads)을 사용함.
+
+        Args:
+            preset (str): 인코딩 프리셋
+            crf (int): CRF 또는 그에 상응하는 품질 제어 값
+            threads (int): 코어 예산에 따라 이 작업의 libvmaf에 할당된 스레드 수 (0이면 기본값)
+
+        Returns:
+            EncodingTask: 워커에서 실행할 작업 객체
+        """
+        return EncodingTask(
+            ffmpeg_path=self.ffmpeg_path, sample_path=self.sample_path, temp_dir=self.temp_dir,
+            codec=self.codec, preset=preset, crf=crf, audio_option=self.audio_option,
+            adv_opts=self.adv_opts, metrics=self.metrics, vmaf_model_path=self.vmaf_model_path,
+            color_info=self.color_info, reference_path=self.reference_path, log_dir=self.log_dir,
+            encoder_threads=self.encoder_threads, analysis_threads=threads, prune_frontier_path=self.prune_frontier_path,
+            vmaf_subsample=self.vmaf_subsample, sample_fingerprint=self.sample_fingerprint, result_cache_path=self.result_cache_path
+        )
+
+# 파일 경로에 사용하기 안전한 문자열로 변환하는 헬퍼 함수
+def sanitize_for_path(text):
+    """
+    문자열을 파일 시스템에서 안전하게 사용할 수 있도록 정규화.
+    
+    공백을 밑줄로 변환하고, 파일명으로 부적합한 특수문자들을 제거하여 Windows 환경에서 파일 시스템 오류를 방지함.
+    
+    Args:
+        text (str): 정규화할 원본 문자열
+        
+    Returns:
+        str: 경로에 사용 가능한 안전한 문자열 (최대 길이 제한 적용)
+    """
+    # 문자열 정규화 (공백 및 특수문자 제거)
+    text = re.sub(r'\s+', '_', text) # 하나 이상의 연속된 공백 문자를 '_'로 대체
+    text = re.sub(r'[^\w\-_.]', '', text) # 단어 문자(\w), 밑줄, 하이픈, 점을 제외한 모든 문자를 제거
+    
+    # 최종 문자열을 최대 길이에 맞게 잘라 반환
+    return text[:APP_CONFIG['max_filename_length']] # 보안 및 경로 길이 제한을 위해 최대 길이로 자름
+
+def _get_subprocess_startupinfo():
+    """
+    Windows 환경에서 subprocess 실행 시 콘솔 창을 숨기는 STARTUPINFO 객체를 설정.
+    
+    FFmpeg 등의 명령줄 도구 실행 시 불필요한 콘솔 창이 나타나지 않도록 하여 사용자 경험을 개선함.
+    
+    Returns:
+        subprocess.STARTUPINFO or None: Windows 환경에서는 STARTUPINFO 객체, 다른 환경에서는 None
+    """
+    # Windows 환경일 경우에만 콘솔 창을 숨기는 설정 적용
+    if os.name == 'nt': # 운영 체제가 Windows인 경우에만 적용
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW # 프로세스 생성 시 창을 숨기는 플래그 설정
+        return startupinfo
+    
+    # 그 외 운영체제에서는 기본값(None)을 반환
+    return None # Windows가 아닌 경우 None을 반환하여 기본 동작을 따르도록 함
+
+
+# (코덱, 프리셋, CRF) 작업의 소요 시간을 예측하는 비용 모델 클래스
+class TaskCostModel:
+    """
+    인코딩/분석 작업의 소요 시간을 예측하는 비용 모델 클래스.
+
+    이전 실행에서 측정한 작업별 인코딩 및 분석 시간을 샘플 1초당 소요 시간으로 정규화하여 JSON 파일에 누적하고,
+    이를 바탕으로 (코덱, 프리셋, CRF) 조합의 비용을 예측함. 기록이 없는 조합은 같은 프리셋의 가장 가까운 CRF 기록이나
+    프리셋 순서와 품질 값에 따른 기본 추정치로 대체함. 실행 중에는 완료된 작업의 실제 시간과 예측값의 비율로
+    현재 원본(해상도, 복잡도)과 시스템에 맞춘 배율을 보정하여, 작업을 오래 걸리는 순서로 배치하고 ETA를 계산하는 데 사용함.
+    인코더 출력을 파이프로 분석에 바로 전달한 작업은 두 단계가 동시에 실행되어 인코딩/분석 시간을 나눌 수 없으므로,
+    전체 소요 시간을 하나의 비용으로 코덱별 별도 기록('<코덱> (piped)')에 누적함.
+    결과 처리(메인 스레드)와 작업 배치(작업 스레드)가 동시에 사용하므로 모든 공개 메서드는 잠금 안에서 실행됨.
+    """
+
+    PIPED_SUFFIX = " (piped)" # 파이프 모드 작업의 기록을 파일 기반 기록과 구분하는 코덱 키 접미사
+
+    def __init__(self, history_path: str):
+        """
+        TaskCostModel 객체를 초기화하고 저장된 소요 시간 기록을 불러옴.
+
+        Args:
+            history_path: 소요 시간 기록 JSON 파일 경로
+        """
+        self.history_path = history_path
+        self.history = {} # {코덱: {프리셋: {CRF 문자열: [인코딩 초/샘플초, 분석 초/샘플초]}}} (파이프 모드 기록은 [전체 초/샘플초, 0])
+        self.dirty = False # 저장되지 않은 변경 사항이 있는지 여부
+        self.codec = ""
+        self.presets = [] # 현재 코덱의 프리셋 목록 (빠른 순서)
+        self.quality_range = (0, 51)
+        self.sample_seconds = 1.0 # 현재 실행의 샘플 길이 (초)
+        self.piped = False # 현재 실행의 작업이 인코더 출력을 파이프로 분석에 전달하는지 여부
+        self.log_scale_sum = 0.0 # 실행 중 관측한 (실제 / 예측) 비율의 로그 합계
+        self.log_scale_count = 0
+        self.lock = threading.RLock() # 기록과 보정 배율을 여러 스레드에서 안전하게 사용하기 위한 잠금
+        try:
+            with open(history_path, 'r', encoding='utf-8') as f:
+                loaded = json.load(f)
+            if isinstance(loaded, dict):
+                self.history = loaded
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not load task cost history {history_path}: {e}")
+
+    def start_run(self, codec: str, presets: List[str], sample_seconds: float, piped: bool = False):
+        """
+        새 실행을 위해 코덱 정보를 설정하고 실행 중 보정 배율을 초기화.
+
+        보정 배율은 실행 전체에서 누적되어야 하므로 실행을 시작할 때 한 번만 호출하고,
+        실행 중에 샘플 길이가 바뀌면 set_sample_seconds를 사용함.
+
+        Args:
+            codec: 현재 실행의 코덱 이름
+            presets: 코덱의 전체 프리셋 목록 (빠른 순서)
+            sample_seconds: 샘플 영상의 길이 (초)
+            piped: 이번 실행의 작업이 인코더 출력을 파이프로 분석에 전달하는지 여부 (예측에 사용할 기록 선택)
+        """
+        with self.lock:
+            self.codec = codec
+            self.presets = list(presets)
+            self.quality_range = CODEC_CONFIG.get(codec, {}).get("quality_range", (0, 51))
+            self.sample_seconds = max(float(sample_seconds), 0.001)
+            self.piped = piped
+            self.log_scale_sum = 0.0
+            self.log_scale_count = 0
+
+    def set_sample_seconds(self, sample_seconds: float):
+        """
+        실행 중에 샘플 길이가 바뀐 경우 (시간 예산 계획으로 샘플을 줄인 경우) 보정 배율은 유지하고 샘플 길이만 갱신.
+
+        Args:
+            sample_seconds: 이후 작업이 사용할 샘플의 길이 (초)
+        """
+        with self.lock:
+            self.sample_seconds = max(float(sample_seconds), 0.001)
+
+    def _history_key(self, piped: bool) -> str:
+        """현재 코덱의 파일 기반 또는 파이프 모드 기록 키를 반환."""
+        return self.codec + self.PIPED_SUFFIX if piped else self.codec
+
+    def _predict_rates(self, preset: str, crf: int, piped: bool = None) -> Tuple[float, float]:
+        """
+        기록을 바탕으로 샘플 1초당 인코딩/분석 소요 시간을 예측 (실행 중 보정 배율 적용 전).
+
+        Args:
+            preset: 인코딩 프리셋
+            crf: 품질 값
+            piped: 파이프 모드 기록으로 예측할지 여부 (None이면 현재 실행의 모드)
+
+        Returns:
+            Tuple[float, float]: (인코딩 초/샘플초, 분석 초/샘플초). 파이프 모드 기록에서는 (전체 초/샘플초, 0)
+        """
+        lo, hi = self.quality_range
+        slope = APP_CONFIG['cost_default_quality_slope'] / max(hi - lo, 1) # 품질 값 1 단위당 인코딩 비용의 로그 변화량
+        piped = self.piped if piped is None else piped
+        codec_history = self.history.get(self._history_key(piped), {})
+        if piped and not codec_history: # 파이프 모드 기록이 아직 없으면 파일 기반 기록(인코딩과 분석의 합)을 상한으로 사용
+            codec_history = self.history.get(self.codec, {})
+
+        # 분석 시간은 인코딩 설정과 거의 무관하므로 코덱의 전체 기록 평균을 사용
+        analysis_rates = [v[1] for entries in codec_history.values() for v in entries.values()]
+        analysis_rate = sum(analysis_rates) / len(analysis_rates) if analysis_rates else 1.0
+
+        preset_history = codec_history.get(preset, {})
+        if preset_history:
+            # 같은 프리셋의 가장 가까운 CRF 기록을 품질 값 차이만큼 보정
+            nearest = min(preset_history, key=lambda k: abs(int(k) - crf))
+            return preset_history[nearest][0] * math.exp(slope * (int(nearest) - crf)), analysis_rate
+
+        # 기록이 없는 프리셋: 프리셋 순서에 따라 비용이 일정 배수씩 늘어난다고 가정
+        index = self.presets.index(preset) if preset in self.presets else 0
+        encode_rate = APP_CONFIG['cost_default_preset_growth'] ** index * math.exp(slope * (hi - crf) - APP_CONFIG['cost_default_quality_slope'] / 2)
+        # 기록이 있는 다른 프리셋이 있으면 순서상 가장 가까운 프리셋의 수준에 맞춤
+        recorded = [p for p, entries in codec_history.items() if p in self.presets and entries]
+        if recorded:
+            other = min(recorded, key=lambda p: abs(self.presets.index(p) - index))
+            entries = codec_history[other]
+            nearest = min(entries, key=lambda k: abs(int(k) - crf))
+            other_rate = entries[nearest][0] * math.exp(slope * (int(nearest) - crf))
+            encode_rate = other_rate * APP_CONFIG['cost_default_preset_growth'] ** (index - self.presets.index(other))
+        return encode_rate, analysis_rate
+
+    def predict(self, preset: str, crf: int, sample_seconds: float = 0.0, analysis_scale: float = 1.0) -> float:
+        """
+        현재 실행에서 (프리셋, CRF) 작업 하나의 예상 소요 시간(초)을 반환.
+
+        Args:
+            preset: 인코딩 프리셋
+            crf: 품질 값
+            sample_seconds: 예측할 샘플 길이 (0이면 현재 실행의 샘플 길이)
+            analysis_scale: 분석 시간에 곱할 배율 (VMAF 프레임 간격을 늘려 분석 비용을 줄이는 경우)
+
+        Returns:
+            float: 예상 소요 시간 (초)
+        """
+        with self.lock:
+            encode_rate, analysis_rate = self._predict_rates(preset, crf)
+            scale = math.exp(self.log_scale_sum / self.log_scale_count) if self.log_scale_count else 1.0
+            return (encode_rate + analysis_rate * analysis_scale) * (sample_seconds or self.sample_seconds) * scale
+
+    def observe(self, result: Dict[str, Any]):
+        """
+        완료된 작업의 측정 시간으로 실행 중 보정 배율과 소요 시간 기록을 갱신.
+
+        Args:
+            result: 'encode_seconds'와 'analysis_seconds'를 포함한 작업 결과 딕셔너리 ('piped'가 True이면 두 시간의 합만 의미가 있음)
+        """
+        with self.lock:
+            if not self.codec or result.get("status") != "success" or "encode_seconds" not in result or result.get("cached"):
+                return
+            preset, crf = result["preset"], int(result["crf"])
+            piped = bool(result.get("piped"))
+            encode_rate = result["encode_seconds"] / self.sample_seconds
+            analysis_rate = result["analysis_seconds"] / self.sample_seconds
+            if piped: # 인코딩과 분석이 동시에 실행되었으므로 나누지 않고 전체 시간 하나로 기록
+                encode_rate, analysis_rate = encode_rate + analysis_rate, 0.0
+            predicted = sum(self._predict_rates(preset, crf, piped))
+            if predicted > 0 and encode_rate + analysis_rate > 0:
+                self.log_scale_sum += math.log((encode_rate + analysis_rate) / predicted)
+                self.log_scale_count += 1
+
+            entries = self.history.setdefault(self._history_key(piped), {}).setdefault(preset, {})
+            previous = entries.get(str(crf))
+            if previous:
+                alpha = APP_CONFIG['cost_history_smoothing']
+                encode_rate = previous[0] + alpha * (encode_rate - previous[0])
+                analysis_rate = previous[1] + alpha * (analysis_rate - previous[1])
+            entries[str(crf)] = [encode_rate, analysis_rate]
+            self.dirty = True
+
+    def save(self):
+        """변경된 소요 시간 기록을 JSON 파일에 원자적으로 저장."""
+        with self.lock:
+            if not self.dirty:
+                return
+            part_path = self.history_path + ".part"
+            try:
+                with open(part_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.history, f)
+                os.replace(part_path, self.history_path)
+                self.dirty = False
+            except OSError as e:
+                logging.warning(f"Could not save task cost history {self.history_path}: {e}")
+
+
+def plan_time_budget(cost_model: TaskCostModel, presets: List[str], quality_range: Tuple[int, int], sample_seconds: float,
+                     parallel_jobs: int, budget_seconds: float) -> Dict[str, Any]:
+    """
+    Range Test 실행이 시간 예산 안에 끝나도록 CRF 격자 밀도, 샘플 길이, VMAF 분석 정밀도를 선택.
+
+    보정 인코딩으로 현재 원본과 시스템에 맞춰진 비용 모델로 각 (프리셋, CRF) 작업의 소요 시간을 예측하고,
+    전체 작업을 병렬 작업 수로 나눈 시간(가장 오래 걸리는 작업 하나보다는 짧을 수 없음)을 예상 실행 시간으로 사용함.
+    모든 CRF, 전체 샘플, 모든 프레임 분석에서 시작하여 예상 시간이 예산을 넘는 동안 CRF 간격, 샘플 길이(절반씩),
+    VMAF 프레임 간격을 번갈아 한 단계씩 낮추므로, 한 가지 설정만 극단적으로 낮아지지 않음.
+    모든 설정을 최저로 낮춰도 예산을 넘으면 가장 낮은 설정을 'fits'가 False인 계획으로 반환함.
+
+    Args:
+        cost_model: 보정된 작업 비용 모델
+        presets: 테스트할 프리셋 목록
+        quality_range: 테스트할 (시작, 끝) 품질 값 (끝 값 포함)
+        sample_seconds: 추출된 샘플의 길이 (초)
+        parallel_jobs: 동시에 실행할 작업 수
+        budget_seconds: 남은 시간 예산 (초)
+
+    Returns:
+        Dict[str, Any]: 'crf_step', 'crf_values', 'sample_seconds', 'vmaf_subsample', 'tasks', 'predicted_seconds', 'fits'를 담은 계획
+    """
+    cs, ce = quality_range
+    steps = sorted({max(1, int(s)) for s in APP_CONFIG['time_budget_crf_steps']} | {1})
+    subsamples = sorted({max(1, int(s)) for s in APP_CONFIG['time_budget_vmaf_subsamples']} | {1})
+    lengths = [sample_seconds] # 절반씩 줄인 샘플 길이 후보 (최소 길이까지)
+    while lengths[-1] / 2 >= APP_CONFIG['time_budget_min_sample_seconds']:
+        lengths.append(lengths[-1] / 2)
+    vmaf_share = min(max(APP_CONFIG['time_budget_vmaf_share'], 0.0), 1.0)
+    jobs = max(1, parallel_jobs)
+
+    def evaluate(step_index: int, length_index: int, subsample_index: int) -> Dict[str, Any]:
+        step, length, subsample = steps[step_index], lengths[length_index], subsamples[subsample_index]
+        crf_values = list(range(cs, ce + 1, step))
+        if crf_values[-1] != ce: # 품질 범위의 양 끝은 항상 포함
+            crf_values.append(ce)
+        analysis_scale = (1 - vmaf_share) + vmaf_share / subsample
+        costs = [cost_model.predict(p, c, sample_seconds=length, analysis_scale=analysis_scale) for p in presets for c in crf_values]
+        predicted = max(sum(costs) / jobs, max(costs)) if costs else 0.0
+        return {
+            'crf_step': step, 'crf_values': crf_values, 'sample_seconds': length, 'vmaf_subsample': subsample,
+            'tasks': len(costs), 'predicted_seconds': predicted, 'fits': predicted <= budget_seconds
+        }
+
+    levels = [0, 0, 0] # (CRF 간격, 샘플 길이, 프레임 간격) 후보의 현재 위치
+    limits = [len(steps) - 1, len(lengths) - 1, len(subsamples) - 1]
+    plan = evaluate(*levels)
+    knob = 0
+    while not plan['fits'] and levels != limits:
+        if levels[knob] < limits[knob]: # 더 낮출 수 있는 설정만 한 단계 낮춤
+            levels[knob] += 1
+            plan = evaluate(*levels)
+        knob = (knob + 1) % len(levels)
+    return plan
+
+
+# 결과 캐시 키 계산에 사용하는 값의 프로세스별 메모 (파일 경로, 크기, 수정 시각 -> 지문)
+_file_fingerprint_memo: Dict[Tuple[str, int, int], str] = {}
+
+def _memoized_file_fingerprint(path: str, compute) -> str:
+    """
+    파일의 지문을 경로, 크기, 수정 시각별로 한 번만 계산하여 반환.
+
+    Args:
+        path: 지문을 계산할 파일 경로
+        compute: 파일 경로를 받아 지문 문자열을 반환하는 함수
+
+    Returns:
+        str: 파일 지문 (파일이 없거나 계산에 실패하면 빈 문자열)
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return ""
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if memo_key not in _file_fingerprint_memo:
+        _file_fingerprint_memo[memo_key] = compute(path)
+    return _file_fingerprint_memo[memo_key]
+
+def fingerprint_sample(ffmpeg_path: str, sample_path: str) -> str:
+    """
+    추출된 샘플 영상의 내용 지문을 계산.
+
+    같은 원본 구간을 다시 추출해도 Matroska 먹서가 매번 임의의 세그먼트 UID를 기록하므로 파일 자체의 해시는 달라짐.
+    대신 스트림 복사로 모든 패킷의 데이터만 해시하여(hash 먹서) 컨테이너와 무관한 지문을 만들며, 디코딩하지 않으므로 빠름.
+
+    Args:
+        ffmpeg_path: ffmpeg 실행 파일 경로
+        sample_path: 샘플 영상 경로
+
+    Returns:
+        str: 'SHA256=...' 형식의 지문 (실패하면 빈 문자열이며, 이 경우 결과 캐시를 사용하지 않음)
+    """
+    def compute(path: str) -> str:
+        cmd = [ffmpeg_path, "-v", "error", "-i", path, "-map", "0", "-c", "copy", "-f", "hash", "-hash", "sha256", "-"]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='ignore',
+                                    check=True, startupinfo=_get_subprocess_startupinfo())
+        except (OSError, subprocess.CalledProcessError) as e:
+            logging.warning(f"Could not fingerprint sample {path}: {e}")
+            return ""
+        return result.stdout.strip()
+    return _memoized_file_fingerprint(sample_path, compute)
+
+def _ffmpeg_build_id(ffmpeg_path: str) -> str:
+    """ffmpeg 빌드를 구분하는 문자열('ffmpeg -version'의 버전과 구성 줄)을 반환."""
+    def compute(path: str) -> str:
+        try:
+            result = subprocess.run([path, "-hide_banner", "-version"], capture_output=True, text=True, encoding='utf-8',
+                                    errors='ignore', startupinfo=_get_subprocess_startupinfo())
+        except OSError:
+            return ""
+        return "\n".join(line for line in result.stdout.splitlines() if line.startswith(("ffmpeg version", "configuration:", "libavcodec")))
+    return _memoized_file_fingerprint(ffmpeg_path, compute)
+
+def result_cache_key(task: EncodingTask) -> str:
+    """
+    작업 결과를 결정하는 모든 입력으로 결과 캐시 키를 계산.
+
+    샘플 내용 지문, 코덱, 프리셋, 품질 값, 정규화한 고급 옵션, 실제로 적용되는 인코더 스레드 수, 오디오 처리 방식,
+    색상 정보, ffmpeg 빌드, VMAF 모델 파일 내용, 계산할 메트릭과 VMAF 프레임 간격을 포함하므로,
+    이 중 하나라도 다르면 다른 키가 됨. (x264 등은 스레드 수에 따라 출력이 달라지므로 키에 포함해야 함)
+
+    Args:
+        task: 키를 계산할 작업
+
+    Returns:
+        str: SHA-256 키 (샘플 지문이 없으면 빈 문자열이며, 이 경우 캐시를 사용하지 않음)
+    """
+    if not task.sample_fingerprint:
+        return ""
+    def file_digest(path: str) -> str:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    model_digest = _memoized_file_fingerprint(task.vmaf_model_path, file_digest) if task.vmaf_model_path else "" # 내장 모델이면 빈 문자열
+    material = {
+        "version": ResultCache.SCHEMA_VERSION,
+        "sample": task.sample_fingerprint, "codec": task.codec, "preset": task.preset, "crf": int(task.crf),
+        "adv_opts": task.adv_opts, "encoder_threads": FFmpegCommandBuilder(task)._get_scheduled_encoder_threads(), # 사용자 지정 값이면 0 (adv_opts에 포함됨)
+        "audio": task.audio_option, "color": task.color_info,
+        "ffmpeg": _ffmpeg_build_id(task.ffmpeg_path), "vmaf_model": model_digest,
+        "metrics": sorted(k for k, v in task.metrics.items() if v), "vmaf_subsample": task.vmaf_subsample,
+    }
+    return hashlib.sha256(json.dumps(material, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    성공한 작업 결과를 실행과 세션 간에 재사용하기 위한 SQLite 기반 캐시 클래스.
+
+    키는 result_cache_key로 계산한 작업 입력의 해시이며, 값은 작업 로그를 제외한 결과 딕셔너리를 직렬화한 것임.
+    WAL 저널 모드와 잠금 대기 시간을 사용하여 여러 워커 프로세스와 여러 앱 인스턴스가 동시에 읽고 쓸 수 있도록 하고,
+    결과를 추가할 때 전체 크기가 설정된 한도를 넘으면 가장 오래 사용하지 않은 결과부터 삭제함(LRU).
+    캐시 오류는 작업 실패로 이어지지 않도록 경고만 기록하고 캐시가 없는 것처럼 동작함.
+    """
+
+    SCHEMA_VERSION = 1 # 결과 딕셔너리 형식이 바뀌면 올려서 이전 항목을 무효화
+
+    _connections: Dict[Tuple[int, str], sqlite3.Connection] = {} # 프로세스별로 재사용하는 연결 ((PID, 경로) -> 연결)
+
+    def __init__(self, path: str):
+        """
+        ResultCache 객체를 초기화.
+
+        Args:
+            path: SQLite 데이터베이스 파일 경로
+        """
+        self.path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 프로세스의 데이터베이스 연결을 반환 (처음 사용할 때 테이블을 생성)."""
+        connection_key = (os.getpid(), self.path)
+        connection = self._connections.get(connection_key)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=APP_CONFIG['result_cache_timeout'], isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL") # 쓰는 동안에도 다른 프로세스가 읽을 수 있도록 함
+            connection.execute("PRAGMA synchronous=NORMAL") # WAL 모드에서는 커밋마다 디스크 동기화할 필요가 없음
+            connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, payload BLOB NOT NULL, "
+                               "size INTEGER NOT NULL, last_used REAL NOT NULL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+            self._connections[connection_key] = connection
+        return connection
+
+    def get(self, key: str) -> Dict[str, Any]:
+        """
+        키에 해당하는 결과를 반환하고 마지막 사용 시각을 갱신.
+
+        Args:
+            key: result_cache_key로 계산한 키
+
+        Returns:
+            Dict[str, Any]: 저장된 결과 딕셔너리 (없거나 읽을 수 없으면 None)
+        """
+        try:
+            connection = self._connect()
+            row = connection.execute("SELECT payload FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+            return pickle.loads(row[0])
+        except Exception as e: # 손상되었거나 다른 버전의 코드로 저장된 항목은 캐시 미스로 처리
+            logging.warning(f"Result cache lookup failed ({self.path}): {e}")
+            return None
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """
+        결과를 저장하고, 캐시 크기가 한도를 넘으면 오래 사용하지 않은 결과를 삭제.
+
+        Args:
+            key: result_cache_key로 계산한 키
+            result: 저장할 성공 결과 (작업 로그 항목은 저장하지 않음)
+        """
+        payload = pickle.dumps({k: v for k, v in result.items() if k not in ("log", "log_path", "cached")}, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            connection = self._connect()
+            connection.execute("INSERT OR REPLACE INTO results (key, payload, size, last_used) VALUES (?, ?, ?, ?)",
+                               (key, payload, len(payload), time.time()))
+            self._evict(connection, APP_CONFIG['result_cache_max_mb'] * 1024 * 1024)
+        except sqlite3.Error as e:
+            logging.warning(f"Could not store result in cache ({self.path}): {e}")
+
+    @staticmethod
+    def _evict(connection: sqlite3.Connection, max_bytes: int):
+        """전체 결과 크기가 max_bytes 이하가 될 때까지 마지막 사용 시각이 가장 오래된 결과부터 삭제."""
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= max_bytes:
+            return
+        excess = total - max_bytes
+        stale = []
+        for key, size in connection.execute("SELECT key, size FROM results ORDER BY last_used"):
+            stale.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany("DELETE FROM results WHERE key = ?", stale)
+        logging.info(f"Result cache: evicted {len(stale)} least recently used results")
+
+
+def fingerprint_source(path: str) -> str:
+    """
+    원본 영상 파일의 빠른 지문을 계산.
+
+    전체 파일을 읽지 않고 크기, 수정 시각과 파일의 처음, 가운데, 끝 일부 구간의 해시만으로 지문을 만들므로,
+    수십 GB의 원본에서도 즉시 계산됨. 파일이 교체되거나 수정되면 크기나 수정 시각, 구간 내용 중 하나는 달라짐.
+
+    Args:
+        path: 원본 영상 파일 경로
+
+    Returns:
+        str: SHA-256 지문 (파일을 읽을 수 없으면 빈 문자열)
+    """
+    chunk = APP_CONFIG['source_fingerprint_chunk_kb'] * 1024
+    try:
+        stat = os.stat(path)
+        digest = hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8'))
+        with open(path, 'rb') as f:
+            for offset in sorted({0, max(0, stat.st_size // 2 - chunk // 2), max(0, stat.st_size - chunk)}):
+                f.seek(offset)
+                digest.update(f.read(chunk))
+    except OSError as e:
+        logging.warning(f"Could not fingerprint source {path}: {e}")
+        return ""
+    return digest.hexdigest()
+
+
+class SampleStore:
+    """
+    추출한 무손실 샘플 영상을 실행 간에 재사용하기 위한 디스크 저장소 클래스.
+
+    원본 지문(fingerprint_source), 샘플 구간(시작, 길이), 추출 방식(디인터레이스 정책과 인코딩 설정)으로 키를 만들고,
+    키별로 샘플 파일 하나를 보관함. 저장소의 샘플은 작업 디렉토리에 하드 링크(불가능하면 복사)로 제공하므로
+    작업 디렉토리를 삭제해도 저장소의 샘플은 남음. 사용할 때마다 수정 시각을 갱신하여, 전체 크기가 한도를 넘으면
+    가장 오래 사용하지 않은 샘플부터 삭제함(LRU). 파일은 임시 이름으로 만든 뒤 원자적으로 교체하므로 여러 인스턴스가 동시에 사용해도 안전함.
+    """
+
+    def __init__(self, root_dir: str):
+        """
+        SampleStore 객체를 초기화하고 저장소 디렉토리를 생성.
+
+        Args:
+            root_dir: 샘플을 보관할 디렉토리 경로
+        """
+        self.root_dir = root_dir
+        os.makedirs(root_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(source_path: str, ss: float, sd: float, recipe: str) -> str:
+        """
+        원본과 샘플 구간, 추출 방식으로 저장소 키를 계산.
+
+        Args:
+            source_path: 원본 영상 파일 경로
+            ss: 샘플 시작 시간 (초)
+            sd: 샘플 길이 (초)
+            recipe: 추출 결과를 결정하는 설정 문자열 (디인터레이스 정책, 인코딩 옵션 등)
+
+        Returns:
+            str: 저장소 키 (원본 지문을 계산할 수 없으면 빈 문자열이며, 이 경우 저장소를 사용하지 않음)
+        """
+        source = fingerprint_source(source_path)
+        if not source:
+            return ""
+        material = f"{source}|{float(ss):.3f}|{float(sd):.3f}|{recipe}"
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """키에 해당하는 저장소 내 샘플 파일 경로를 반환."""
+        return os.path.join(self.root_dir, f"{key}.mkv")
+
+    @staticmethod
+    def _link_or_copy(src: str, dst: str):
+        """src를 dst에 하드 링크로 연결하고, 다른 드라이브이거나 지원하지 않으면 복사 (dst는 원자적으로 교체)."""
+        part_path = f"{dst}.{os.getpid()}.part"
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        try:
+            os.link(src, part_path)
+        except OSError:
+            shutil.copyfile(src, part_path)
+        os.replace(part_path, dst)
+
+    def fetch(self, key: str, dest_path: str) -> bool:
+        """
+        저장된 샘플을 dest_path에 제공하고 마지막 사용 시각을 갱신.
+
+        Args:
+            key: make_key로 계산한 키
+            dest_path: 샘플을 둘 작업 디렉토리 내 경로
+
+        Returns:
+            bool: 저장된 샘플이 있어 제공했으면 True
+        """
+        stored = self._path(key)
+        try:
+            os.utime(stored) # LRU 순서를 위해 사용 시각 갱신 (없으면 OSError)
+            self._link_or_copy(stored, dest_path)
+            return True
+        except OSError:
+            return False
+
+    def add(self, key: str, sample_path: str):
+        """
+        새로 추출한 샘플을 저장하고, 저장소 크기가 한도를 넘으면 오래 사용하지 않은 샘플을 삭제.
+
+        Args:
+            key: make_key로 계산한 키
+            sample_path: 추출된 샘플 파일 경로
+        """
+        try:
+            self._link_or_copy(sample_path, self._path(key))
+        except OSError as e:
+            logging.warning(f"Could not add sample to store {self.root_dir}: {e}")
+            return
+        self._evict(int(APP_CONFIG['sample_store_max_gb'] * 1024 ** 3), keep=self._path(key))
+
+    def _evict(self, max_bytes: int, keep: str = ""):
+        """전체 크기가 max_bytes 이하가 될 때까지 수정 시각이 가장 오래된 샘플부터 삭제 (keep은 제외)."""
+        entries = []
+        for name in os.listdir(self.root_dir):
+            if not name.endswith(".mkv"):
+                continue
+            path = os.path.join(self.root_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError: # 다른 인스턴스가 그 사이 삭제한 경우
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path) # 작업 디렉토리에 연결된 하드 링크는 그대로 남음
+                total -= size
+                logging.info(f"Sample store: evicted {os.path.basename(path)} ({size / (1024 * 1024):.1f} MB)")
+            except OSError as e:
+                logging.warning(f"Could not evict stored sample {path}: {e}")
+
+
+class SceneIndexCache:
+    """
+    원본 영상별 장면 분석 인덱스(초당 프레임 크기 지도, 키프레임 목록)를 저장하는 캐시 클래스.
+
+    자동 샘플 구간 선택은 원본 전체를 ffprobe로 다시 읽어야 하므로 큰 원본이나 네트워크 저장소에서는 수 분이 걸림.
+    원본 지문(fingerprint_source)을 파일명으로 한 JSON 파일에 분석 결과를 저장하여, 같은 원본의 다음 분석
+    ('Complex Scene'/'Simple Scene' 전환, 미리보기, A/B 비교 포함)은 다시 읽지 않고 바로 사용함.
+    원본이 바뀌면 지문이 달라지므로 이전 인덱스는 자동으로 무효가 되며, 오래 사용하지 않은 인덱스부터 삭제됨.
+    """
+
+    VERSION = 2 # 인덱스 형식이나 초당 크기 계산 방식이 바뀌면 올려서 이전 인덱스를 무효화
+
+    def __init__(self, root_dir: str):
+        """
+        SceneIndexCache 객체를 초기화하고 저장 디렉토리를 생성.
+
+        Args:
+            root_dir: 인덱스 파일을 저장할 디렉토리 경로
+        """
+        self.root_dir = root_dir
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _path(self, source_path: str) -> str:
+        """원본의 인덱스 파일 경로를 반환 (원본 지문을 계산할 수 없으면 빈 문자열)."""
+        fingerprint = _memoized_file_fingerprint(source_path, fingerprint_source)
+        return os.path.join(self.root_dir, f"{fingerprint}.json") if fingerprint else ""
+
+    def load(self, source_path: str) -> Dict[str, Any]:
+        """
+        원본의 저장된 인덱스를 불러옴.
+
+        Args:
+            source_path: 원본 영상 파일 경로
+
+        Returns:
+            Dict[str, Any]: 'seconds_map'({초: 바이트 수})과 'keyframes'(초 목록) 중 저장된 항목 (없으면 빈 딕셔너리)
+        """
+        path = self._path(source_path)
+        if not path:
+            return {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            os.utime(path) # LRU 순서를 위해 사용 시각 갱신
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not load scene index {path}: {e}")
+            return {}
+        if stored.get("version") != self.VERSION:
+            return {}
+        index = {}
+        if "seconds_map" in stored: # JSON 객체의 키는 문자열이므로 정수 초로 되돌림
+            index["seconds_map"] = {int(sec): int(size) for sec, size in stored["seconds_map"].items()}
+        if "keyframes" in stored:
+            index["keyframes"] = [float(t) for t in stored["keyframes"]]
+        return index
+
+    def update(self, source_path: str, **fields):
+        """
+        원본의 인덱스에 항목('seconds_map', 'keyframes')을 추가하거나 갱신하여 원자적으로 저장.
+
+        Args:
+            source_path: 원본 영상 파일 경로
+            **fields: 저장할 인덱스 항목
+        """
+        path = self._path(source_path)
+        if not path:
+            return
+        index = self.load(source_path)
+        index.update(fields)
+        index.update(version=self.VERSION, source=os.path.basename(source_path))
+        part_path = f"{path}.{os.getpid()}.part"
+        try:
+            with open(part_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+            os.replace(part_path, path)
+        except OSError as e:
+            logging.warning(f"Could not save scene index {path}: {e}")
+            return
+        self._prune(APP_CONFIG['scene_index_max_entries'])
+
+    def _prune(self, max_entries: int):
+        """인덱스 파일 수가 max_entries를 넘으면 수정 시각이 가장 오래된 것부터 삭제."""
+        entries = []
+        for name in os.listdir(self.root_dir):
+            if name.endswith(".json"):
+                path = os.path.join(self.root_dir, name)
+                try:
+                    entries.append((os.path.getmtime(path), path))
+                except OSError:
+                    continue
+        for _, path in sorted(entries)[:max(0, len(entries) - max_entries)]:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logging.warning(f"Could not remove scene index {path}: {e}")
+
+
+
+# ==============================================================================
+# 3. 코덱 설정 스키마
+# ==============================================================================
+# 코덱별 설정을 정의하는 중앙 저장소.
+# 이 딕셔너리를 통해 각 코덱의 동작 방식(품질 제어 파라미터, 프리셋, 고급 옵션 등)을 제어.
+# 각 코덱은 다음과 같은 구조를 가짐:
+# - group: 코덱 그룹 (Software, NVIDIA NVENC, Intel QSV, AMD AMF 등)
+# - rate_control: 품질 제어 파라미터 (-crf, -cq, -global_quality 등)
+# - quality_range: 품질 값의 범위 (최소값, 최대값)
+# - param_bundle_key: 고급 옵션을 묶어서 전달할 파라미터 키 (-x264-params 등)
+# - thread_param: 코어 예산 스케줄러가 인코더 스레드 수를 지정할 파라미터 (소프트웨어 코덱만 해당)
+# - preset_param: 프리셋 설정 파라미터
+# - preset_values: 사용 가능한 프리셋 목록
+# - adv_options: 고급 설정 옵션들의 상세 정의
+CODEC_CONFIG = {  # 코덱별 설정 구성
+    # ==============================================================================
+    # H.264 / AVC Encoders
+    # ==============================================================================
+    "libx264": {  # x264 소프트웨어 인코더 설정
+        "group": "Software",
+        "rate_control": "-crf",
+        "quality_range": (0, 51),  # 소프트웨어 그룹, CRF 비트레이트 제어, 품질 범위
+        "param_bundle_key": "-x264-params",  # x264 파라미터 묶음 키
+        "thread_param": "threads",  # 인코더 스레드 수 파라미터 (-x264-params에 포함)
+        "preset_param": "-preset",  # 프리셋 파라미터
+        "preset_values": [
+            "ultrafast",
+            "superfast",
+            "veryfast",
+            "faster",
+            "fast",
+            "medium",
+            "slow",
+            "slower",
+            "veryslow",
+            "placebo",
+        ],  # 사용 가능한 프리셋 목록
+        "adv_options": {
+            "vbv_maxrate": {
+                "label": "Max Rate (kb/s):",
+                "ffmpeg_param": "vbv-maxrate",
+                "widget": "entry",
+                "default": "0",
+                "tooltip": "VBV Max Bitrate in kb/s. 0=unlimited.",
+                "category": "Rate Control",
+            },
+            "vbv_bufsize": {
+                "label": "Buffer Size (kb):",
+                "ffmpeg_param": "vbv-bufsize",
+                "widget": "entry",
+                "default": "0",
+                "tooltip": "VBV Buffer Size in kb/s. Use with Max Rate.",
+                "category": "Rate Control",
+            },
+            "crf_max": {
+                "label": "CRF Max:",
+                "ffmpeg_param": "crf-max",
+                "widget": "spinbox_int",
+                "range": (0, 51),
+                "default": "0",
+                "tooltip": "With VBV, sets a quality floor. 0=unlimited.",
+                "category": "Rate Control",
+            },
+            "qcomp": {
+                "label": "QComp:",
+                "ffmpeg_param": "qcomp",
+                "widget": "spinbox_float",
+                "range": (0.0, 1.0),
+                "default": "0.6",
+                "tooltip": "Quantizer Compression (0=CBR, 1=CQP).",
+                "category": "Rate Control",
+            },
+            "aq_mode": {
+                "label": "AQ Mode:",
+                "ffmpeg_param": "aq-mode",
+                "widget": "combobox",
+                "values": ["0", "1", "2", "3"],
+                "default": "1",
+                "tooltip": "Adaptive Quantization mode. 1: Variance, 2: Auto-variance, 3: Complexity.",
+                "category": "Rate Control",
+            },
+            "aq_strength": {
+                "label": "AQ Strength:",
+                "ffmpeg_param": "aq-strength",
+                "widget": "spinbox_float",
+                "range": (0.0, 3.0),
+                "default": "1.0",
+                "tooltip": "Strength of AQ. Reduces blocking in flat areas.",
+                "category": "Rate Control",
+            },
+            "psy_rd_strength": {
+                "label": "Psy-RD Strength:",
+                "ffmpeg_param": "psy-rd",
+                "widget": "spinbox_float",
+                "range": (0.0, 10.0),
+                "default": "1.0",
+                "tooltip": "Strength of psychovisual rate-distortion. Preserves detail/grain.",
+                "category": "Psychovisual",
+            },
+            "psy_rd_trellis": {
+                "label": "Psy-RD Trellis:",
+                "ffmpeg_param": "trellis",
+                "widget": "spinbox_float",
+                "range": (0.0, 10.0),
+                "default": "0.0",
+                "tooltip": "Strength of psychovisual trellis quantization.",
+                "category": "Psychovisual",
+            },
+            "g": {
+                "label": "Keyframe Interval:",
+                "ffmpeg_param": "keyint",
+                "widget": "spinbox_int",
+                "range": (0, 1000),
+                "default": "250",
+                "tooltip": "Max frames between keyframes (GOP size).",
+                "category": "Frame & GOP",
+            },
+            "min_keyint": {
+                "label": "Min Keyframe Interval:",
+                "ffmpeg_param": "min-keyint",
+                "widget": "spinbox_int",
+                "range": (0, 250),
+                "default": "25",
+                "tooltip": "Minimum interval between keyframes.",
+                "category": "Frame & GOP",
+            },
+            "scenecut": {
+                "label": "Scenecut:",
+                "ffmpeg_param": "scenecut",
+                "widget": "spinbox_int",
+                "range": (0, 100),
+                "default": "40",
+                "tooltip": "Scene change detection sensitivity.",
+                "category": "Frame & GOP",
+            },
+            "bframes": {
+                "label": "B-Frames:",
+                "ffmpeg_param": "bframes",
+                "widget": "spinbox_int",
+                "range": (0, 16),
+                "default": "3",
+                "tooltip": "Max consecutive B-frames.",
+                "category": "Frame & GOP",
+            },
+            "b_adapt": {
+                "label": "B-Frame Adaptive:",
+                "ffmpeg_param": "b-adapt",
+                "widget": "combobox",
+                "values": ["0", "1", "2"],
+                "default": "1",
+                "tooltip": "B-frame decision algorithm. 0: Off, 1: Fast, 2: Optimal.",
+                "category": "Frame & GOP",
+            },
+            "b_pyramid": {
+                "label": "B-Frame Pyramid:",
+                "ffmpeg_param": "b-pyramid",
+                "widget": "combobox",
+                "values": ["none", "strict", "normal"],
+                "default": "normal",
+                "tooltip": "Allows B-frames to be used as references.",
+                "category": "Frame & GOP",
+            },
+            "ref": {
+                "label": "Reference Frames:",
+                "ffmpeg_param": "ref",
+                "widget": "spinbox_int",
+                "range": (1, 16),
+                "default": "3",
+                "tooltip": "Number of reference frames. Higher improves compression at the cost of speed.",
+                "category": "Analysis & ME",
+            },
+            "rc_lookahead": {
+                "label": "Lookahead:",
+                "ffmpeg_param": "rc-lookahead",
+                "widget": "spinbox_int",
+                "range": (0, 250),
+                "default": "40",
+                "tooltip": "Number of frames for rate control lookahead.",
+                "category": "Analysis & ME",
+            },
+            "subme": {
+                "label": "Subpixel ME:",
+                "ffmpeg_param": "subme",
+                "widget": "combobox",
+                "values": [str(i) for i in range(12)],
+                "default": "7",
+                "tooltip": "Subpixel motion estimation complexity.",
+                "category": "Analysis & ME",
+            },
+            "me_method": {
+                "label": "ME Method:",
+                "ffmpeg_param": "me",
+                "widget": "combobox",
+                "values": ["dia", "hex", "umh", "esa", "tesa"],
+                "default": "hex",
+                "tooltip": "Motion estimation algorithm.",
+                "category": "Analysis & ME",
+            },
+            "tune": {
+                "label": "Tune:",
+                "ffmpeg_param": "tune",
+                "widget": "combobox",
+                "values": [
+                    "film",
+                    "animation",
+                    "grain",
+                    "stillimage",
+                    "fastdecode",
+                    "zerolatency",
+                ],
+                "default": "",
+                "tooltip": "Tune settings for a specific type of source material.",
+                "category": "Miscellaneous",
+            },
+            "profile": {
+                "label": "Profile:",
+                "ffmpeg_param": "profile:v",
+                "widget": "combobox",
+                "values": [
+                    "baseline",
+                    "main",
+                    "high",
+                    "high10",
+                    "high422",
+                    "high444",
+                ],
+                "default": "",
+                "tooltip": "Output stream profile constraints. Empty=auto.",
+                "category": "Miscellaneous",
+            },
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": [
+                    "yuv420p",
+                    "yuvj420p",
+                    "yuv422p",
+                    "yuv444p",
+                    "yuv420p10le",
+                ],
+                "default": "",
+                "tooltip": "Pixel format and bit depth. Empty=auto.",
+                "category": "Miscellaneous",
+            },
+        },
+    },
+    "libx264rgb": {  # x264 RGB 소프트웨어 인코더 설정
+        "group": "Software",
+        "rate_control": "-crf",
+        "quality_range": (0, 51),  # 소프트웨어 그룹, CRF 비트레이트 제어, 품질 범위
+        "thread_param": "threads",  # 인코더 스레드 수 파라미터 (-threads)
+        "preset_param": "-preset",  # 프리셋 파라미터
+        "preset_values": [
+            "ultrafast",
+            "superfast",
+            "veryfast",
+            "faster",
+            "fast",
+            "medium",
+            "slow",
+            "slower",
+            "veryslow",
+            "placebo",
+        ],  # 사용 가능한 프리셋 목록
+        "adv_options": {
+            "g": {
+                "label": "GOP Size:",
+                "ffmpeg_param": "g",
+                "widget": "spinbox_int",
+                "range": (0, 1000),
+                "default": "250",
+                "tooltip": "Keyframe interval. Use 1 for lossless single frames.",
+                "category": "Frame & GOP",
+            },
+            "tune": {
+                "label": "Tune:",
+                "ffmpeg_param": "tune",
+                "widget": "combobox",
+                "values": ["zerolatency", "fastdecode", "stillimage"],
+                "default": "",
+                "tooltip": "Tune settings for a specific type of source material.",
+                "category": "Miscellaneous",
+            },
+            "profile": {
+                "label": "Profile:",
+                "ffmpeg_param": "profile:v",
+                "widget": "combobox",
+                "values": ["high444"],
+                "default": "high444",
+                "tooltip": "RGB encoding requires a 4:4:4 profile.",
+                "category": "Miscellaneous",
+            },
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": ["rgb24", "bgr24", "rgba"],
+                "default": "rgb24",
+                "tooltip": "Pixel format for lossless RGB encoding.",
+                "category": "Miscellaneous",
+            },
+        },
+    },
+    "h264_nvenc": {  # NVIDIA H.264 하드웨어 인코더 설정
+        "group": "NVIDIA NVENC",
+        "rate_control": "-cq",
+        "quality_range": (
+            0,
+            51,
+        ),  # NVIDIA NVENC 그룹, CQ 비트레이트 제어, 품질 범위
+        "preset_param": "-preset",  # 프리셋 파라미터
+        "preset_values": [
+            "slow",
+            "medium",
+            "fast",
+            "hp",
+            "hq",
+            "bd",
+            "ll",
+            "llhq",
+            "llhp",
+            "lossless",
+            "losslesshp",
+            "p1",
+            "p2",
+            "p3",
+            "p4",
+            "p5",
+            "p6",
+            "p7",
+        ],  # 사용 가능한 프리셋 목록
+        "adv_options": {
+            "spatial_aq": {
+                "label": "Spatial AQ",
+                "ffmpeg_param": "spatial-aq",
+                "widget": "checkbutton",
+                "default": False,
+                "tooltip": "Enable spatial adaptive quantization.",
+                "category": "Rate Control",
+            },
+            "temporal_aq": {
+                "label": "Temporal AQ",
+                "ffmpeg_param": "temporal-aq",
+                "widget": "checkbutton",
+                "default": False,
+                "tooltip": "Enable temporal adaptive quantization.",
+                "category": "Rate Control",
+            },
+            "rc_lookahead": {
+                "label": "Lookahead:",
+                "ffmpeg_param": "rc-lookahead",
+                "widget": "spinbox_int",
+                "range": (0, 250),
+                "default": "0",
+                "tooltip": "Number of frames for rate control lookahead.",
+                "category": "Rate Control",
+            },
+            "g": {
+                "label": "GOP Size:",
+                "ffmpeg_param": "g",
+                "widget": "spinbox_int",
+                "range": (0, 1000),
+                "default": "250",
+                "tooltip": "Keyframe interval.",
+                "category": "Frame & GOP",
+            },
+            "tune": {
+                "label": "Tune:",
+                "ffmpeg_param": "tune",
+                "widget": "combobox",
+                "values": ["hq", "ll", "ull", "lossless"],
+                "default": "hq",
+                "tooltip": "Tuning profile.",
+                "category": "Miscellaneous",
+            },
+            "profile": {
+                "label": "Profile:",
+                "ffmpeg_param": "profile:v",
+                "widget": "combobox",
+                "values": ["baseline", "main", "high", "high444p"],
+                "default": "",
+                "tooltip": "H.264 profile. Empty=auto.",
+                "category": "Miscellaneous",
+            },
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": ["yuv420p", "nv12", "yuv444p"],
+                "default": "yuv420p",
+                "tooltip": "Pixel format. 'nv12' is a native hardware format.",
+                "category": "Miscellaneous",
+            },
+        },
+    },
+    "h264_qsv": {  # Intel H.264 하드웨어 인코더 설정
+        "group": "Intel QSV",
+        "rate_control": "-global_quality",
+        "quality_range": (
+            1,
+            51,
+        ),  # Intel QSV 그룹, global_quality 비트레이트 제어, 품질 범위
+        "preset_param": "-preset",  # 프리셋 파라미터
+        "preset_values": [
+            "veryfast",
+            "faster",
+            "fast",
+            "medium",
+            "slow",
+            "slower",
+            "veryslow",
+        ],  # 사용 가능한 프리셋 목록
+        "adv_options": {
+            "look_ahead": {
+                "label": "Lookahead",
+                "ffmpeg_param": "look_ahead",
+                "widget": "checkbutton",
+                "default": False,
+                "tooltip": "Enable lookahead for better rate control decisions.",
+                "category": "Rate Control",
+            },
+            "look_ahead_depth": {
+                "label": "Lookahead Depth:",
+                "ffmpeg_param": "look_ahead_depth",
+                "widget": "spinbox_int",
+                "range": (0, 100),
+                "default": "0",
+                "tooltip": "Number of frames to look ahead. Default depends on driver.",
+                "category": "Rate Control",
+            },
+            "g": {
+                "label": "GOP Size:",
+                "ffmpeg_param": "g",
+                "widget": "spinbox_int",
+                "range": (0, 1000),
+                "default": "250",
+                "tooltip": "Keyframe interval.",
+                "category": "Frame & GOP",
+            },
+            "profile": {
+                "label": "Profile:",
+                "ffmpeg_param": "profile",
+                "widget": "combobox",
+                "values": ["baseline", "main", "high"],
+                "default": "",
+                "tooltip": "H.264 profile. Empty=auto.",
+                "category": "Miscellaneous",
+            },
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": ["nv12"],
+                "default": "nv12",
+                "tooltip": "Pixel format. 'nv12' is the primary native hardware format for H.264.",
+                "category": "Miscellaneous",
+            },
+        },
+    },
+    "h264_amf": {  # AMD H.264 하드웨어 인코더 설정
+        "group": "AMD AMF",
+        "rate_control": "-qp_p",
+        "quality_range": (0, 51),  # AMD AMF 그룹, qp_p 비트레이트 제어, 품질 범위
+        "adv_options": {
+            "qp_i": {
+                "label": "I-Frame QP:",
+                "ffmpeg_param": "qp_i",
+                "widget": "spinbox_int",
+                "range": (-1, 51),
+                "default": "-1",
+                "tooltip": "Constant Quantization Parameter for I-frames.",
+                "category": "Rate Control",
+            },
+            "qp_p": {
+                "label": "P-Frame QP:",
+                "ffmpeg_param": "qp_p",
+                "widget": "spinbox_int",
+                "range": (-1, 51),
+                "default": "-1",
+                "tooltip": "Constant Quantization Parameter for P-frames. Used as the main quality slider.",
+                "category": "Rate Control",
+            },
+            "qp_b": {
+                "label": "B-Frame QP:",
+                "ffmpeg_param": "qp_b",
+                "widget": "spinbox_int",
+                "range": (-1, 51),
+                "default": "-1",
+                "tooltip": "Constant Quantization Parameter for B-frames.",
+                "category": "Rate Control",
+            },
+            "vbaq": {
+                "label": "Enable VBAQ",
+                "ffmpeg_param": "vbaq",
+                "widget": "checkbutton",
+                "default": False,
+                "tooltip": "Enable Variance Based Adaptive Quantization.",
+                "category": "Rate Control",
+            },
+            "g": {
+                "label": "GOP Size:",
+                "ffmpeg_param": "g",
+                "widget": "spinbox_int",
+                "range": (0, 1000),
+                "default": "250",
+                "tooltip": "Keyframe interval.",
+                "category": "Frame & GOP",
+            },
+            "bf": {
+                "label": "B-Frames:",
+                "ffmpeg_param": "bf",
+                "widget": "spinbox_int",
+                "range": (-1, 16),
+                "default": "0",
+                "tooltip": "Number of consecutive B-frames.",
+                "category": "Frame & GOP",
+            },
+            "refs": {
+                "label": "Reference Frames:",
+                "ffmpeg_param": "refs",
+                "widget": "spinbox_int",
+                "range": (1, 16),
+                "default": "1",
+                "tooltip": "Number of reference frames.",
+                "category": "Frame & GOP",
+            },
+            "usage": {
+                "label": "Usage Preset:",
+                "ffmpeg_param": "usage",
+                "widget": "combobox",
+                "values": [
+                    "transcoding",
+                    "ultralowlatency",
+                    "lowlatency",
+                    "webcam",
+                ],
+                "default": "transcoding",
+                "tooltip": "Intended usage scenario preset.",
+                "category": "Miscellaneous",
+            },
+            "quality": {
+                "label": "Quality Preset:",
+                "ffmpeg_param": "quality",
+                "widget": "combobox",
+                "values": ["speed", "balanced", "quality"],
+                "default": "balanced",
+                "tooltip": "Speed vs Quality trade-off preset.",
+                "category": "Miscellaneous",
+            },
+            "profile": {
+                "label": "Profile:",
+                "ffmpeg_param": "profile",
+                "widget": "combobox",
+                "values": ["baseline", "main", "high"],
+                "default": "",
+                "tooltip": "H.264 profile. Empty=auto.",
+                "category": "Miscellaneous",
+            },
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": ["nv12", "yuv420p"],
+                "default": "nv12",
+                "tooltip": "Pixel format. 'nv12' is a native hardware format.",
+                "category": "Miscellaneous",
+            },
+        },
+    },
+    
+    # ==============================================================================
+    # H.265 / HEVC Encoders
+    # ==============================================================================
+    "libx265": {  # x265 소프트웨어 인코더 설정
+        "group": "Software",
+        "rate_control": "-crf",
+        "quality_range": (0, 51),  # 소프트웨어 그룹, CRF 비트레이트 제어, 품질 범위
+        "param_bundle_key": "-x265-params",  # x265 파라미터 묶음 키
+        "thread_param": "pools",  # 인코더 스레드 풀 크기 파라미터 (-x265-params에 포함)
+        "preset_param": "-preset",  # 프리셋 파라미터
+        "preset_values": [
+            "ultrafast",
+            "superfast",
+            "veryfast",
+            "faster",
+            "fast",
+            "medium",
+            "slow",
+            "slower",
+            "veryslow",
+            "placebo",
+        ],  # 사용 가능한 프리셋 목록
+        "adv_options": {
+            "vbv_maxrate": {
+                "label": "Max Rate (kb/s):",
+                "ffmpeg_param": "vbv-maxrate",
+                "widget": "entry",
+                "default": "0",
+                "tooltip": "VBV Max Bitrate. 0=unlimited.",
+                "category": "Rate Control",
+            },
+            "vbv_bufsize": {
+                "label": "Buffer Size (kb):",
+                "ffmpeg_param": "vbv-bufsize",
+                "widget": "entry",
+                "default": "0",
+                "tooltip": "VBV Buffer Size. Use with Max Rate.",
+                "category": "Rate Control",
+            },
+            "aq_mode": {
+                "label": "AQ Mode:",
+                "ffmpeg_param": "aq-mode",
+                "widget": "combobox",
+                "values": ["0", "1", "2", "3"],
+                "default": "2",
+                "tooltip": "Adaptive Quantization mode. 0:Off, 1:Variance, 2:Auto-variance, 3:Complexity.",
+                "category": "Rate Control",
+            },
+            "psy_rd": {
+                "label": "Psy-RD:",
+                "ffmpeg_param": "psy-rd",
+                "widget": "spinbox_float",
+                "range": (0.0, 5.0),
+                "default": "0.3",
+                "tooltip": "Strength of psychovisual rate distortion.",
+                "category": "Psychovisual",
+            },
+            "psy_rdoq": {
+                "label": "Psy-RDOQ:",
+                "ffmpeg_param": "psy-rdoq",
+                "widget": "spinbox_float",
+                "range": (0.0, 50.0),
+                "default": "0.0",
+                "tooltip": "Strength of psychovisually optimized RDOQ.",
+                "category": "Psychovisual",
+            },
+            "rdoq_level": {
+                "label": "RDOQ Level:",
+                "ffmpeg_param": "rdoq-level",
+                "widget": "combobox",
+                "values": ["0", "1", "2"],
+                "default": "0",
+                "tooltip": "Rate-Distortion Optimized Quantization level.",
+                "category": "Psychovisual",
+            },
+            "g": {
+                "label": "Keyframe Interval:",
+                "ffmpeg_param": "keyint",
+                "widget": "spinbox_int",
+                "range": (0, 1000),
+                "default": "250",
+                "tooltip": "Max frames between keyframes (GOP size).",
+                "category": "Frame & GOP",
+            },
+            "min_keyint": {
+                "label": "Min Keyframe Interval:",
+                "ffmpeg_param": "min-keyint",
+                "widget": "spinbox_int",
+                "range": (0, 250),
+                "default": "25",
+                "tooltip": "Minimum interval between keyframes.",
+                "category": "Frame & GOP",
+            },
+            "scenecut": {
+                "label": "Scenecut:",
+                "ffmpeg_param": "scenecut",
+                "widget": "spinbox_int",
+                "range": (0, 100),
+                "default": "40",
+                "tooltip": "Scene change detection sensitivity. 0=disabled.",
+                "category": "Frame & GOP",
+            },
+            "bframes": {
+                "label": "B-Frames:",
+                "ffmpeg_param": "bframes",
+                "widget": "spinbox_int",
+                "range": (0, 16),
+                "default": "4",
+                "tooltip": "Max consecutive B-frames.",
+                "category": "Frame & GOP",
+            },
+            "open_gop": {
+                "label": "Open GOP",
+                "ffmpeg_param": "open-gop",
+                "widget": "checkbutton",
+                "default": True,
+                "tooltip": "Allow frames from other GOPs to be used as references.",
+                "category": "Frame & GOP",
+            },
+            "ref": {
+                "label": "Reference Frames:",
+                "ffmpeg_param": "ref",
+                "widget": "spinbox_int",
+                "range": (1, 16),
+                "default": "3",
+                "tooltip": "Number of reference frames.",
+                "category": "Analysis & ME",
+            },
+            "rc_lookahead": {
+                "label": "Lookahead:",
+                "ffmpeg_param": "rc-lookahead",
+                "widget": "spinbox_int",
+                "range": (0, 250),
+                "default": "20",
+                "tooltip": "Number of frames for rate control lookahead.",
+                "category": "Analysis & ME",
+            },
+            "subme": {
+                "label": "Subpixel ME:",
+                "ffmpeg_param": "subme",
+                "widget": "combobox",
+                "values": [str(i) for i in range(8)],
+                "default": "2",
+                "tooltip": "Subpixel motion estimation complexity.",
+                "category": "Analysis & ME",
+            },
+            "me_method": {
+                "label": "ME Method:",
+                "ffmpeg_param": "me",
+                "widget": "combobox",
+                "values": ["dia", "hex", "umh", "star", "full"],
+                "default": "star",
+                "tooltip": "Motion estimation algorithm.",
+                "category": "Analysis & ME",
+            },
+            "hdr_opt": {
+                "label": "HDR Optimization",
+                "ffmpeg_param": "hdr-opt",
+                "widget": "checkbutton",
+                "default": False,
+                "tooltip": "Enable color and quantization optimizations for HDR content.",
+                "category": "Color & HDR",
+            },
+            "tune": {
+                "label": "Tune:",
+                "ffmpeg_param": "tune",
+                "widget": "combobox",
+                "values": [
+                    "grain",
+                    "stillimage",
+                    "fastdecode",
+                    "zerolatency",
+                    "psnr",
+                    "ssim",
+                ],
+                "default": "",
+                "tooltip": "Tune settings for a specific type of source material.",
+                "category": "Miscellaneous",
+            },
+            "profile": {
+                "label": "Profile:",
+                "ffmpeg_param": "profile:v",
+                "widget": "combobox",
+                "values": ["main", "main10", "main12", "main422-10", "main444-8"],
+                "default": "main",
+                "tooltip": "Output stream profile constraints.",
+                "category": "Miscellaneous",
+            },
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": [
+                    "yuv420p",
+                    "yuv420p10le",
+                    "yuv422p10le",
+                    "yuv444p",
+                    "yuv444p10le",
+                ],
+                "default": "",
+                "tooltip": "Pixel format and bit depth. Empty=auto.",
+                "category": "Miscellaneous",
+            },
+        },
+    },
+    "hevc_nvenc": {  # NVIDIA HEVC 하드웨어 인코더 설정
+        "group": "NVIDIA NVENC",
+        "rate_control": "-cq",
+        "quality_range": (
+            0,
+            51,
+        ),  # NVIDIA NVENC 그룹, CQ 비트레이트 제어, 품질 범위
+        "preset_param": "-preset",  # 프리셋 파라미터
+        "preset_values": [
+            "slow",
+            "medium",
+            "fast",
+            "hp",
+            "hq",
+            "bd",
+            "ll",
+            "llhq",
+            "llhp",
+            "lossless",
+            "losslesshp",
+            "p1",
+            "p2",
+            "p3",
+            "p4",
+            "p5",
+            "p6",
+            "p7",
+        ],  # 사용 가능한 프리셋 목록
+        "adv_options": {
+            "spatial_aq": {
+                "label": "Spatial AQ",
+                "ffmpeg_param": "spatial-aq",
+                "widget": "checkbutton",
+                "default": False,
+                "tooltip": "Enable spatial adaptive quantization.",
+                "category": "Rate Control",
+            },
+            "temporal_aq": {
+                "label": "Temporal AQ",
+                "ffmpeg_param": "temporal-aq",
+                "widget": "checkbutton",
+                "default": False,
+                "tooltip": "Enable temporal adaptive quantization.",
+                "category": "Rate Control",
+            },
+            "rc_lookahead": {
+                "label": "Lookahead:",
+                "ffmpeg_param": "rc-lookahead",
+                "widget": "spinbox_int",
+                "range": (0, 250),
+                "default": "0",
+                "tooltip": "Number of frames for rate control lookahead.",
+                "category": "Rate Control",
+            },
+            "g": {
+                "label": "GOP Size:",
+                "ffmpeg_param": "g",
+                "widget": "spinbox_int",
+                "range": (0, 1000),
+                "default": "250",
+                "tooltip": "Keyframe interval.",
+                "category": "Frame & GOP",
+            },
+            "tune": {
+                "label": "Tune:",
+                "ffmpeg_param": "tune",
+                "widget": "combobox",
+                "values": ["hq", "ll", "ull", "lossless"],
+                "default": "hq",
+                "tooltip": "Tuning profile.",
+                "category": "Miscellaneous",
+            },
+            "profile": {
+                "label": "Profile:",
+                "ffmpeg_param": "profile",
+                "widget": "combobox",
+                "values": ["main", "main10", "rext"],
+                "default": "main",
+                "tooltip": "HEVC profile.",
+                "category": "Miscellaneous",
+            },
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": ["yuv420p", "nv12", "p010le", "yuv444p"],
+                "default": "yuv420p",
+                "tooltip": "Pixel format. 'p010le' is a native 10-bit hardware format.",
+                "category": "Miscellaneous",
+            },
+        },
+    },
+    "hevc_qsv": {  # Intel HEVC 하드웨어 인코더 설정
+        "group": "Intel QSV",
+        "rate_control": "-global_quality",
+        "quality_range": (
+            1,
+            51,
+        ),  # Intel QSV 그룹, global_quality 비트레이트 제어, 품질 범위
+        "preset_param": "-preset",  # 프리셋 파라미터
+        "preset_values": [
+            "veryfast",
+            "faster",
+            "fast",
+            "medium",
+            "slow",
+            "slower",
+            "veryslow",
+        ],
+        "adv_options": {
+            "look_ahead": {
+                "label": "Lookahead",
+                "ffmpeg_param": "look_ahead",
+                "widget": "checkbutton",
+                "default": False,
+                "tooltip": "Enable lookahead for better rate control decisions.",
+                "category": "Rate Control",
+            },  # 룩어헤드 활성화로 더 나은 비트레이트 제어 결정
+            "look_ahead_depth": {
+                "label": "Lookahead Depth:",
+                "ffmpeg_param": "look_ahead_depth",
+                "widget": "spinbox_int",
+                "range": (0, 100),
+                "default": "0",
+                "tooltip": "Number of frames to look ahead.",
+                "category": "Rate Control",
+            },  # 룩어헤드 프레임 수
+            "extbrc": {
+                "label": "Extended BRC",
+                "ffmpeg_param": "extbrc",
+                "widget": "checkbutton",
+                "default": False,
+                "tooltip": "Enable extended bitrate control for better quality.",
+                "category": "Rate Control",
+            },  # 확장 비트레이트 제어로 더 나은 품질
+            "g": {
+                "label": "GOP Size:",
+                "ffmpeg_param": "g",
+                "widget": "spinbox_int",
+                "range": (0, 1000),
+                "default": "250",
+                "tooltip": "Keyframe interval.",
+                "category": "Frame & GOP",
+            },  # 키프레임 간격
+            "profile": {
+                "label": "Profile:",
+                "ffmpeg_param": "profile",
+                "widget": "combobox",
+                "values": ["main", "main10"],
+                "default": "main",
+                "tooltip": "HEVC profile.",
+                "category": "Miscellaneous",
+            },  # HEVC 프로파일
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": ["nv12", "p010le"],
+                "default": "nv12",
+                "tooltip": "Pixel format. 'p010le' is the native 10-bit hardware format.",
+                "category": "Miscellaneous",
+            },  # 픽셀 포맷, p010le은 10비트 하드웨어 포맷
+        },
+    },
+    "hevc_amf": {  # AMD HEVC 하드웨어 인코더 설정
+        "group": "AMD AMF",
+        "rate_control": "-qp_p",
+        "quality_range": (0, 51),  # AMD AMF 그룹, qp_p 비트레이트 제어, 품질 범위
+        "adv_options": {
+            "qp_i": {
+                "label": "I-Frame QP:",
+                "ffmpeg_param": "qp_i",
+                "widget": "spinbox_int",
+                "range": (-1, 51),
+                "default": "-1",
+                "tooltip": "Constant Quantization Parameter for I-frames. -1=auto.",
+                "category": "Rate Control",
+            },  # I프레임 양자화 파라미터, -1=자동
+            "qp_p": {
+                "label": "P-Frame QP:",
+                "ffmpeg_param": "qp_p",
+                "widget": "spinbox_int",
+                "range": (-1, 51),
+                "default": "-1",
+                "tooltip": "Constant Quantization Parameter for P-frames. -1=auto.",
+                "category": "Rate Control",
+            },  # P프레임 양자화 파라미터, -1=자동
+            "qp_b": {
+                "label": "B-Frame QP:",
+                "ffmpeg_param": "qp_b",
+                "widget": "spinbox_int",
+                "range": (-1, 51),
+                "default": "-1",
+                "tooltip": "Constant Quantization Parameter for B-frames. -1=auto.",
+                "category": "Rate Control",
+            },  # B프레임 양자화 파라미터, -1=자동
+            "vbaq": {
+                "label": "Enable VBAQ",
+                "ffmpeg_param": "vbaq",
+                "widget": "checkbutton",
+                "default": False,
+                "tooltip": "Enable Variance Based Adaptive Quantization.",
+                "category": "Rate Control",
+            },  # 분산 기반 적응형 양자화 활성화
+            "g": {
+                "label": "GOP Size:",
+                "ffmpeg_param": "g",
+                "widget": "spinbox_int",
+                "range": (0, 1000),
+                "default": "250",
+                "tooltip": "Keyframe interval.",
+                "category": "Frame & GOP",
+            },  # 키프레임 간격
+            "bf": {
+                "label": "B-Frames:",
+                "ffmpeg_param": "bf",
+                "widget": "spinbox_int",
+                "range": (-1, 16),
+                "default": "0",
+                "tooltip": "Number of consecutive B-frames. -1=auto.",
+                "category": "Frame & GOP",
+            },  # 연속 B프레임 수, -1=자동
+            "refs": {
+                "label": "Reference Frames:",
+                "ffmpeg_param": "refs",
+                "widget": "spinbox_int",
+                "range": (1, 16),
+                "default": "1",
+                "tooltip": "Number of reference frames.",
+                "category": "Frame & GOP",
+            },  # 참조 프레임 수
+            "header_insertion_mode": {
+                "label": "Header Insertion:",
+                "ffmpeg_param": "header_insertion_mode",
+                "widget": "combobox",
+                "values": ["disabled", "gop", "idr"],
+                "default": "disabled",
+                "tooltip": "Controls insertion of sequence and picture parameter sets.",
+                "category": "Frame & GOP",
+            },  # 시퀀스 및 픽처 파라미터 세트 삽입 제어
+            "usage": {
+                "label": "Usage Preset:",
+                "ffmpeg_param": "usage",
+                "widget": "combobox",
+                "values": [
+                    "transcoding",
+                    "ultralowlatency",
+                    "lowlatency",
+                    "webcam",
+                ],
+                "default": "transcoding",
+                "tooltip": "Intended usage scenario preset.",
+                "category": "Miscellaneous",
+            },  # 사용 시나리오 프리셋
+            "quality": {
+                "label": "Quality Preset:",
+                "ffmpeg_param": "quality",
+                "widget": "combobox",
+                "values": ["speed", "balanced", "quality"],
+                "default": "balanced",
+                "tooltip": "Speed vs Quality trade-off preset.",
+                "category": "Miscellaneous",
+            },  # 속도 vs 품질 트레이드오프 프리셋
+            "profile": {
+                "label": "Profile:",
+                "ffmpeg_param": "profile",
+                "widget": "combobox",
+                "values": ["main", "main10"],
+                "default": "main",
+                "tooltip": "HEVC profile.",
+                "category": "Miscellaneous",
+            },  # HEVC 프로파일
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": ["nv12", "p010le", "yuv420p", "yuv420p10le"],
+                "default": "nv12",
+                "tooltip": "Pixel format. 'p010le' enables 10-bit encoding.",
+                "category": "Miscellaneous",
+            },  # 픽셀 포맷, p010le은 10비트 인코딩 활성화
+        },
+    },
+    
+    # ==============================================================================
+    # AV1 Encoders
+    # ==============================================================================
+    "libaom-av1": {  # libaom AV1 소프트웨어 인코더 설정
+        "group": "Software",
+        "rate_control": "-crf",
+        "quality_range": (0, 63),  # 소프트웨어 그룹, CRF 비트레이트 제어, 품질 범위
+        "thread_param": "threads",  # 인코더 스레드 수 파라미터 (-threads)
+        "adv_options": {
+            "b:v": {
+                "label": "Target Bitrate (kb/s):",
+                "ffmpeg_param": "b:v",
+                "widget": "entry",
+                "default": "0",
+                "tooltip": "Target bitrate for VBR mode. Set to 0 for CRF mode.",
+                "category": "Rate Control",
+            },  # VBR 모드용 목표 비트레이트, 0=CRF 모드
+            "cpu_used": {
+                "label": "CPU Used:",
+                "ffmpeg_param": "cpu-used",
+                "widget": "spinbox_int",
+                "range": (0, 8),
+                "default": "1",
+                "tooltip": "CPU usage/speed control. Lower is slower and higher quality.",
+                "category": "Performance",
+            },  # CPU 사용량/속도 제어, 낮을수록 느리고 품질 높음
+            "row_mt": {
+                "label": "Row Multithreading",
+                "ffmpeg_param": "row-mt",
+                "widget": "checkbutton",
+                "default": True,
+                "tooltip": "Enable row-based multithreading.",
+                "category": "Performance",
+            },  # 행 기반 멀티스레딩 활성화
+            "tile_columns": {
+                "label": "Tile Columns (log2):",
+                "ffmpeg_param": "tile-columns",
+                "widget": "spinbox_int",
+                "range": (0, 6),
+                "default": "0",
+                "tooltip": "Number of tile columns (log2). E.g., 2 = 4 columns.",
+                "category": "Performance",
+            },  # 타일 열 수 (log2), 예: 2 = 4열
+            "tile_rows": {
+                "label": "Tile Rows (log2):",
+                "ffmpeg_param": "tile-rows",
+                "widget": "spinbox_int",
+                "range": (0, 6),
+                "default": "0",
+                "tooltip": "Number of tile rows (log2). E.g., 1 = 2 rows.",
+                "category": "Performance",
+            },  # 타일 행 수 (log2), 예: 1 = 2행
+            "enable_cdef": {
+                "label": "Enable CDEF",
+                "ffmpeg_param": "enable-cdef",
+                "widget": "checkbutton",
+                "default": True,
+                "tooltip": "Enable Constrained Directional Enhancement Filter.",
+                "category": "Analysis & ME",
+            },  # 제약된 방향성 향상 필터 활성화
+            "enable_restoration": {
+                "label": "Enable Restoration",
+                "ffmpeg_param": "enable-restoration",
+                "widget": "checkbutton",
+                "default": True,
+                "tooltip": "Enable Loop Restoration Filter.",
+                "category": "Analysis & ME",
+            },  # 루프 복원 필터 활성화
+            "tune": {
+                "label": "Tune:",
+                "ffmpeg_param": "tune",
+                "widget": "combobox",
+                "values": [
+                    "ssim",
+                    "psnr",
+                    "vmaf_with_preprocessing",
+                    "vmaf_without_preprocessing",
+                ],
+                "default": "",
+                "tooltip": "Tune for a specific quality metric.",
+                "category": "Miscellaneous",
+            },  # 특정 품질 메트릭에 맞춤 조정
+            "profile": {
+                "label": "Profile:",
+                "ffmpeg_param": "profile",
+                "widget": "combobox",
+                "values": ["main", "high", "professional"],
+                "default": "main",
+                "tooltip": "AV1 profile.",
+                "category": "Miscellaneous",
+            },  # AV1 프로파일
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": ["yuv420p", "yuv420p10le", "yuv422p10le", "yuv444p10le"],
+                "default": "",
+                "tooltip": "Pixel format. AV1 is typically used with 10-bit. Empty=auto.",
+                "category": "Miscellaneous",
+            },  # 픽셀 포맷, AV1은 보통 10비트 사용, 빈값=자동
+        },
+    },
+    "svt-av1": {  # SVT-AV1 소프트웨어 인코더 설정
+        "group": "Software",
+        "rate_control": "-crf",
+        "quality_range": (0, 63),  # 소프트웨어 그룹, CRF 비트레이트 제어, 품질 범위
+        "preset_param": "-preset",  # 프리셋 파라미터
+        "preset_values": [str(i) for i in range(13)],  # 0-12 프리셋 값들
+        "adv_options": {
+            "gop_size": {
+                "label": "GOP Size:",
+                "ffmpeg_param": "g",
+                "widget": "spinbox_int",
+                "range": (-1, 256),
+                "default": "-1",
+                "tooltip": "Keyframe interval (in frames). -1=auto.",
+                "category": "Frame & GOP",
+            },  # 키프레임 간격 (프레임 단위), -1=자동
+            "scm": {
+                "label": "Scene Change Detection:",
+                "ffmpeg_param": "scm",
+                "widget": "combobox",
+                "values": ["0", "1"],
+                "default": "0",
+                "tooltip": "Enable scene change detection.",
+                "category": "Miscellaneous",
+            },  # 장면 변화 감지 활성화
+            "film_grain": {
+                "label": "Film Grain Synthesis:",
+                "ffmpeg_param": "film-grain",
+                "widget": "spinbox_int",
+                "range": (0, 50),
+                "default": "0",
+                "tooltip": "Strength of film grain synthesis. 0=disabled.",
+                "category": "Psychovisual",
+            },  # 필름 그레인 합성 강도, 0=비활성화
+            "tune": {
+                "label": "Tune:",
+                "ffmpeg_param": "tune",
+                "widget": "combobox",
+                "values": ["0", "1"],
+                "default": "1",
+                "tooltip": "Tuning mode. 0: VMAF, 1: PSNR.",
+                "category": "Miscellaneous",
+            },  # 튜닝 모드, 0: VMAF, 1: PSNR
+            "profile": {
+                "label": "Profile:",
+                "ffmpeg_param": "profile",
+                "widget": "combobox",
+                "values": ["main", "high", "professional"],
+                "default": "main",
+                "tooltip": "AV1 profile.",
+                "category": "Miscellaneous",
+            },  # AV1 프로파일
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": ["yuv420p", "yuv420p10le"],
+                "default": "",
+                "tooltip": "Pixel format. SVT-AV1 recommends 10-bit. Empty=auto.",
+                "category": "Miscellaneous",
+            },  # 픽셀 포맷, SVT-AV1은 10비트 권장, 빈값=자동
+        },
+    },
+    "librav1e": {  # rav1e AV1 소프트웨어 인코더 설정
+        "group": "Software",
+        "rate_control": "-qp",
+        "quality_range": (0, 255),  # 소프트웨어 그룹, QP 비트레이트 제어, 품질 범위
+        "thread_param": "threads",  # 인코더 스레드 수 파라미터 (-threads)
+        "adv_options": {
+            "speed": {
+                "label": "Speed Preset:",
+                "ffmpeg_param": "speed",
+                "widget": "spinbox_int",
+                "range": (0, 10),
+                "default": "6",
+                "tooltip": "Speed level. 0 is slowest (best quality), 10 is fastest.",
+                "category": "Performance",
+            },  # 속도 레벨, 0=가장 느림 (최고 품질), 10=가장 빠름
+            "threads": {
+                "label": "Threads:",
+                "ffmpeg_param": "threads",
+                "widget": "spinbox_int",
+                "range": (0, 128),
+                "default": "0",
+                "tooltip": "Number of threads to use. 0 is auto.",
+                "category": "Performance",
+            },  # 사용할 스레드 수, 0=자동
+            "tile_columns": {
+                "label": "Tile Columns:",
+                "ffmpeg_param": "tile-columns",
+                "widget": "spinbox_int",
+                "range": (0, 64),
+                "default": "0",
+                "tooltip": "Number of tile columns.",
+                "category": "Performance",
+            },  # 타일 열 수
+            "tile_rows": {
+                "label": "Tile Rows:",
+                "ffmpeg_param": "tile-rows",
+                "widget": "spinbox_int",
+                "range": (0, 64),
+                "default": "0",
+                "tooltip": "Number of tile rows.",
+                "category": "Performance",
+            },  # 타일 행 수
+            "tune": {
+                "label": "Tune:",
+                "ffmpeg_param": "tune",
+                "widget": "combobox",
+                "values": ["psychovisual", "psnr"],
+                "default": "psychovisual",
+                "tooltip": "Tune for a quality metric. Psychovisual is recommended.",
+                "category": "Miscellaneous",
+            },  # 품질 메트릭에 맞춤 조정, 심리시각적 조정 권장
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": ["yuv420p", "yuv420p10le", "yuv444p"],
+                "default": "",
+                "tooltip": "Pixel format. rav1e often performs well with 10-bit. Empty=auto.",
+                "category": "Miscellaneous",
+            },  # 픽셀 포맷, rav1e는 10비트에서 성능이 좋음, 빈값=자동
+        },
+    },
+    "av1_nvenc": {  # NVIDIA AV1 하드웨어 인코더 설정
+        "group": "NVIDIA NVENC",
+        "rate_control": "-cq",
+        "quality_range": (
+            0,
+            51,
+        ),  # NVIDIA NVENC 그룹, CQ 비트레이트 제어, 품질 범위
+        "preset_param": "-preset",  # 프리셋 파라미터
+        "preset_values": [
+            "slow",
+            "medium",
+            "fast",
+            "hp",
+            "hq",
+            "bd",
+            "ll",
+            "llhq",
+            "llhp",
+            "lossless",
+            "losslesshp",
+            "p1",
+            "p2",
+            "p3",
+            "p4",
+            "p5",
+            "p6",
+            "p7",
+        ],  # 다양한 프리셋 값들
+        "adv_options": {
+            "spatial_aq": {
+                "label": "Spatial AQ",
+                "ffmpeg_param": "spatial-aq",
+                "widget": "checkbutton",
+                "default": False,
+                "tooltip": "Enable spatial adaptive quantization.",
+                "category": "Rate Control",
+            },  # 공간 적응형 양자화 활성화
+            "tune": {
+                "label": "Tune:",
+                "ffmpeg_param": "tune",
+                "widget": "combobox",
+                "values": ["hq", "ll", "ull"],
+                "default": "hq",
+                "tooltip": "Tuning profile.",
+                "category": "Miscellaneous",
+            },  # 튜닝 프로파일
+            "profile": {
+                "label": "Profile:",
+                "ffmpeg_param": "profile",
+                "widget": "combobox",
+                "values": ["main", "high", "professional"],
+                "default": "main",
+                "tooltip": "AV1 profile.",
+                "category": "Miscellaneous",
+            },  # AV1 프로파일
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": ["p010le", "yuv420p"],
+                "default": "yuv420p",
+                "tooltip": "Pixel format. AV1 hardware encoding is typically 10-bit.",
+                "category": "Miscellaneous",
+            },  # 픽셀 포맷, AV1 하드웨어 인코딩은 보통 10비트
+        },
+    },
+    "av1_qsv": {  # Intel AV1 하드웨어 인코더 설정
+        "group": "Intel QSV",
+        "rate_control": "-global_quality",
+        "quality_range": (
+            1,
+            51,
+        ),  # Intel QSV 그룹, global_quality 비트레이트 제어, 품질 범위
+        "preset_param": "-preset",  # 프리셋 파라미터
+        "preset_values": [
+            "veryfast",
+            "faster",
+            "fast",
+            "medium",
+            "slow",
+            "slower",
+            "veryslow",
+        ],  # 프리셋 값들
+        "adv_options": {
+            "profile": {
+                "label": "Profile:",
+                "ffmpeg_param": "profile",
+                "widget": "combobox",
+                "values": ["main"],
+                "default": "main",
+                "tooltip": "AV1 profile. 'main' supports 10-bit.",
+                "category": "Miscellaneous",
+            },  # AV1 프로파일, main은 10비트 지원
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": ["p010le"],
+                "default": "p010le",
+                "tooltip": "Pixel format. AV1 QSV requires a 10-bit hardware format.",
+                "category": "Miscellaneous",
+            },  # 픽셀 포맷, AV1 QSV는 10비트 하드웨어 포맷 필요
+        },
+    },
+    "av1_amf": {  # AMD AV1 하드웨어 인코더 설정
+        "group": "AMD AMF",
+        "rate_control": "-qp_p",
+        "quality_range": (0, 51),  # AMD AMF 그룹, qp_p 비트레이트 제어, 품질 범위
+        "adv_options": {
+            "qp_i": {
+                "label": "I-Frame QP:",
+                "ffmpeg_param": "qp_i",
+                "widget": "spinbox_int",
+                "range": (0, 51),
+                "default": "22",
+                "tooltip": "Constant Quantization Parameter for I-frames.",
+                "category": "Rate Control",
+            },  # I프레임 양자화 파라미터
+            "qp_p": {
+                "label": "P-Frame QP:",
+                "ffmpeg_param": "qp_p",
+                "widget": "spinbox_int",
+                "range": (0, 51),
+                "default": "22",
+                "tooltip": "Constant Quantization Parameter for P-frames.",
+                "category": "Rate Control",
+            },  # P프레임 양자화 파라미터
+            "quality": {
+                "label": "Quality Preset:",
+                "ffmpeg_param": "quality",
+                "widget": "combobox",
+                "values": ["speed", "balanced", "quality"],
+                "default": "balanced",
+                "tooltip": "Speed vs Quality trade-off preset.",
+                "category": "Miscellaneous",
+            },  # 속도 vs 품질 트레이드오프 프리셋
+            "profile": {
+                "label": "Profile:",
+                "ffmpeg_param": "profile",
+                "widget": "combobox",
+                "values": ["main"],
+                "default": "main",
+                "tooltip": "AV1 profile. 'main' supports 10-bit.",
+                "category": "Miscellaneous",
+            },  # AV1 프로파일, main은 10비트 지원
+            "pix_fmt": {
+                "label": "Pixel Format:",
+                "ffmpeg_param": "pix_fmt",
+                "widget": "combobox",
+                "values": ["nv12", "p010le"],
+                "default": "p010le",
+                "tooltip": "Pixel format. 'p010le' enables 10-bit AV1 encoding.",
+                "category": "Miscellaneous",
+            },  # 픽셀 포맷, p010le은 10비트 AV1 인코딩 활성화
+        },
+    },
+}
+
+
+
+# ==============================================================================
+# 4. FFmpeg 명령어 빌더
+# ==============================================================================
+# FFmpeg 명령어를 생성하는 클래스
+class FFmpegCommandBuilder:
+    """
+    주어진 EncodingTask의 정보를 바탕으로 다양한 FFmpeg 명령어 리스트를 동적으로 생성하는 클래스.
+    """
+    def __init__(self, task: EncodingTask, full_video_path: str = None):
+        """
+        특정 인코딩 작업을 위한 명령어 빌더를 초기화.
+
+        Args:
+            task: 모든 작업 파라미터를 담고 있는 EncodingTask 데이터클래스 인스턴스.
+            full_video_path: 최종 명령어를 생성할 때 사용할 전체 비디오 파일 경로.
+        """
+        self.task = task # 인코딩 작업에 필요한 모든 정보를 담은 EncodingTask 객체
+        self.is_for_full_video = bool(full_video_path) # 샘플 영상이 아닌 전체 영상용 명령어인지 여부
+        self.video_path = full_video_path if self.is_for_full_video else os.path.basename(task.sample_path) # 명령어에 사용할 입력 비디오 경로
+        self.codec_config = CODEC_CONFIG.get(task.codec, {}) # 현재 코덱에 대한 설정 스키마
+
+    def _is_libx264_vbv_option(self, ffmpeg_param: str, user_value_str: str) -> bool:
+        """
+        libx264의 VBV 옵션인지 확인하는 헬퍼 메서드.
+
+        Args:
+            ffmpeg_param: FFmpeg 파라미터 이름
+            user_value_str: 사용자 입력 값
+
+        Returns:
+            bool: libx264의 VBV 옵션이면 True, 그렇지 않으면 False
+        """
+        return (self.task.codec == 'libx264' and 
+                ffmpeg_param in ['vbv-maxrate', 'vbv-bufsize'] and 
+                user_value_str != "0")
+
+    def _build_advanced_params(self) -> List[str]:
+        """
+        코덱 스키마를 기반으로 FFmpeg 고급 파라미터 리스트를 동적으로 생성.
+
+        사용자가 설정한 고급 옵션들을 FFmpeg 명령어에 사용할 수 있는 파라미터 형태로 변환함.
+        -x264-params와 같은 묶음 파라미터와 개별 파라미터를 모두 처리하며, 설정되지 않은 옵션은 자동으로 제외됨.
+
+        Returns:
+            List[str]: FFmpeg 명령어에 사용할 고급 파라미터들의 리스트
+        """
+        # 필요한 변수들을 초기화
+        user_options = self.task.adv_opts # 사용자가 설정한 고급 옵션들
+        schema = self.codec_config.get("adv_options", {}) # 코덱별 고급 옵션 스키마
+        UNSPECIFIED_VALUES = {'', 'None', 'None (default)'} # 무시할 값들(사용자가 설정하지 않음)
+        param_bundle_key = self.codec_config.get("param_bundle_key") # 옵션을 하나로 묶는 파라미터 키 (예: -x264-params)
+        thread_param = self.codec_config.get("thread_param") # 인코더 스레드 수 파라미터
+        scheduled_threads = self._get_scheduled_encoder_threads() # 코어 예산에 따라 할당된 스레드 수 (0이면 지정하지 않음)
+        params = [] # 생성될 파라미터들을 담을 리스트
+
+        # 코덱 스키마의 모든 옵션을 순회하며 명령어 파라미터를 생성
+        for key, option_data in schema.items():
+            user_value_obj = user_options.get(key) # 사용자가 설정한 값
+            user_value_str = str(user_value_obj) if user_value_obj is not None else '' # 값을 문자열로 변환
+
+            # 사용자가 설정하지 않은 값은 건너뜀
+            if user_value_str in UNSPECIFIED_VALUES:
+                continue
+
+            ffmpeg_param = option_data.get("ffmpeg_param") # 실제 FFmpeg에서 사용하는 파라미터 이름
+            if not ffmpeg_param: # FFmpeg 파라미터가 정의되지 않은 옵션은 건너뜀
+                continue
+            
+            # preset, profile 등은 별도로 처리되므로, 묶음 파라미터에서는 제외
+            if param_bundle_key and ffmpeg_param in ["preset", "profile:v", "tune", "pix_fmt"]:
+                continue
+
+            # 스레드 수를 자동(0)으로 둔 경우, 아래에서 코어 예산에 따른 값으로 대체
+            if scheduled_threads and ffmpeg_param == thread_param:
+                continue
+
+            is_checkbutton = option_data.get("widget") == "checkbutton" # 옵션이 체크박스인지 확인
+
+            # 묶음 파라미터(-x264-params 등)를 사용하는 코덱의 경우
+            if param_bundle_key:
+                if is_checkbutton: # 체크박스는 'param=1' 또는 'param=0' 형식으로 추가
+                    params.append(f"{ffmpeg_param}={'1' if user_value_obj else '0'}")
+                else:
+                    if self._is_libx264_vbv_option(ffmpeg_param, user_value_str): # libx264의 VBV 옵션은 특별 처리
+                        params.append(f"{ffmpeg_param}={user_value_str}k") # 'k' 접미사 추가
+                    else: # 그 외 옵션은 'param=value' 형식으로 추가
+                        params.append(f"{ffmpeg_param}={user_value_str}")
+            
+            # 개별 파라미터(-key value)를 사용하는 코덱의 경우
+            else:
+                if is_checkbutton:
+                    default_value = option_data.get("default", False)
+                    if user_value_obj != default_value: # 기본값과 다를 때만 파라미터를 추가
+                        params.extend([f"-{ffmpeg_param}", "1" if user_value_obj else "0"])
+                else: # 그 외 옵션은 '-param', 'value' 형식으로 추가
+                    params.extend([f"-{ffmpeg_param}", user_value_str])
+
+        # 코어 예산 스케줄러가 할당한 인코더 스레드 수 추가
+        if scheduled_threads:
+            if param_bundle_key:
+                params.append(f"{thread_param}={scheduled_threads}")
+            else:
+                params.extend([f"-{thread_param}", str(scheduled_threads)])
+
+        if not params: # 생성된 파라미터가 없으면 빈 리스트 반환
+            return []
+
+        if param_bundle_key: # 묶음 파라미터가 있는 경우
+            return [param_bundle_key, ":".join(params)] # '-x264-params', 'key=value:key2=value2' 형식으로 반환
+        else: # 개별 파라미터인 경우
+            return params # ['-key', 'value', '-key2', 'value2'] 형식으로 반환
+
+    def _get_scheduled_encoder_threads(self) -> int:
+        """
+        코어 예산 스케줄러가 할당한 인코더 스레드 수를 반환.
+
+        스레드 파라미터가 정의된 소프트웨어 코덱에만 적용되며,
+        사용자가 고급 설정에서 스레드 수를 직접 지정한 경우에는 사용자의 값을 우선함.
+
+        Returns:
+            int: 명령어에 지정할 스레드 수 (지정하지 않을 경우 0)
+        """
+        thread_param = self.codec_config.get("thread_param")
+        if self.task.encoder_threads <= 0 or not thread_param:
+            return 0
+        for key, option_data in self.codec_config.get("adv_options", {}).items():
+            if option_data.get("ffmpeg_param") == thread_param and str(self.task.adv_opts.get(key, '')) not in ('', '0', 'None'):
+                return 0 # 사용자가 직접 지정한 스레드 수를 유지
+        return self.task.encoder_threads
+
+    def build_encode_command(self, pass_num: int = 0, to_pipe: bool = False, report_progress: bool = False) -> List[str]:
+        """
+        주어진 패스(pass)에 대한 완전한 FFmpeg 인코딩 명령어를 구성.
+
+        EncodingTask의 모든 설정을 바탕으로 FFmpeg 인코딩 명령어를 생성함.
+        코덱별 고급 옵션, 하드웨어 가속, 2패스 인코딩, 색상 메타데이터 등을
+        자동으로 처리하여 완전한 명령어를 구성함.
+
+        Args:
+            pass_num: 2패스 인코딩에서의 패스 번호 (0: 단일 패스 또는 2패스, 1: 1패스)
+            to_pipe: True이면 파일 대신 표준 출력(stdout)으로 Matroska 스트림을 출력
+            report_progress: True이면 진행 상황(-progress)을 표준 출력으로 보고 (파일 출력에서만 사용)
+
+        Returns:
+            List[str]: FFmpeg 인코딩 명령어의 각 요소들을 담은 리스트
+        """
+        task = self.task
+        output_path = f"encoded_{task.codec}_{task.preset}_{task.crf}.mkv" if self.is_for_full_video else os.path.basename(task.encoded_path)
+        rate_control_param = self.codec_config.get("rate_control", "-crf")
+
+        # 명령어 기본 구성
+        cmd = [task.ffmpeg_path, "-y", "-hide_banner", "-loglevel", "info"]
+
+        # 스트림 분석 옵션을 -i 앞에 추가하여 분석 정확도 향상
+        cmd.extend(["-analyzeduration", "20M", "-probesize", "20M"])
+
+        # 하드웨어 가속기 초기화 (필요한 경우)
+        if 'qsv' in task.codec:
+            cmd.extend(["-init_hw_device", "qsv=hw", "-filter_hw_device", "hw"])
+        
+        # 입력 파일 지정
+        cmd.extend(["-i", self.video_path])
+        
+        # 가변 프레임레이트(VFR) 비디오의 싱크 문제를 방지하기 위해 고정 프레임레이트(CFR)로 변환
+        cmd.extend(["-fps_mode", "cfr"])
+        
+        # 원본 영상에서 추출한 색상 메타데이터를 명시적으로 적용하여 색상 왜곡 방지
+        if task.color_info:
+            for key, value in task.color_info.items():
+                if value and value != "unknown": # 유효한 값이 있을 때만 옵션을 추가
+                    cmd.extend([f"-{key}", value])
+
+        # 비디오 코덱 및 프리셋 설정
+        cmd.extend(["-c:v", task.codec])
+        if "preset" not in self.codec_config.get("adv_options", {}): # 프리셋이 고급 옵션에 포함되지 않은 경우에만 별도로 추가
+            cmd.extend(["-preset", task.preset])
+        
+        # 주 품질 제어 파라미터 설정 (CRF/CQ 등)
+        cmd.extend([rate_control_param, str(task.crf)])
+        
+        # AMD AMF 코덱의 CQP 모드는 별도 플래그가 필요
+        if 'amf' in task.codec and task.adv_opts.get('rc') == 'cqp':
+            cmd.extend(['-rc', 'cqp'])
+
+        # 동적으로 생성된 고급 파라미터 추가
+        cmd.extend(self._build_advanced_params())
+
+        # 사용자가 직접 입력한 커스텀 옵션 추가
+        if "custom_opts" in task.adv_opts and task.adv_opts["custom_opts"]:
+             cmd.extend(shlex.split(task.adv_opts["custom_opts"]))
+        
+        # 오디오 옵션 처리
+        if task.audio_option == 'Remove Audio':
+            cmd.append("-an") # 오디오 스트림 제거
+        elif task.audio_option == 'Copy Audio':
+            cmd.extend(["-c:a", "copy"]) # 오디오 스트림을 재인코딩 없이 복사
+        
+        # 2-pass 인코딩 로직 처리
+        is_2pass = "is_2pass" in task.adv_opts and task.adv_opts["is_2pass"]
+        if is_2pass:
+            passlogfile_name = f"ffmpeg2pass_{task.preset}_{task.crf}" if not self.is_for_full_video else "ffmpeg2pass_final"
+            passlogfile = os.path.join(task.temp_dir, passlogfile_name)
+            cmd.extend(["-pass", str(pass_num), "-passlogfile", passlogfile]) # 1패스 또는 2패스 관련 옵션 추가
+            
+        if is_2pass and pass_num == 1: # 1패스인 경우, 실제 비디오 출력을 하지 않고 로그 파일만 생성
+            cmd.extend(["-f", "null", "NUL" if os.name == 'nt' else "/dev/null"])
+        elif to_pipe: # 스트리밍 분석 모드인 경우, 파일 대신 표준 출력으로 내보냄
+            cmd.extend(["-f", "matroska", "pipe:1"])
+        else: # 2패스 또는 단일 패스인 경우, 최종 출력 파일 경로 지정
+            if report_progress: # 먹서가 지금까지 기록한 바이트 수(total_size)를 주기적으로 표준 출력에 보고
+                cmd.extend(["-progress", "pipe:1"])
+            cmd.append(output_path)
+            
+        return cmd
+
+    def _build_analysis_command_base(self, encoded_input: str = None) -> List[str]:
+        """
+        분석(VMAF, PSNR, SSIM)을 위한 기본 FFmpeg 명령어를 생성.
+
+        모든 품질 분석 명령어에 공통으로 사용되는 기본 구조를 생성함.
+        인코딩된 파일과 원본 샘플 파일을 입력으로 받아 비교 분석할 수 있도록 기본적인 FFmpeg 옵션들을 설정함.
+
+        Args:
+            encoded_input: 인코딩된 영상 입력 경로 (None이면 인코딩 결과 파일, 'pipe:0'이면 표준 입력)
+
+        Returns:
+            List[str]: 분석 명령어의 기본 구조를 담은 리스트
+        """
+        cmd = [self.task.ffmpeg_path]
+        
+        # 분석의 일관성과 정확도를 위해 항상 CPU 디코딩을 사용하고, 두 개의 입력 파일을 지정
+        # 실행 전체에서 공유하는 디코딩된 기준 영상이 있으면 H.264 샘플을 다시 디코딩하지 않고 이를 사용
+        reference_input = self.task.reference_path if self.task.reference_path else os.path.basename(self.task.sample_path)
+
+        cmd.extend(['-y', '-hide_banner', '-loglevel', 'info',
+                    '-i', encoded_input or os.path.basename(self.task.encoded_path), # 인코딩된 파일 (첫 번째 입력)
+                    '-i', reference_input]) # 원본 샘플 (두 번째 입력)
+        return cmd
+
+    def _analysis_timestamp_filter(self) -> str:
+        """
+        분석 시 두 입력의 프레임을 짝짓기 위한 타임스탬프 정렬 필터를 반환.
+
+        디코딩된 기준 영상(y4m)은 프레임레이트 기반의 정확한 타임스탬프를 가지지만,
+        인코딩된 Matroska 파일은 밀리초 단위로 반올림된 타임스탬프를 가지므로 PTS 기준으로는 프레임이 어긋날 수 있음.
+        이 경우 두 입력 모두 같은 타임베이스에서 프레임 번호 기반 타임스탬프로 재설정하여 동일 프레임끼리 비교되도록 함.
+
+        Returns:
+            str: 각 입력에 적용할 필터 체인 문자열
+        """
+        if self.task.reference_path:
+            return "settb=AVTB,setpts=N/FRAME_RATE/TB" # 프레임 번호 기반의 동일한 타임스탬프로 정렬
+        return "setpts=PTS-STARTPTS" # 타임스탬프를 0부터 시작하도록 리셋
+
+    def _build_libvmaf_options(self, subsample: int = 0) -> str:
+        """
+        libvmaf 필터에 전달할 옵션 문자열을 생성.
+
+        VMAF 로그 파일 경로와 사용자가 지정한 VMAF 모델 경로를 libvmaf 옵션 형식으로 구성함.
+        단독 VMAF 분석과 통합 분석 명령어가 동일한 옵션을 사용하도록 공통으로 사용됨.
+
+        Args:
+            subsample: VMAF를 계산할 프레임 간격 (1이면 모든 프레임, 0이면 작업의 vmaf_subsample)
+
+        Returns:
+            str: 'log_fmt=csv:log_path=...' 형식의 libvmaf 옵션 문자열
+        """
+        task = self.task
+        subsample = subsample or task.vmaf_subsample
+        libvmaf_options = f"log_fmt=csv:log_path={task.vmaf_log_filename}" # 프레임별 VMAF 점수를 CSV 파일로 저장하도록 설정
+        if task.analysis_threads > 0: # 코어 예산에 따라 할당된 스레드 수로 VMAF 계산 (기본값은 1)
+            libvmaf_options += f":n_threads={task.analysis_threads}"
+        if subsample > 1: # 일정 간격의 프레임만 계산하여 분석 비용을 줄임 (순차 검정의 1차 분석, 시간 예산에 맞춘 분석)
+            libvmaf_options += f":n_subsample={subsample}"
+        
+        # 사용자가 VMAF 모델을 직접 지정한 경우, 해당 모델을 사용하도록 옵션 추가
+        if task.vmaf_model_path and os.path.exists(task.vmaf_model_path):
+            try:
+                # FFmpeg 작업 디렉토리 기준 상대 경로로 변환
+                relative_model_path = os.path.relpath(task.vmaf_model_path, task.temp_dir)
+                safe_relative_path = relative_model_path.replace('\\', '/') # Windows 경로 구분자를 FFmpeg 호환 형식으로 변경
+                libvmaf_options += f":model=path={safe_relative_path}"
+            except Exception as e:
+                logging.warning(f"Could not calculate relative path for VMAF model '{task.vmaf_model_path}'. Falling back to default model. Error: {e}")
+
+        return libvmaf_options
+
+    def build_vmaf_command(self, subsample: int = 0) -> List[str]:
+        """
+        VMAF 점수 계산을 위한 FFmpeg 명령어를 구성.
+
+        VMAF(Video Multi-method Assessment Fusion) 분석을 위한 FFmpeg 명령어를 생성함.
+        VMAF는 Netflix에서 개발한 주관적 품질 평가 알고리즘으로, 인간의 시각적 품질 인식을 시뮬레이션함.
+
+        Args:
+            subsample: VMAF를 계산할 프레임 간격 (1이면 모든 프레임, 0이면 작업의 vmaf_subsample)
+
+        Returns:
+            List[str]: VMAF 분석을 위한 FFmpeg 명령어의 각 요소들을 담은 리스트
+        """
+        libvmaf_options = self._build_libvmaf_options(subsample) # libvmaf 필터 옵션 문자열
+
+        # VMAF 비교를 위한 필터 그래프를 구성
+        ts_filter = self._analysis_timestamp_filter() # 두 입력의 타임스탬프 정렬 필터
+        filter_complex = f"[0:v]{ts_filter}[dist];[1:v]{ts_filter}[ref];[dist][ref]libvmaf={libvmaf_options}"
+        
+        # 기본 분석 명령어에 VMAF 필터와 옵션을 추가
+        cmd = self._build_analysis_command_base()
+        cmd.extend(["-vsync", "cfr", "-filter_complex", filter_complex, "-f", "null", "-"])
+        return cmd
+
+    def build_fused_analysis_command(self, encoded_input: str = None) -> List[str]:
+        """
+        VMAF와 선택된 보조 메트릭(PSNR/SSIM/블록킹)을 한 번의 실행으로 계산하는 FFmpeg 명령어를 구성.
+
+        인코딩된 파일과 원본 샘플을 각각 한 번씩만 디코딩한 뒤 split 필터로 프레임을 분기하여,
+        libvmaf, psnr, ssim, blockdetect 필터에 동시에 공급함.
+        메트릭마다 두 입력을 다시 디코딩하던 개별 분석 명령어와 달리 디코딩 비용이 한 번만 발생함.
+        분기된 필터의 출력은 라벨 없이 남겨두어 모두 null 출력으로 연결되도록 함.
+
+        Args:
+            encoded_input: 인코딩된 영상 입력 경로 (스트리밍 분석 시 'pipe:0')
+
+        Returns:
+            List[str]: 통합 분석을 위한 FFmpeg 명령어의 각 요소들을 담은 리스트
+        """
+        task = self.task
+
+        # 두 입력을 비교하는 메트릭 필터 목록 (VMAF는 항상 포함)
+        paired_filters = [f"libvmaf={self._build_libvmaf_options()}"]
+        if task.metrics.get('psnr'):
+            paired_filters.append(f"psnr=stats_file={task.psnr_stats_filename}") # 프레임별 PSNR을 파일로 기록
+        if task.metrics.get('ssim'):
+            paired_filters.append(f"ssim=stats_file={task.ssim_stats_filename}") # 프레임별 SSIM을 파일로 기록
+        use_blockdetect = bool(task.metrics.get('blockdetect')) # 블록킹 분석은 인코딩된 영상만 필요
+
+        # 각 입력을 분기할 개수 계산
+        dist_count = len(paired_filters) + (1 if use_blockdetect else 0) # 인코딩된 영상 분기 수
+        ref_count = len(paired_filters) # 원본 샘플 분기 수
+
+        dist_labels = [f"[dist{i}]" for i in range(dist_count)]
+        ref_labels = [f"[ref{i}]" for i in range(ref_count)]
+
+        # 필터 그래프 구성: 디코딩 -> 타임스탬프 정렬 -> 분기 -> 메트릭 필터
+        ts_filter = self._analysis_timestamp_filter()
+        graph_parts = [
+            f"[0:v]{ts_filter},split={dist_count}{''.join(dist_labels)}",
+            f"[1:v]{ts_filter},split={ref_count}{''.join(ref_labels)}",
+        ]
+        for i, metric_filter in enumerate(paired_filters):
+            graph_parts.append(f"{dist_labels[i]}{ref_labels[i]}{metric_filter}")
+        if use_blockdetect:
+            graph_parts.append(f"{dist_labels[-1]}blockdetect")
+
+        cmd = self._build_analysis_command_base(encoded_input)
+        cmd.extend(["-vsync", "cfr", "-filter_complex", ";".join(graph_parts), "-f", "null", "-"])
+        return cmd
+
+    def build_psnr_command(self) -> List[str]:
+        """
+        PSNR(Peak Signal-to-Noise Ratio) 계산을 위한 FFmpeg 명령어를 구성.
+
+        PSNR 분석을 위한 FFmpeg 명령어를 생성함.
+        PSNR은 원본 영상과 인코딩된 영상 간의 객관적 품질 차이를 측정하는 전통적인 품질 평가 지표임.
+
+        Returns:
+            List[str]: PSNR 분석을 위한 FFmpeg 명령어의 각 요소들을 담은 리스트
+        """
+        psnr_filter = f"psnr=stats_file={self.task.psnr_stats_filename}" # 프레임별 PSNR을 파일로 기록하는 필터
+        lavfi_filter = psnr_filter # 사용할 필터
+        if self.task.reference_path: # 디코딩된 기준 영상을 사용할 때는 프레임 번호 기준으로 정렬
+            ts_filter = self._analysis_timestamp_filter()
+            lavfi_filter = f"[0:v]{ts_filter}[dist];[1:v]{ts_filter}[ref];[dist][ref]{psnr_filter}"
+        
+        # 기본 분석 명령어에 PSNR 필터와 옵션을 추가
+        cmd = self._build_analysis_command_base()
+        cmd.extend(["-vsync", "cfr", "-filter_complex", lavfi_filter, "-f", "null", "-"])
+        return cmd
+
+    def build_ssim_command(self) -> List[str]:
+        """
+        SSIM(Structural Similarity Index) 계산을 위한 FFmpeg 명령어를 구성.
+
+        SSIM 분석을 위한 FFmpeg 명령어를 생성함.
+        SSIM은 인간의 시각 시스템이 구조적 정보에 민감하다는 특성을 반영하여
+        영상의 구조적 유사성을 측정하는 품질 평가 지표임.
+
+        Returns:
+            List[str]: SSIM 분석을 위한 FFmpeg 명령어의 각 요소들을 담은 리스트
+        """
+        ssim_filter = f"ssim=stats_file={self.task.ssim_stats_filename}" # 프레임별 SSIM을 파일로 기록하는 필터
+        lavfi_filter = ssim_filter # 사용할 필터
+        if self.task.reference_path: # 디코딩된 기준 영상을 사용할 때는 프레임 번호 기준으로 정렬
+            ts_filter = self._analysis_timestamp_filter()
+            lavfi_filter = f"[0:v]{ts_filter}[dist];[1:v]{ts_filter}[ref];[dist][ref]{ssim_filter}"
+        
+        # 기본 분석 명령어에 SSIM 필터와 옵션을 추가
+        cmd = self._build_analysis_command_base()
+        cmd.extend(["-vsync", "cfr", "-filter_complex", lavfi_filter, "-f", "null", "-"])
+        return cmd
+
+    def build_blockdetect_command(self) -> List[str]:
+        """
+        블록킹 현상(깍두기) 분석을 위한 FFmpeg 명령어를 구성.
+
+        인코딩된 영상에서 블록킹 아티팩트를 감지하기 위한 FFmpeg 명령어를 생성함.
+        블록킹은 압축 과정에서 발생할 수 있는 화질 저하 현상으로, 영상의 품질을 평가하는 중요한 지표임.
+
+        Returns:
+            List[str]: 블록킹 감지 분석을 위한 FFmpeg 명령어의 각 요소들을 담은 리스트
+        """
+        lavfi_filter = "[0:v]blockdetect[out];[out]null" # blockdetect 필터 적용
+        
+        # 블록킹 분석은 인코딩된 단일 파일에 대해서만 수행
+        cmd = [self.task.ffmpeg_path, '-y', '-hide_banner', '-loglevel', 'info',
+               '-i', os.path.basename(self.task.encoded_path),
+               "-filter_complex", lavfi_filter, "-f", "null", "-"]
+        return cmd
+
+
+
+# ==============================================================================
+# 5. 멀티프로세싱 워커 함수
+# ==============================================================================
+def find_best_crf_for_preset(preset, context: RunContext, threads: int = 0):
+    """
+    하나의 프리셋에 대해 Target VMAF를 만족하는 가장 효율적인 CRF를 탐색.
+
+    이 함수는 병렬 처리를 위해 별도의 프로세스에서 실행되며,
+    주어진 프리셋에 대해 목표 VMAF 값을 달성하는 가장 낮은 CRF 값을 찾음.
+    이진 탐색 알고리즘을 사용하여 효율적으로 최적값을 찾아내며, 각 CRF 값에 대한 인코딩 및 분석을 수행함.
+
+    Args:
+        preset: 테스트할 인코딩 프리셋 (예: 'fast', 'medium', 'slow')
+        context: 실행 전체가 공유하는 설정 (RunContext)
+        threads: 코어 예산에 따라 이 탐색에 할당된 스레드 수 (0이면 기본값)
+
+    Returns:
+        dict: 최적 CRF 값과 관련 정보를 담은 딕셔너리
+    """
+    # 초기 변수 설정
+    codec_config = CODEC_CONFIG.get(context.codec, {}) # 현재 코덱의 설정 스키마
+    min_q, max_q = codec_config.get("quality_range", (0, 51)) # 코덱별 품질 범위 가져오기
+    target_vmaf = context.target_vmaf # 목표 VMAF 값
+    tested_crfs = {} # 이미 테스트한 CRF의 결과를 캐싱하여 중복 작업을 방지하는 딕셔너리
+
+    def _test_crf(crf_to_test):
+        """
+        CRF 테스트를 수행하고 결과를 캐싱하는 헬퍼 함수.
+
+        주어진 CRF 값에 대해 인코딩 테스트를 수행하고, 결과를 캐싱하여 중복 테스트를 방지함.
+        CRF 값이 유효 범위를 벗어나는 경우 None을 반환하여 오류를 방지함.
+
+        Args:
+            crf_to_test: 테스트할 CRF 값
+
+        Returns:
+            tuple: (VMAF 점수, 테스트 결과) 또는 (None, None) (실패 시)
+        """
+        crf_to_test = int(round(crf_to_test)) # CRF 값을 정수로 반올림
+        if not (min_q <= crf_to_test <= max_q): # 품질 범위를 벗어나는 경우
+            return None, None # 유효하지 않은 CRF 값이면 None을 반환
+
+        # 이미 테스트한 CRF인 경우 캐시된 결과를 반환하여 중복 인코딩 방지
+        if crf_to_test in tested_crfs:
+            return tested_crfs[crf_to_test]
+
+        # 공유 설정에 현재 프리셋과 CRF를 결합하여 작업 객체를 생성하고 테스트한 뒤 캐시에 저장
+        tested_crfs[crf_to_test] = evaluate_target_crf(context.make_task(preset, crf_to_test, threads), target_vmaf)
+        return tested_crfs[crf_to_test]
+
+    # --- 탐색 시작 ---
+    if APP_CONFIG['target_vmaf_model_search']:
+        # 로지스틱 모델 기반 탐색: 다른 프리셋의 측정값으로 시작 구간을 예측하고, 측정값을 다른 프리셋과 공유
+        search = TargetVmafSearch(preset, context.codec, target_vmaf, load_target_vmaf_points(context.target_points_path))
+        while not search.done:
+            search.update_priors(load_target_vmaf_points(context.target_points_path)) # 그 사이 다른 프리셋이 측정한 값을 반영
+            crf_to_test = search.propose()[0]
+            vmaf_score, result = _test_crf(crf_to_test)
+            search.record(crf_to_test, vmaf_score, result)
+            if vmaf_score is not None:
+                append_target_vmaf_point(context.target_points_path, preset, crf_to_test, vmaf_score)
+        best_result_for_preset = search.best_result
+    else:
+        best_result_for_preset = _search_crf_by_interpolation(_test_crf, min_q, max_q, target_vmaf)
+
+    # 순차 검정으로 판정만 확정된 결과가 선택된 경우, 모든 메트릭을 담은 최종 결과를 위해 전체 분석을 수행
+    if best_result_for_preset is not None and best_result_for_preset.get("status") == "screened":
+        full_result = perform_one_test(context.make_task(preset, best_result_for_preset["crf"], threads))
+        best_result_for_preset = full_result if full_result.get("status") == "success" else None
+
+    return best_result_for_preset # 최종적으로 찾은 최적의 결과를 반환
+
+
+# Target VMAF 탐색에서 CRF 하나를 테스트하는 함수
+def evaluate_target_crf(task: EncodingTask, target_vmaf: float, allow_screening: bool = True) -> Tuple[Any, Any]:
+    """
+    Target VMAF 탐색의 CRF 하나를 테스트하여 VMAF 점수와 결과를 반환.
+
+    순차 검정이 활성화된 경우 인코딩 후 일부 프레임만 먼저 분석하여, 목표와의 대소가 확실하면 전체 분석을 생략하고
+    판정만 확정된 'screened' 결과를 반환함. 판정할 수 없으면 같은 인코딩 결과로 전체 분석을 이어서 실행함.
+
+    Args:
+        task: 테스트할 작업
+        target_vmaf: 목표 VMAF 값
+        allow_screening: False이면 순차 검정 없이 항상 전체 분석을 수행 (최종 결과를 만들 때 사용)
+
+    Returns:
+        tuple: (VMAF 점수, 결과 딕셔너리) 또는 실패/취소 시 (None, 결과 딕셔너리 또는 None)
+    """
+    def discard_encode_outputs():
+        """판정이 끝났거나 취소되어 더 이상 분석하지 않을 인코딩 결과 파일을 삭제."""
+        for p in (task.encoded_path, task.psnr_stats_path, task.ssim_stats_path):
+            if os.path.exists(p):
+                try:
+                    os.remove(p)
+                except OSError:
+                    logging.warning(f"Could not remove temporary file: {p}")
+
+    def cancelled() -> bool:
+        """인코딩이 끝난 뒤 메인 프로세스가 이 작업을 취소했는지 확인 (인코딩 중에는 DominanceWatcher가 확인함)."""
+        if not (task.cancellable and os.path.exists(task.cancel_flag_path)):
+            return False
+        discard_encode_outputs()
+        return True
+
+    if allow_screening and APP_CONFIG['target_vmaf_sequential_test']:
+        # 순차 검정: 인코딩 후 일부 프레임만 분석하여 목표와의 대소가 확실하면 전체 분석을 생략
+        encode_state = perform_one_test(task, stage="encode")
+        if encode_state.get("status") == "success": # 결과 캐시에 같은 입력의 전체 결과가 있는 경우
+            return encode_state.get("vmaf", 0), encode_state
+        if encode_state.get("status") != "encoded": # 인코딩 실패 또는 취소
+            return None, encode_state
+        cancelled_result = {"status": "cancelled", "preset": task.preset, "crf": task.crf,
+                            "message": f"Cancelled (Preset: {task.preset}, CRF: {task.crf}): no longer needed by the search"}
+        if cancelled(): # 인코딩이 끝난 뒤 취소된 경우 분석 없이 슬롯을 반환
+            return None, cancelled_result
+        decision, screened_vmaf = screen_vmaf_against_target(task, target_vmaf)
+        if decision != 0:
+            discard_encode_outputs()
+            # 판정만 확정된 결과 (최적 결과로 선택되면 탐색 후 전체 분석을 다시 수행)
+            return screened_vmaf, {"status": "screened", "preset": task.preset, "crf": task.crf, "vmaf": screened_vmaf}
+        if cancelled(): # 부분 분석 중에 취소된 경우 전체 분석을 생략
+            return None, cancelled_result
+        result = perform_one_test(task, stage="analyze", encode_state=encode_state) # 판정할 수 없으면 전체 분석
+    else:
+        # 실제 인코딩 및 분석 작업을 수행
+        result = perform_one_test(task)
+
+    if result.get("status") == "success":
+        return result.get("vmaf", 0), result
+    return None, result
+
+# 품질 범위의 양 끝에서 시작하는 보간 탐색 함수 (모델 기반 탐색을 사용하지 않는 경우)
+def _search_crf_by_interpolation(_test_crf, min_q: int, max_q: int, target_vmaf: float):
+    """
+    품질 범위의 양 끝을 먼저 테스트한 뒤 선형 보간과 이진 탐색으로 목표 VMAF를 만족하는 가장 높은 CRF를 탐색.
+
+    Args:
+        _test_crf: CRF를 받아 (VMAF 점수, 결과)를 반환하는 테스트 함수
+        min_q: 품질 범위 하한
+        max_q: 품질 범위 상한
+        target_vmaf: 목표 VMAF 값
+
+    Returns:
+        dict: 목표를 만족하는 결과 중 가장 높은 CRF의 결과 또는 None
+    """
+    # 1. 경계 조건 탐색: 품질 범위의 양 끝 값을 먼저 테스트하여 탐색이 유효한지 확인
+    best_result_for_preset = None # 현재 프리셋에서 찾은 최적의 결과
+    v_low, res_low = _test_crf(max_q) # 가장 낮은 품질(가장 높은 CRF) 테스트
+    v_high, res_high = _test_crf(min_q) # 가장 높은 품질(가장 낮은 CRF) 테스트
+
+    # 경계값 테스트 결과가 이미 목표 VMAF를 만족하는 경우, 해당 결과를 최적 결과로 간주할 수 있음
+    if v_high is not None and v_high >= target_vmaf: # 가장 높은 품질 설정이 목표를 만족하면
+        best_result_for_preset = res_high # 이를 현재까지의 최적 결과로 설정
+    if v_low is not None and v_low >= target_vmaf: # 가장 낮은 품질 설정조차 목표를 만족하면 (매우 드문 경우)
+        best_result_for_preset = res_low # 이를 최적 결과로 갱신 (더 효율적이므로)
+
+    # 가장 높은 품질로도 목표 VMAF에 도달할 수 없다면, 더 이상 탐색은 무의미
+    if v_high is None or v_high < target_vmaf:
+        return None # 탐색을 시작하기 전에 목표 달성이 불가능하다고 판단되면 None을 반환
+
+    # 2. 이진/보간 탐색 루프
+    low_q, high_q = min_q, max_q # 탐색 범위 초기화
+    max_iterations = 10 # 불필요한 무한 루프를 방지하기 위한 최대 반복 횟수
+
+    for it in range(max_iterations):
+        # 탐색 범위가 충분히 좁혀지면 루프 종료
+        if high_q - low_q <= 1:
+            break
+
+        # 다음으로 테스트할 중간 CRF 값을 계산 (선형 보간 우선)
+        mid_q = -1 # 중간값 초기화
+        if v_high is not None and v_low is not None:
+            v_diff = abs(v_high - v_low) # 현재 VMAF 범위
+            
+            # VMAF 범위가 유의미할 경우, 선형 보간법으로 다음 CRF 값을 예측하여 수렴 속도 향상
+            if v_diff > max(APP_CONFIG['numerical_tolerance']['relative'] * max(abs(v_high), abs(v_low)), APP_CONFIG['numerical_tolerance']['absolute']):
+                mid_q = high_q + (low_q - high_q) * (target_vmaf - v_low) / (v_high - v_low)
+
+        # 선형 보간이 실패했거나 불안정한 값을 반환한 경우, 안전한 이진 탐색 중앙값으로 대체
+        if mid_q <= low_q or mid_q >= high_q:
+            mid_q = low_q + (high_q - low_q) * 0.5
+
+        # 계산된 중간값으로 CRF 테스트 실행
+        v_mid, res_mid = _test_crf(mid_q)
+
+        # 테스트 결과를 바탕으로 탐색 범위 업데이트
+        if v_mid is not None: # 테스트가 성공한 경우
+            if v_mid >= target_vmaf: # 목표 VMAF를 만족한 경우
+                best_result_for_preset = res_mid # 이 결과를 최적 후보로 업데이트
+                low_q = int(round(mid_q)) # 탐색 하한을 높여 더 효율적인(높은) CRF를 찾도록 함
+                v_high = v_mid # VMAF 상한값 업데이트
+            else: # 목표 VMAF를 만족하지 못한 경우
+                high_q = int(round(mid_q)) # 탐색 상한을 낮춰 더 높은 품질(낮은 CRF)을 찾도록 함
+                v_low = v_mid # VMAF 하한값 업데이트
+        else: # 테스트가 실패한 경우 (예: 인코딩 오류)
+            high_q = int(round(mid_q)) # 실패한 구간을 피하기 위해 탐색 상한을 낮춤
+
+    return best_result_for_preset # 최종적으로 찾은 최적의 결과를 반환
+
+
+# Target VMAF 탐색에서 프리셋 간에 측정값을 공유하는 함수들
+def load_target_vmaf_points(points_path: str) -> List[Dict[str, Any]]:
+    """
+    다른 프리셋의 탐색에서 측정한 (프리셋, CRF, VMAF) 기록을 읽음.
+
+    Args:
+        points_path: 공유 JSONL 파일 경로 (비어 있거나 파일이 없으면 빈 목록)
+
+    Returns:
+        List[Dict[str, Any]]: {'preset', 'crf', 'vmaf'} 딕셔너리 목록
+    """
+    if not points_path:
+        return []
+    points = []
+    try:
+        with open(points_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    points.append(json.loads(line))
+                except ValueError: # 다른 프로세스가 기록 중인 마지막 줄은 건너뜀
+                    continue
+    except OSError:
+        return []
+    return points
+
+def append_target_vmaf_point(points_path: str, preset: str, crf: int, vmaf: float):
+    """
+    측정한 (프리셋, CRF, VMAF)를 공유 JSONL 파일에 한 줄로 추가.
+
+    한 줄 단위의 추가 쓰기는 여러 워커 프로세스가 동시에 기록해도 줄이 섞이지 않음.
+
+    Args:
+        points_path: 공유 JSONL 파일 경로 (비어 있으면 기록하지 않음)
+        preset: 측정한 프리셋
+        crf: 측정한 품질 값
+        vmaf: 측정한 VMAF 점수
+    """
+    if not points_path:
+        return
+    try:
+        with open(points_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"preset": preset, "crf": crf, "vmaf": vmaf}) + "\n")
+    except OSError as e:
+        logging.warning(f"Could not record Target VMAF point: {e}")
+
+# 로지스틱 모델로 목표 VMAF를 만족하는 CRF를 찾는 탐색 클래스
+class TargetVmafSearch:
+    """
+    하나의 프리셋에 대해 목표 VMAF를 만족하는 가장 높은 CRF를 로지스틱 모델로 탐색하는 클래스.
+
+    VMAF는 품질 값(CRF)에 대해 단조 감소하는 S자 곡선에 가까우므로, logit(VMAF/100)을 CRF의 1차 함수로 근사함
+    (ln(100/VMAF - 1) = a + b * CRF, b > 0). 이 프리셋의 측정값이 2개 미만이면 같은 원본에서 다른 프리셋이 측정한 값으로
+    곡선을 예측하여 시작 지점을 고르므로, 품질 범위의 양 끝(특히 가장 느리고 큰 CRF 0 인코딩)을 테스트할 필요가 없음.
+    통과(목표 이상)한 가장 높은 CRF와 실패한 가장 낮은 CRF로 구간을 유지하며, 모델 예측이 구간을 벗어나거나
+    같은 쪽으로만 연속해서 좁혀지면 구간의 중앙값을 사용하여 수렴을 보장함.
+    propose(k)로 여러 후보를 한 번에 받을 수 있어 병렬 탐색에도 사용됨. 실행 중인 후보(start로 등록)는 다시 제안하지 않으며,
+    추가 후보는 실행 중인 후보와 구간 경계로부터 가장 먼 지점을 골라 구간을 k등분에 가깝게 나누도록 함 (k-ary 구간 탐색).
+    """
+
+    def __init__(self, preset: str, codec: str, target_vmaf: float, shared_points: List[Dict[str, Any]] = None):
+        """
+        TargetVmafSearch 객체를 초기화.
+
+        Args:
+            preset: 탐색할 프리셋
+            codec: 코덱 이름 (품질 범위 조회용)
+            target_vmaf: 목표 VMAF 값
+            shared_points: 같은 실행에서 다른 프리셋이 측정한 {'preset', 'crf', 'vmaf'} 목록
+        """
+        self.preset = preset
+        self.target_vmaf = target_vmaf
+        self.min_q, self.max_q = CODEC_CONFIG.get(codec, {}).get("quality_range", (0, 51))
+        self.tested = {} # {CRF: VMAF 또는 None(실패)}
+        self.results = {} # {CRF: 결과 딕셔너리}
+        self.pass_q = None # 목표를 만족한 가장 높은 CRF
+        self.fail_q = None # 목표를 만족하지 못한(또는 실패한) 가장 낮은 CRF
+        self.last_sides = [] # 최근 측정 결과가 구간의 어느 쪽을 좁혔는지 ('pass' 또는 'fail')
+        self.in_flight = set() # 테스트가 시작되었지만 아직 결과가 기록되지 않은 CRF
+        self.prior_points = []
+        self.update_priors(shared_points or [])
+
+    @staticmethod
+    def _logit(vmaf: float) -> float:
+        """VMAF를 ln(100/VMAF - 1)로 변환 (0과 100 근처는 잘라서 무한대를 방지)."""
+        v = min(max(vmaf, 1.0), 99.9)
+        return math.log(100.0 / v - 1.0)
+
+    def update_priors(self, shared_points: List[Dict[str, Any]]):
+        """
+        다른 프리셋이 측정한 값을 사전 정보로 갱신.
+
+        Args:
+            shared_points: {'preset', 'crf', 'vmaf'} 목록 (이 프리셋의 기록은 무시)
+        """
+        self.prior_points = [(p["crf"], p["vmaf"]) for p in shared_points if p.get("preset") != self.preset]
+
+    def _fit(self, points) -> Tuple[float, float]:
+        """
+        (CRF, VMAF) 점들에 logit 선형 모델을 최소제곱으로 적합.
+
+        Args:
+            points: (CRF, VMAF) 목록
+
+        Returns:
+            Tuple[float, float]: (절편 a, 기울기 b). 기울기를 추정할 수 없으면 b는 None
+        """
+        xs = [q for q, _ in points]
+        ys = [self._logit(v) for _, v in points]
+        n = len(points)
+        mean_x, mean_y = sum(xs) / n, sum(ys) / n
+        var_x = sum((x - mean_x) ** 2 for x in xs)
+        if var_x <= 0:
+            return mean_y, None
+        slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+        return mean_y - slope * mean_x, (slope if slope > 0 else None)
+
+    def predict_crf(self) -> float:
+        """
+        현재 모델로 목표 VMAF에 해당하는 CRF를 예측.
+
+        Returns:
+            float: 예측 CRF (품질 범위로 제한하지 않은 값)
+        """
+        span = max(self.max_q - self.min_q, 1)
+        slope = APP_CONFIG['target_vmaf_default_slope'] / span # 측정값이 없을 때의 기본 기울기
+        target_y = self._logit(self.target_vmaf)
+        own = [(q, v) for q, v in self.tested.items() if v is not None]
+
+        # 기울기: 이 프리셋의 측정값 -> 다른 프리셋의 측정값 -> 기본값 순으로 사용
+        own_slope = self._fit(own)[1] if len(own) >= 2 else None
+        prior_slope = self._fit(self.prior_points)[1] if len(self.prior_points) >= 2 else None
+        slope = own_slope or prior_slope or slope
+
+        # 절편: 이 프리셋의 측정값이 있으면 그 점들을 지나도록, 없으면 다른 프리셋의 측정값 또는 기본 시작 지점을 사용
+        anchor = own or self.prior_points
+        if anchor:
+            intercept = sum(self._logit(v) - slope * q for q, v in anchor) / len(anchor)
+        else:
+            initial_q = self.min_q + APP_CONFIG['target_vmaf_initial_guess'] * span
+            intercept = target_y - slope * initial_q
+        return (target_y - intercept) / slope
+
+    @property
+    def done(self) -> bool:
+        """탐색이 끝났는지 여부 (구간이 1 이하로 좁혀졌거나, 범위의 끝에서 결론이 났거나, 최대 횟수에 도달)."""
+        if len(self.tested) >= APP_CONFIG['target_vmaf_max_probes']:
+            return True
+        if self.pass_q is not None and self.pass_q >= self.max_q: # 가장 낮은 품질도 목표를 만족
+            return True
+        if self.fail_q is not None and self.fail_q <= self.min_q: # 가장 높은 품질로도 목표에 도달할 수 없음
+            return True
+        if self.pass_q is not None and self.fail_q is not None and self.fail_q - self.pass_q <= 1:
+            return True
+        return not self.in_flight and not self._open_range()
+
+    def _bounds(self) -> Tuple[int, int]:
+        """현재 구간에서 테스트할 가치가 있는 CRF의 (하한, 상한)을 반환."""
+        low = self.pass_q + 1 if self.pass_q is not None else self.min_q
+        high = self.fail_q - 1 if self.fail_q is not None else self.max_q
+        return max(low, self.min_q), min(high, self.max_q)
+
+    def _open_range(self) -> List[int]:
+        """현재 구간 안에서 아직 테스트하지 않았고 실행 중이지도 않은 CRF 목록을 반환."""
+        low, high = self._bounds()
+        return [q for q in range(low, high + 1) if q not in self.tested and q not in self.in_flight]
+
+    def propose(self, count: int = 1) -> List[int]:
+        """
+        다음에 테스트할 CRF 후보를 최대 count개 제안.
+
+        실행 중인 후보가 없으면 첫 후보는 모델 예측값(구간 안으로 제한)이며, 같은 쪽으로만 연속해서 좁혀진 경우에는 구간의 중앙값을 사용함.
+        나머지 후보는 실행 중이거나 이미 고른 후보 및 구간 경계로부터 가장 먼 CRF를 차례로 골라(거리가 같으면 예측값에 가까운 쪽),
+        어느 결과가 나오든 구간이 크게 줄어들도록 함.
+
+        Args:
+            count: 제안할 후보 수
+
+        Returns:
+            List[int]: 아직 테스트하지 않았고 실행 중이지도 않은 CRF 목록 (더 제안할 후보가 없으면 빈 목록)
+        """
+        candidates = self._open_range()
+        if not candidates or self.done:
+            return []
+        low, high = self._bounds()
+        stalled = len(self.last_sides) >= 2 and self.last_sides[-1] == self.last_sides[-2] and self.pass_q is not None and self.fail_q is not None
+        if stalled:
+            center = (low + high) / 2
+        else:
+            center = min(max(self.predict_crf(), low), high)
+
+        proposals = []
+        if not self.in_flight:
+            proposals.append(min(candidates, key=lambda q: abs(q - center)))
+        anchors = [low - 1, high + 1] + sorted(self.in_flight) # 구간 경계 바깥과 실행 중인 후보는 이미 구간을 나누고 있음
+        while len(proposals) < count:
+            remaining = [q for q in candidates if q not in proposals]
+            if not remaining:
+                break
+            taken = anchors + proposals
+            proposals.append(max(remaining, key=lambda q: (min(abs(q - a) for a in taken), -abs(q - center))))
+        return proposals
+
+    def start(self, crf: int):
+        """주어진 CRF의 테스트가 시작되었음을 기록 (결과가 기록될 때까지 다시 제안하지 않음)."""
+        self.in_flight.add(crf)
+
+    def abandon(self, crf: int):
+        """취소되어 결과 없이 끝난 CRF를 실행 중 목록에서 제거 (필요하면 나중에 다시 제안될 수 있음)."""
+        self.in_flight.discard(crf)
+
+    def is_relevant(self, crf: int) -> bool:
+        """주어진 CRF가 아직 현재 구간 안에 있어 테스트할 가치가 있는지 여부."""
+        if self.pass_q is not None and crf <= self.pass_q:
+            return False
+        if self.fail_q is not None and crf >= self.fail_q:
+            return False
+        return True
+
+    def record(self, crf: int, vmaf, result):
+        """
+        CRF 테스트 결과를 기록하고 구간을 갱신.
+
+        Args:
+            crf: 테스트한 CRF
+            vmaf: 측정한 VMAF 점수 (실패한 경우 None)
+            result: 테스트 결과 딕셔너리 (실패한 경우 None)
+        """
+        self.in_flight.discard(crf)
+        self.tested[crf] = vmaf
+        if vmaf is not None and vmaf >= self.target_vmaf:
+            self.results[crf] = result
+            if self.pass_q is None or crf > self.pass_q:
+                self.pass_q = crf
+            self.last_sides.append('pass')
+        else: # 목표 미달 또는 실패 (실패한 구간은 피하도록 상한을 낮춤)
+            if self.fail_q is None or crf < self.fail_q:
+                self.fail_q = crf
+            self.last_sides.append('fail')
+        if self.pass_q is not None and self.fail_q is not None and self.pass_q > self.fail_q:
+            self.fail_q = self.pass_q + 1 # 측정 잡음으로 단조성이 깨진 경우 통과한 결과를 우선
+
+    @property
+    def best_result(self):
+        """목표를 만족한 가장 높은 CRF의 결과 (없으면 None)."""
+        return self.results.get(self.pass_q) if self.pass_q is not None else None
+
+
+# 지배당하는 인코딩이 조기 중단되었음을 알리는 예외
+class EncodePruned(Exception):
+    """진행 중인 인코딩이 이미 완료된 결과에 의해 지배당하는 것이 확정되어 중단되었을 때 발생하는 예외."""
+
+
+# 진행 중인 인코딩이 완료된 결과에 의해 지배당하는지 감시하는 클래스
+class DominanceWatcher:
+    """
+    진행 중인 인코딩의 출력 크기를 완료된 결과들과 비교하여, 파레토 프론트에 들어갈 수 없는 작업을 판별하는 클래스.
+
+    인코딩 결과의 크기는 진행될수록 늘어나기만 하므로, 지금까지 기록된 바이트 수가 이미 어떤 완료된 결과보다 크다면
+    최종 크기도 그보다 큼. 이 작업의 품질 상한은 같은 프리셋에서 CRF가 같거나 낮은(고품질) 완료된 결과의 메트릭으로 잡음
+    (같은 프리셋에서 CRF를 높이면 품질이 떨어진다는 가정). 그런 결과가 없으면 메트릭의 이론적 상한(VMAF 100, SSIM 1)을 사용함.
+    크기가 더 작으면서 모든 메트릭이 이 상한 이상인 완료된 결과가 있으면, 이 작업은 파레토 프론트에 들어갈 수 없음.
+    완료된 결과 목록은 메인 프로세스가 결과를 받을 때마다 갱신하는 JSON 파일에서 읽음.
+    취소 가능한 작업(cancellable)은 메인 프로세스가 취소 표시 파일을 만들면 지배 여부와 관계없이 중단함.
+    """
+
+    def __init__(self, task: EncodingTask):
+        """
+        DominanceWatcher 객체를 초기화.
+
+        Args:
+            task: 감시할 인코딩 작업 (prune_frontier_path, metrics, cancellable을 사용)
+        """
+        self.task = task
+        self.frontier = [] # 완료된 결과 목록 (크기와 메트릭)
+        self.frontier_mtime = None # 마지막으로 읽은 결과 파일의 수정 시각
+        self.last_check = 0.0 # 마지막 확인 시각 (monotonic)
+        self.pruned_by = None # 이 작업을 지배한 결과 (중단되지 않았으면 None)
+        self.cancelled = False # 메인 프로세스의 취소 표시로 중단되었는지 여부
+
+    def _reload_frontier(self):
+        """결과 파일이 갱신된 경우에만 다시 읽음."""
+        try:
+            mtime = os.path.getmtime(self.task.prune_frontier_path)
+        except OSError:
+            return
+        if mtime == self.frontier_mtime:
+            return
+        try:
+            with open(self.task.prune_frontier_path, 'r', encoding='utf-8') as f:
+                self.frontier = json.load(f)
+            self.frontier_mtime = mtime
+        except (OSError, ValueError): # 메인 프로세스가 교체하는 중이면 다음 확인 때 다시 읽음
+            pass
+
+    @property
+    def aborted(self) -> bool:
+        """지배당하거나 취소되어 작업을 중단해야 하는지 여부."""
+        return self.cancelled or self.pruned_by is not None
+
+    def should_abort(self, encoded_bytes: int) -> bool:
+        """
+        지금까지 기록된 바이트 수 기준으로 이 작업을 중단해야 하는지 확인 (취소 표시 또는 지배 여부).
+
+        확인 간격(prune_poll_interval)보다 자주 호출되면 이전 판단을 그대로 반환함.
+
+        Args:
+            encoded_bytes: 지금까지 기록된 인코딩 결과의 바이트 수
+
+        Returns:
+            bool: 중단해야 하는 것이 확정되면 True
+        """
+        if self.aborted:
+            return True
+        now = time.monotonic()
+        if now - self.last_check < APP_CONFIG['prune_poll_interval']:
+            return False
+        self.last_check = now
+        if self.task.cancellable and os.path.exists(self.task.cancel_flag_path):
+            self.cancelled = True
+            return True
+        if not self.task.prune_frontier_path:
+            return False
+        return self._is_dominated(encoded_bytes)
+
+    def _is_dominated(self, encoded_bytes: int) -> bool:
+        """
+        지금까지 기록된 바이트 수 기준으로 이 작업이 완료된 결과에 의해 지배당하는지 확인.
+
+        Args:
+            encoded_bytes: 지금까지 기록된 인코딩 결과의 바이트 수
+
+        Returns:
+            bool: 지배당하는 것이 확정되면 True
+        """
+        self._reload_frontier()
+        if not self.frontier:
+            return False
+
+        # 이 작업의 메트릭 상한 (높을수록 좋은 메트릭) 및 하한 (블록 점수)
+        higher_metrics = ['vmaf', 'vmaf_1_low'] + [m for m in ('psnr', 'ssim') if self.task.metrics.get(m)]
+        check_block = bool(self.task.metrics.get('blockdetect'))
+        upper = {'vmaf': 100.0, 'vmaf_1_low': 100.0, 'ssim': 1.0, 'psnr': float('inf')}
+        block_lower = 0.0
+        same_preset = [r for r in self.frontier if r['preset'] == self.task.preset and r['crf'] <= self.task.crf]
+        if same_preset:
+            reference = max(same_preset, key=lambda r: r['crf']) # 가장 가까운 고품질 결과가 가장 좁은 상한을 줌
+            upper = {m: reference[m] for m in higher_metrics}
+            block_lower = reference['block_score']
+
+        for r in self.frontier:
+            if r['size_bytes'] >= encoded_bytes:
+                continue
+            if all(r[m] >= upper[m] for m in higher_metrics) and (not check_block or r['block_score'] <= block_lower):
+                self.pruned_by = r
+                return True
+        return False
+
+    def watch_process(self, process: subprocess.Popen):
+        """
+        파일로 인코딩 중인 프로세스의 진행 보고(-progress)를 읽으며 출력 크기를 확인하고, 지배당하거나 취소되면 프로세스를 종료.
+
+        Matroska 먹서는 클러스터 단위로 파일에 기록하므로 파일 크기 대신 진행 보고의 total_size를 사용함.
+        별도 스레드에서 실행되며 프로세스의 표준 출력이 닫히면 반환함.
+
+        Args:
+            process: 감시할 인코딩 프로세스 (표준 출력이 -progress 보고에 연결되어 있어야 함)
+        """
+        for line in process.stdout:
+            if not line.startswith("total_size="):
+                continue
+            try:
+                encoded_bytes = int(line.split("=", 1)[1])
+            except ValueError: # 값이 없는 경우 ('N/A')
+                continue
+            if self.should_abort(encoded_bytes):
+                process.kill()
+                break
+        for _ in process.stdout: # 남은 출력을 비워 프로세스가 표준 출력에서 막히지 않도록 함
+            pass
+
+
+# 인코더 출력을 분석 프로세스로 중계하는 함수
+def _relay_encoder_to_analysis(encode_cmd: List[str], analysis_cmd: List[str], cwd: str, should_abort=None) -> Dict[str, Any]:
+    """
+    인코더의 표준 출력을 분석 프로세스의 표준 입력으로 중계하며 전달된 바이트 수를 계산.
+
+    인코딩된 스트림을 임시 파일로 쓰고 다시 읽는 대신, 두 FFmpeg 프로세스를 파이프로 연결함.
+    중계 과정에서 누적한 바이트 수가 인코딩 결과의 크기가 되므로 디스크 I/O 없이 size_mb를 구할 수 있음.
+    두 프로세스의 stderr는 파이프 버퍼가 가득 차 교착 상태에 빠지지 않도록 별도 스레드에서 읽음.
+
+    Args:
+        encode_cmd: 표준 출력으로 스트림을 내보내는 인코딩 명령어
+        analysis_cmd: 표준 입력에서 인코딩된 스트림을 읽는 분석 명령어
+        cwd: 두 프로세스의 작업 디렉토리
+        should_abort: 지금까지 전달된 바이트 수를 받아 True를 반환하면 두 프로세스를 중단하는 함수 (선택)
+
+    Returns:
+        dict: 종료 코드('encode_rc', 'analysis_rc'), 전달 바이트 수('bytes'),
+              각 프로세스의 로그('encode_stderr', 'analysis_stderr'), 분석 측 파이프 조기 종료 여부('broken_pipe'),
+              should_abort에 의해 중단되었는지 여부('aborted')
+    """
+    startupinfo = _get_subprocess_startupinfo()
+    encoder = subprocess.Popen(encode_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd, startupinfo=startupinfo)
+    try:
+        analyzer = subprocess.Popen(analysis_cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, cwd=cwd, startupinfo=startupinfo)
+    except OSError:
+        encoder.kill() # 분석 프로세스를 시작하지 못하면 인코더도 정리
+        encoder.wait()
+        raise
+
+    stderr_chunks = {"encode": [], "analysis": []} # 각 프로세스의 stderr 출력을 모을 버퍼
+
+    def _drain(stream, key):
+        for chunk in iter(lambda: stream.read(8192), b""):
+            stderr_chunks[key].append(chunk)
+
+    drain_threads = [
+        threading.Thread(target=_drain, args=(encoder.stderr, "encode"), daemon=True),
+        threading.Thread(target=_drain, args=(analyzer.stderr, "analysis"), daemon=True),
+    ]
+    for t in drain_threads:
+        t.start()
+
+    # 인코더 출력을 읽어 분석 프로세스에 전달하며 바이트 수를 누적
+    total_bytes = 0
+    broken_pipe = False
+    aborted = False
+    buffer_size = APP_CONFIG.get("pipe_buffer_size", 1024 * 1024)
+    try:
+        for chunk in iter(lambda: encoder.stdout.read1(buffer_size), b""): # 도착한 만큼 바로 전달 (최대 buffer_size)
+            total_bytes += len(chunk)
+            if should_abort and should_abort(total_bytes): # 더 진행할 필요가 없는 작업은 두 프로세스 모두 중단
+                aborted = True
+                encoder.kill()
+                analyzer.kill()
+                break
+            try:
+                analyzer.stdin.write(chunk)
+            except (BrokenPipeError, OSError): # 분석 프로세스가 먼저 종료된 경우
+                broken_pipe = True
+                encoder.kill()
+                break
+    finally:
+        try:
+            analyzer.stdin.close() # EOF를 전달하여 분석 프로세스가 마무리하도록 함
+        except OSError:
+            broken_pipe = True
+        encoder.stdout.close()
+        encode_rc = encoder.wait()
+        analysis_rc = analyzer.wait()
+        for t in drain_threads:
+            t.join()
+
+    return {
+        "encode_rc": encode_rc, "analysis_rc": analysis_rc, "bytes": total_bytes,
+        "encode_stderr": b"".join(stderr_chunks["encode"]).decode('utf-8', errors='ignore'),
+        "analysis_stderr": b"".join(stderr_chunks["analysis"]).decode('utf-8', errors='ignore'),
+        "broken_pipe": broken_pipe, "aborted": aborted,
+    }
+
+
+# libvmaf CSV 로그에서 프레임별 VMAF 점수를 읽는 함수
+def read_vmaf_frame_scores(log_path: str) -> Tuple[array, float, float]:
+    """
+    libvmaf의 CSV 로그를 한 줄씩 읽어 프레임별 VMAF 점수만 압축 배열로 수집하고, 평균과 표준편차를 한 번의 순회로 계산.
+
+    JSON 로그는 모든 프레임의 모든 특징값을 담고 있어 전체를 메모리에 파싱해야 하지만,
+    CSV 로그는 줄 단위로 필요한 'vmaf' 열만 읽을 수 있어 긴 샘플에서도 CPU 시간과 메모리 사용량이 작음.
+    평균과 표준편차는 Welford 알고리즘으로 읽는 동시에 누적하여 별도의 순회가 필요 없음.
+
+    Args:
+        log_path (str): libvmaf가 log_fmt=csv로 기록한 로그 파일 경로
+
+    Returns:
+        Tuple[array, float, float]: (프레임별 VMAF 점수 배열, 평균, 표본 표준편차). 프레임이 2개 미만이면 표준편차는 0.0
+    """
+    scores = array('d') # 프레임별 VMAF 점수 (8바이트 실수 배열)
+    mean, m2 = 0.0, 0.0 # Welford 알고리즘의 누적 평균과 편차 제곱합
+
+    with open(log_path, 'r', encoding='utf-8') as f:
+        header = f.readline().rstrip('\r\n').split(',') # 첫 줄: Frame,integer_adm2,...,vmaf,
+        vmaf_column = header.index('vmaf') # 'vmaf' 열의 위치
+        for line in f:
+            fields = line.split(',')
+            if len(fields) <= vmaf_column: # 비어 있거나 잘린 줄은 무시
+                continue
+            score = float(fields[vmaf_column])
+            scores.append(score)
+            delta = score - mean
+            mean += delta / len(scores)
+            m2 += delta * (score - mean)
+
+    std_dev = math.sqrt(m2 / (len(scores) - 1)) if len(scores) >= 2 else 0.0
+    return scores, mean, std_dev
+
+# 하위 1% 프레임의 평균 VMAF를 계산하는 함수
+def vmaf_one_percent_low(frame_scores) -> float:
+    """
+    가장 낮은 1% 프레임들의 평균 VMAF 점수를 계산.
+
+    전체 점수를 정렬하지 않고, 필요한 개수만큼의 최솟값만 힙으로 선택하여 O(n log k) 시간에 계산함.
+    하위 1%의 개수는 기존과 동일하게 int(프레임 수 * 0.01) + 1개로 정의함.
+
+    Args:
+        frame_scores: 프레임별 VMAF 점수 시퀀스
+
+    Returns:
+        float: 하위 1% 프레임의 평균 VMAF 점수 (점수가 없으면 0.0)
+    """
+    if not frame_scores:
+        return 0.0
+    lowest = heapq.nsmallest(int(len(frame_scores) * 0.01) + 1, frame_scores) # 하위 1%에 해당하는 점수들만 선택
+    return sum(lowest) / len(lowest)
+
+# 프레임 일부의 VMAF 점수로 목표 VMAF와의 대소를 판정하는 함수
+def sequential_vmaf_decision(frame_scores, target_vmaf: float) -> int:
+    """
+    일정 간격으로 추출한 프레임 VMAF 점수로 전체 평균이 목표보다 확실히 높거나 낮은지 판정.
+
+    인접한 프레임의 점수는 서로 강하게 상관되어 있으므로, 점수를 연속된 묶음으로 나눈 뒤 묶음 평균들의 분산으로
+    평균의 표준오차를 추정함(batch means). 평균이 목표에서 표준오차의 임계 배수 이상 떨어져 있을 때만 판정을 확정함.
+
+    Args:
+        frame_scores: 프레임 순서대로 정렬된 VMAF 점수들
+        target_vmaf: 목표 VMAF 값
+
+    Returns:
+        int: 확실히 높으면 1, 확실히 낮으면 -1, 판정할 수 없으면 0
+    """
+    batches = APP_CONFIG['sequential_test_batches']
+    n = len(frame_scores)
+    if batches < 2 or n < batches * 2: # 묶음마다 최소 2개 프레임이 없으면 표준오차를 믿을 수 없음
+        return 0
+    size = n // batches
+    means = [sum(frame_scores[i * size:(i + 1) * size]) / size for i in range(batches)]
+    mean = sum(frame_scores) / n
+    grand = sum(means) / batches
+    std_err = math.sqrt(sum((m - grand) ** 2 for m in means) / (batches - 1) / batches)
+    margin = APP_CONFIG['sequential_test_critical_value'] * std_err
+    if mean - margin > target_vmaf:
+        return 1
+    if mean + margin < target_vmaf:
+        return -1
+    return 0
+
+# 인코딩된 결과를 프레임 일부만으로 목표 VMAF와 비교하는 함수
+def screen_vmaf_against_target(task: EncodingTask, target_vmaf: float) -> Tuple[int, float]:
+    """
+    인코딩 결과 파일에 대해 일정 간격의 프레임만 VMAF를 계산하여 목표 대비 판정을 수행.
+
+    Args:
+        task: 인코딩 결과 파일이 존재하는 작업
+        target_vmaf: 목표 VMAF 값
+
+    Returns:
+        Tuple[int, float]: (sequential_vmaf_decision의 판정, 추출한 프레임의 평균 VMAF). 분석에 실패하면 (0, 0.0)
+    """
+    cmd = FFmpegCommandBuilder(task).build_vmaf_command(subsample=APP_CONFIG['sequential_test_subsample'])
+    try:
+        subprocess.run(cmd, check=True, capture_output=True, startupinfo=_get_subprocess_startupinfo(), cwd=task.temp_dir)
+        frame_scores, mean, _ = read_vmaf_frame_scores(task.vmaf_log_path)
+    except (subprocess.CalledProcessError, OSError, ValueError) as e:
+        logging.warning(f"Subsampled VMAF screening failed (Preset: {task.preset}, CRF: {task.crf}): {e}")
+        return 0, 0.0
+    finally:
+        if os.path.exists(task.vmaf_log_path):
+            try:
+                os.remove(task.vmaf_log_path)
+            except OSError:
+                pass
+    return sequential_vmaf_decision(frame_scores, target_vmaf), mean
+
+# PSNR/SSIM 필터의 통계 파일에서 프레임별 값을 읽는 함수
+def read_stats_file_series(stats_path: str, key: str) -> array:
+    """
+    psnr/ssim 필터가 stats_file로 기록한 프레임별 통계에서 지정한 항목의 값만 읽음.
+
+    각 줄은 'n:1 mse_avg:... psnr_avg:39.79 ...' 또는 'n:1 Y:... All:0.979 (16.9)' 형식이며,
+    'key:값' 형태의 항목에서 값만 추출함. 동일한 프레임(inf)도 그대로 float로 저장됨.
+
+    Args:
+        stats_path (str): 통계 파일 경로
+        key (str): 읽을 항목 이름 (PSNR은 'psnr_avg', SSIM은 'All')
+
+    Returns:
+        array: 프레임별 값 배열 (8바이트 실수)
+    """
+    prefix = f"{key}:" # 찾을 항목의 접두사
+    values = array('d')
+    with open(stats_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            for token in line.split():
+                if token.startswith(prefix):
+                    values.append(float(token[len(prefix):]))
+                    break
+    return values
+
+# 프레임별 점수를 결과에 보관하기 위해 압축하는 함수
+def pack_frame_series(values) -> bytes:
+    """
+    프레임별 점수를 float32 배열의 bytes로 압축.
+
+    결과 딕셔너리는 수천 개까지 메모리에 유지되고 워커에서 메인 프로세스로 전달되므로,
+    파이썬 리스트 대신 프레임당 4바이트의 압축된 형태로 보관함.
+
+    Args:
+        values: 프레임별 점수 시퀀스
+
+    Returns:
+        bytes: float32로 압축된 프레임별 점수
+    """
+    return array('f', values).tobytes()
+
+# 결과에 보관된 프레임별 점수를 복원하는 함수
+def get_frame_series(result: Dict[str, Any], metric: str) -> array:
+    """
+    결과 딕셔너리에 보관된 메트릭의 프레임별 점수를 배열로 복원.
+
+    그래프, 내보내기, 추천 로직에서 분석을 다시 실행하지 않고 백분위수 등 새로운 통계를 계산할 때 사용함.
+
+    Args:
+        result (Dict[str, Any]): perform_one_test의 결과 딕셔너리
+        metric (str): 'vmaf', 'psnr', 'ssim' 중 하나
+
+    Returns:
+        array: 프레임별 점수 배열 (float32). 보관된 값이 없으면 빈 배열
+    """
+    series = array('f')
+    packed = result.get("frame_series", {}).get(metric)
+    if packed:
+        series.frombytes(packed)
+    return series
+
+# 작업 로그를 결과에 연결하는 함수
+def _attach_task_log(result: Dict[str, Any], task: EncodingTask, log_text: str) -> Dict[str, Any]:
+    """
+    작업의 FFmpeg 로그를 gzip 파일로 저장하고, 결과에는 파일 경로만 남김.
+
+    로그에는 최대 여섯 번의 FFmpeg 실행에 대한 전체 stderr가 포함되어 작업마다 수십~수백 KB에 이르므로,
+    결과 딕셔너리에 그대로 담으면 메인 프로세스로 전달할 때마다 직렬화 비용이 들고 실행이 끝날 때까지 GUI 메모리에 누적됨.
+    로그 디렉토리가 지정되지 않았거나 저장에 실패한 경우에는 기존처럼 결과에 로그를 직접 포함함.
+
+    Args:
+        result (Dict[str, Any]): 반환할 결과 딕셔너리
+        task (EncodingTask): 실행한 작업
+        log_text (str): 작업의 전체 로그
+
+    Returns:
+        Dict[str, Any]: 'log_path' 또는 'log' 항목이 추가된 결과 딕셔너리
+    """
+    if task.log_dir:
+        log_path = os.path.join(task.log_dir, f"{sanitize_for_path(task.preset)}_{task.crf}.log.gz")
+        try:
+            with gzip.open(log_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+                f.write(log_text)
+            result["log_path"] = log_path
+            return result
+        except OSError as e:
+            logging.warning(f"Could not spool task log to {log_path}: {e}")
+    result["log"] = log_text
+    return result
+
+# 결과에 연결된 작업 로그를 읽는 함수
+def read_task_log(result: Dict[str, Any]) -> str:
+    """
+    결과 딕셔너리에 연결된 작업 로그를 필요한 시점에 읽어 반환.
+
+    Args:
+        result (Dict[str, Any]): perform_one_test의 결과 딕셔너리
+
+    Returns:
+        str: 로그 내용. 로그가 없거나 파일을 읽을 수 없으면 None
+    """
+    log_path = result.get("log_path")
+    if log_path:
+        try:
+            with gzip.open(log_path, 'rt', encoding='utf-8') as f:
+                return f.read()
+        except OSError as e:
+            logging.warning(f"Could not read task log {log_path}: {e}")
+            return None
+    return result.get("log")
+
+# 단일 테스트 작업 수행하는 함수 (멀티프로세싱으로 실행됨)
+def perform_one_test(task: EncodingTask, stage: str = "full", encode_state: Dict[str, Any] = None):
+    """
+    하나의 EncodingTask에 대해 인코딩 및 모든 분석을 순차적으로 실행하고 결과를 반환.
+
+    이 함수는 병렬 처리를 위해 별도의 프로세스에서 실행되며, 주어진 인코딩 설정에 대해 전체 워크플로우를 수행함.
+    인코딩 후 VMAF, PSNR/SSIM, 블록킹 감지를 한 번의 통합 분석으로 실행하고 모든 결과를 통합하여 반환함.
+    통합 분석이 비활성화되었거나 실패한 경우에는 메트릭별 개별 분석으로 대체함.
+
+    단계 분리 파이프라인에서는 인코딩('encode')과 분석('analyze')을 서로 다른 워커 풀에서 나누어 실행함.
+    'encode' 단계는 인코딩 결과 파일을 남겨두고 중간 상태를 반환하며, 'analyze' 단계는 그 상태를 받아 분석부터 이어서 실행함.
+
+    결과 캐시가 지정된 경우 FFmpeg를 실행하기 전에 같은 입력의 결과를 찾아, 있으면 ('encode' 단계에서도) 'cached' 표시가 붙은
+    성공 결과를 바로 반환하고, 새로 얻은 성공 결과는 캐시에 저장함.
+
+    Args:
+        task: 실행할 인코딩 작업을 담고 있는 EncodingTask 객체
+        stage: 실행할 단계 ('full': 전체, 'encode': 인코딩만, 'analyze': 분석만)
+        encode_state: 'analyze' 단계에서 사용할 'encode' 단계의 반환값
+
+    Returns:
+        dict: 인코딩 및 분석 결과를 담은 딕셔너리 ('encode' 단계 성공 시 status가 'encoded'인 중간 상태)
+    """
+    # 작업 시작 시간 기록 및 초기 변수 설정
+    start_time_dt = datetime.now()
+    builder = FFmpegCommandBuilder(task)
+    log_output = encode_state["log_text"] if stage == "analyze" else "" # 이 워커에서 실행된 모든 FFmpeg 명령어의 로그를 누적할 변수
+    keep_encoded_output = False # 'encode' 단계가 성공하면 분석 단계를 위해 인코딩 결과 파일을 남겨둠
+
+    watcher = DominanceWatcher(task) if task.prune_frontier_path or task.cancellable else None # 지배당하거나 취소된 인코딩의 조기 중단 (사용하지 않으면 None)
+
+    # 결과 캐시: 같은 샘플과 설정으로 이미 얻은 결과가 있으면 인코딩 없이 반환
+    cache = ResultCache(task.result_cache_path) if task.result_cache_path else None
+    cache_key = result_cache_key(task) if cache else ""
+    if cache_key and stage != "analyze":
+        cached = cache.get(cache_key)
+        if cached is not None and cached.get("status") == "success":
+            cached.update(cached=True, adv_opts_snapshot=task.adv_opts)
+            return _attach_task_log(cached, task, f"--- CACHED RESULT ---\nReused the stored result for identical inputs (cache key {cache_key}).\n")
+
+    def run_and_log(cmd: List[str], metric_name: str = "", watch: bool = False):
+        """
+        주어진 FFmpeg 명령어를 실행하고, 그 출력을 로그에 기록.
+
+        이 함수는 FFmpeg 명령어를 실행하고 실행 결과를 로그에 기록함.
+        명령어 실행 성공/실패 여부와 관계없이 모든 출력을 로그에 저장하여
+        디버깅과 문제 해결에 필요한 정보를 제공함.
+
+        Args:
+            cmd: 실행할 FFmpeg 명령어 리스트
+            metric_name: 실행하는 작업의 이름 (예: 'VMAF', 'PSNR', 'SSIM', 'ENCODE')
+            watch: True이면 출력 크기와 취소 표시를 감시하여 지배당하거나 취소된 인코딩을 중단 (최종 인코딩 패스에서 사용)
+
+        Returns:
+            str: FFmpeg의 표준 오류 출력 (로그 정보)
+
+        Raises:
+            subprocess.CalledProcessError: FFmpeg 명령어 실행이 실패한 경우
+            EncodePruned: 인코딩이 완료된 결과에 의해 지배당하거나 취소되어 중단된 경우
+        """
+        nonlocal log_output
+        log_output += f"--- COMMAND ({'ENCODE' if not metric_name else metric_name}) ---\n{' '.join(shlex.quote(c) for c in cmd)}\n\n--- FFmpeg Log ---\n"
+        
+        try:
+            if watch and watcher:
+                # 감시 스레드가 출력 크기와 취소 표시를 확인하며, 중단해야 하면 프로세스를 종료함
+                process = subprocess.Popen(
+                    cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding='utf-8', errors='ignore',
+                    startupinfo=_get_subprocess_startupinfo(), cwd=task.temp_dir,
+                )
+                watch_thread = threading.Thread(target=watcher.watch_process, args=(process,), daemon=True)
+                watch_thread.start()
+                stderr = process.stderr.read() # 표준 출력은 감시 스레드가 읽음
+                process.wait()
+                watch_thread.join()
+                if watcher.aborted:
+                    log_output += stderr
+                    raise EncodePruned()
+                if process.returncode != 0:
+                    raise subprocess.CalledProcessError(process.returncode, cmd, None, stderr)
+                result = subprocess.CompletedProcess(cmd, process.returncode, None, stderr)
+            else:
+                # FFmpeg 서브프로세스 실행
+                result = subprocess.run(
+                    cmd,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                    encoding='utf-8',
+                    errors='ignore',
+                    startupinfo=_get_subprocess_startupinfo(),
+                    cwd=task.temp_dir,
+                )
+
+            # FFmpeg의 표준 오류(stderr) 출력을 로그에 추가
+            if result.stderr:
+                log_output += result.stderr
+            else:
+                log_output += "(FFmpeg produced no log output. This is unexpected with the current loglevel.)"
+            
+            return result.stderr
+
+        except subprocess.CalledProcessError as e: # 프로세스 실행 중 오류 발생 시
+            # 오류 출력을 로그에 추가하고 예외를 다시 발생시켜 상위에서 처리하도록 함
+            if e.stderr:
+                log_output += e.stderr
+            else:
+                log_output += f"(FFmpeg produced no output. Process failed with return code: {e.returncode})"
+            raise e
+        
+        finally:
+            log_output += "\n\n" # 각 명령어 로그의 끝에 구분자를 추가
+
+    def run_piped_and_log(encode_cmd: List[str], analysis_cmd: List[str]):
+        """
+        인코딩과 통합 분석을 파이프로 연결하여 실행하고, 두 프로세스의 출력을 로그에 기록.
+
+        Args:
+            encode_cmd: 표준 출력으로 스트림을 내보내는 인코딩 명령어
+            analysis_cmd: 표준 입력에서 스트림을 읽는 통합 분석 명령어
+
+        Returns:
+            tuple: (전달된 바이트 수, 분석 로그) 또는 분석 측만 실패한 경우 (None, None)
+
+        Raises:
+            subprocess.CalledProcessError: 인코더 자체가 실패한 경우
+        """
+        nonlocal log_output
+        relay = _relay_encoder_to_analysis(encode_cmd, analysis_cmd, task.temp_dir, watcher.should_abort if watcher else None)
+
+        log_output += f"--- COMMAND (ENCODE -> PIPE) ---\n{' '.join(shlex.quote(c) for c in encode_cmd)}\n\n--- FFmpeg Log ---\n"
+        log_output += (relay["encode_stderr"] or f"(FFmpeg produced no output. Return code: {relay['encode_rc']})") + "\n\n"
+        log_output += f"--- COMMAND (FUSED ANALYSIS <- PIPE) ---\n{' '.join(shlex.quote(c) for c in analysis_cmd)}\n\n--- FFmpeg Log ---\n"
+        log_output += (relay["analysis_stderr"] or f"(FFmpeg produced no output. Return code: {relay['analysis_rc']})") + "\n\n"
+
+        if relay["aborted"]: # 완료된 결과에 의해 지배당하거나 취소되어 중단됨
+            raise EncodePruned()
+
+        # 분석 측이 먼저 파이프를 닫지 않았는데 인코더가 실패했다면 인코딩 오류로 처리
+        if relay["encode_rc"] != 0 and not relay["broken_pipe"]:
+            raise subprocess.CalledProcessError(relay["encode_rc"], encode_cmd, stderr=relay["encode_stderr"])
+        if relay["encode_rc"] != 0 or relay["analysis_rc"] != 0:
+            return None, None # 분석 측 문제로 판단되면 디스크 기반 방식으로 재시도하도록 함
+        return relay["bytes"], relay["analysis_stderr"]
+
+    try:
+        # --- 1. 인코딩 실행 ---
+        stage_started = time.monotonic() # 비용 모델 학습을 위한 단계별 소요 시간 측정 기준
+        streamed_bytes = None # 파이프를 통해 전달된 인코딩 결과의 크기 (바이트)
+        fused_stderr = None # 통합 분석이 성공한 경우 그 로그를 모든 메트릭 파싱에 재사용
+        use_fused_analysis = APP_CONFIG.get("fused_metric_analysis", True)
+        if stage == "analyze": # 인코딩은 다른 워커에서 이미 완료됨
+            encode_seconds = encode_state["encode_seconds"]
+        else:
+            is_2pass = bool(task.adv_opts.get("is_2pass"))
+            final_pass_num = 2 if is_2pass else 0 # 최종 출력을 만드는 패스 번호
+            if is_2pass: # 2-pass 인코딩인 경우 1패스를 먼저 실행
+                run_and_log(builder.build_encode_command(pass_num=1)) # 1패스 실행
+
+            # 스트리밍 모드: 최종 패스의 출력을 파이프로 통합 분석에 바로 전달하여 임시 파일을 만들지 않음
+            # (단계 분리 파이프라인에서는 분석을 다른 워커에서 실행하므로 항상 파일로 인코딩)
+            if stage == "full" and use_fused_analysis and APP_CONFIG.get("pipe_encode_to_analysis", False):
+                streamed_bytes, fused_stderr = run_piped_and_log(
+                    builder.build_encode_command(pass_num=final_pass_num, to_pipe=True),
+                    builder.build_fused_analysis_command(encoded_input="pipe:0"),
+                )
+                if streamed_bytes is None:
+                    log_output += "--- WARNING: Piped analysis failed. Falling back to encoding to a temporary file. ---\n\n"
+
+            if streamed_bytes is None: # 스트리밍을 사용하지 않았거나 실패한 경우 파일로 인코딩
+                run_and_log(builder.build_encode_command(pass_num=final_pass_num, report_progress=watcher is not None), watch=True)
+            encode_seconds = time.monotonic() - stage_started # 스트리밍 모드에서는 동시에 실행된 통합 분석 시간도 포함
+
+            if stage == "encode": # 분석 단계로 넘길 중간 상태를 반환
+                keep_encoded_output = True
+                return {"status": "encoded", "preset": task.preset, "crf": task.crf,
+                        "encode_seconds": encode_seconds, "log_text": log_output}
+        stage_started = time.monotonic()
+
+        # --- 2. 품질 메트릭 분석 ---
+        results = {"vmaf": 0, "psnr": 0, "ssim": 0, "vmaf_1_low": 0, "block_score": 0, "vmaf_std_dev": 0} # 결과 딕셔너리 초기화
+        frame_series = {} # 메트릭별 프레임 점수 (float32로 압축된 bytes)
+
+        # 통합 분석: 두 입력을 한 번만 디코딩하여 모든 메트릭을 동시에 계산
+        if use_fused_analysis and fused_stderr is None:
+            try:
+                fused_stderr = run_and_log(builder.build_fused_analysis_command(), metric_name="FUSED ANALYSIS")
+            except Exception as e:
+                # 통합 분석이 실패하면 기존의 메트릭별 개별 분석으로 대체
+                log_output += f"--- WARNING: Fused analysis failed. Falling back to separate metric passes. Error: {e} ---\n\n"
+
+        # VMAF 점수 계산
+        try:
+            if fused_stderr is None: # 통합 분석을 사용하지 않았거나 실패한 경우에만 개별 실행
+                run_and_log(builder.build_vmaf_command(), metric_name="VMAF") # VMAF 분석 실행
+            frame_scores, vmaf_mean, vmaf_std_dev = read_vmaf_frame_scores(task.vmaf_log_path) # 로그를 한 줄씩 읽으며 평균과 표준편차 계산
+            if frame_scores:
+                results["vmaf"] = vmaf_mean # 전체 프레임의 평균 VMAF 점수 저장
+                results["vmaf_1_low"] = vmaf_one_percent_low(frame_scores) # 하위 1% 점수들의 평균
+                results["vmaf_std_dev"] = vmaf_std_dev # VMAF 점수들의 표준편차
+                frame_series["vmaf"] = pack_frame_series(frame_scores) # 프레임별 점수를 압축하여 보관
+        except Exception as e:
+            log_output += f"--- WARNING: VMAF calculation failed. Setting to 0. Error: {e} ---\n\n"
+
+        # PSNR 계산 (사용자가 옵션을 활성화한 경우)
+        if task.metrics.get('psnr'):
+            try:
+                stderr = fused_stderr if fused_stderr is not None else run_and_log(builder.build_psnr_command(), metric_name="PSNR")
+                match = re.search(r"average:(\d+\.?\d*)", stderr) # FFmpeg 로그에서 PSNR 평균값 추출
+                if match:
+                    results["psnr"] = float(match.group(1))
+                frame_series["psnr"] = pack_frame_series(read_stats_file_series(task.psnr_stats_path, "psnr_avg")) # 프레임별 PSNR
+            except Exception as e:
+                log_output += f"--- WARNING: PSNR calculation failed. Setting to 0. Error: {e} ---\n\n"
+
+        # SSIM 계산 (사용자가 옵션을 활성화한 경우)
+        if task.metrics.get('ssim'):
+            try:
+                stderr = fused_stderr if fused_stderr is not None else run_and_log(builder.build_ssim_command(), metric_name="SSIM")
+                match = re.search(r"All:(\d+\.?\d*)", stderr) # FFmpeg 로그에서 SSIM 전체 평균값 추출
+                if match:
+                    results["ssim"] = float(match.group(1))
+                frame_series["ssim"] = pack_frame_series(read_stats_file_series(task.ssim_stats_path, "All")) # 프레임별 SSIM
+            except Exception as e:
+                log_output += f"--- WARNING: SSIM calculation failed. Setting to 0. Error: {e} ---\n\n"
+        
+        # 블록킹 점수 계산 (사용자가 옵션을 활성화한 경우)
+        if task.metrics.get('blockdetect'):
+            try:
+                stderr = fused_stderr if fused_stderr is not None else run_and_log(builder.build_blockdetect_command(), metric_name="BlockDetect")
+                match = re.search(r"block mean:\s*(\d+\.?\d*)", stderr) # FFmpeg 로그에서 블록 평균값 추출
+                if match:
+                    results["block_score"] = float(match.group(1))
+            except Exception as e:
+                log_output += f"--- WARNING: Blockdetect analysis failed. Setting to 0. Error: {e} ---\n\n"
+
+        analysis_seconds = time.monotonic() - stage_started
+
+        # --- 3. 최종 결과 집계 ---
+        # 인코딩된 파일 크기(MB) 계산 (스트리밍 모드에서는 파이프로 전달된 바이트 수 사용)
+        encoded_bytes = streamed_bytes if streamed_bytes is not None else os.path.getsize(task.encoded_path)
+        size_mb = encoded_bytes / (1024 * 1024)
+        
+        # 작업 시간 기록 및 요약 생성
+        end_time_dt = datetime.now()
+        duration_td = end_time_dt - start_time_dt
+        time_summary = (
+            f"--- TIMING ---\n"
+            f"Start Time:     {start_time_dt.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"End Time:       {end_time_dt.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"Total Duration: {str(duration_td).split('.')[0]} (HH:MM:SS)\n\n"
+        )
+        
+        # 모든 분석 결과를 종합하여 최종 딕셔너리 형태로 반환 (캐시를 사용하는 경우 저장)
+        result = {
+            "preset": task.preset, "crf": task.crf,
+            "vmaf": results["vmaf"], "vmaf_1_low": results["vmaf_1_low"],
+            "vmaf_std_dev": results["vmaf_std_dev"],
+            "psnr": results["psnr"], "ssim": results["ssim"],
+            "block_score": results["block_score"],
+            "size_mb": size_mb,
+            "efficiency": results["vmaf"] / size_mb if size_mb > 0 else 0,
+            "status": "success",
+            "adv_opts_snapshot": task.adv_opts,
+            "frame_series": frame_series,
+            "encode_seconds": encode_seconds, "analysis_seconds": analysis_seconds,
+            "piped": streamed_bytes is not None # 파이프 모드에서는 encode_seconds가 동시에 실행된 분석 시간까지 포함
+        }
+        if cache_key and results["vmaf"] > 0: # VMAF 분석이 실패한 결과는 다음 실행에서 다시 시도하도록 저장하지 않음
+            cache.put(cache_key, result)
+        return _attach_task_log(result, task, time_summary + log_output)
+    
+    # --- 4. 예외 처리 ---
+    except EncodePruned:
+        if watcher.cancelled: # 메인 프로세스가 더 이상 필요로 하지 않아 중단한 경우 (오류가 아닌 'cancelled' 상태로 기록)
+            message = f"Cancelled (Preset: {task.preset}, CRF: {task.crf}): no longer needed by the search"
+            log_output += f"--- CANCELLED: {message} ---\n\n"
+            return _attach_task_log({"status": "cancelled", "message": message, "preset": task.preset, "crf": task.crf}, task, log_output)
+        # 완료된 결과에 의해 지배당하여 인코딩을 중단한 경우 (오류가 아닌 'pruned' 상태로 기록)
+        dominating = watcher.pruned_by
+        message = (f"Pruned (Preset: {task.preset}, CRF: {task.crf}): dominated by "
+                   f"{dominating['preset']} / CRF {dominating['crf']} ({dominating['size_bytes'] / (1024 * 1024):.2f} MB)")
+        log_output += f"--- PRUNED: {message} ---\n\n"
+        return _attach_task_log({"status": "pruned", "message": message, "preset": task.preset, "crf": task.crf}, task, log_output)
+
+    except subprocess.CalledProcessError as e:
+        # FFmpeg 프로세스가 0이 아닌 종료 코드를 반환한 경우의 처리
+        end_time_dt = datetime.now()
+        duration_td = end_time_dt - start_time_dt
+        time_summary = (
+            f"--- TIMING (ERROR) ---\n"
+            f"Start Time:     {start_time_dt.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"End Time:       {end_time_dt.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"Total Duration: {str(duration_td).split('.')[0]} (HH:MM:SS)\n\n"
+        )
+        
+        # e.stderr가 비어있는(None) 경우를 대비한 안전한 처리
+        stderr_output = ""
+        if e.stderr:
+            # bytes 타입일 경우 문자열로 디코딩
+            if isinstance(e.stderr, bytes):
+                stderr_output = e.stderr.decode('utf-8', errors='ignore')
+            else:
+                stderr_output = e.stderr
+
+        # 사용자에게 표시될 오류 메시지 생성
+        message = f"FFmpeg process failed (Preset: {task.preset}, CRF: {task.crf}): Return code {e.returncode}"
+        if stderr_output:
+            message += f"\nFFmpeg error: {stderr_output.strip()[:200]}..."
+        
+        # 현재까지 누적된 모든 로그와 타이밍 정보를 최종 결과에 포함
+        final_log = time_summary + log_output
+        return _attach_task_log({"status": "error", "message": message, "preset": task.preset, "crf": task.crf}, task, final_log)
+    
+    except OSError as e:
+        # 파일 시스템 접근 또는 프로세스 생성 관련 시스템 오류의 처리
+        end_time_dt = datetime.now()
+        duration_td = end_time_dt - start_time_dt
+        time_summary = (
+            f"--- TIMING (ERROR) ---\n"
+            f"Start Time:     {start_time_dt.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"End Time:       {end_time_dt.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"Total Duration: {str(duration_td).split('.')[0]} (HH:MM:SS)\n\n"
+        )
+        message = f"System error during encode (Preset: {task.preset}, CRF: {task.crf}): {e}"
+        final_log = time_summary + log_output
+        return _attach_task_log({"status": "error", "message": message, "preset": task.preset, "crf": task.crf}, task, final_log)
+    
+    except Exception as e:
+        # 위에서 명시되지 않은 기타 모든 예외의 처리
+        end_time_dt = datetime.now()
+        duration_td = end_time_dt - start_time_dt
+        time_summary = (
+            f"--- TIMING (ERROR) ---\n"
+            f"Start Time:     {start_time_dt.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"End Time:       {end_time_dt.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"Total Duration: {str(duration_td).split('.')[0]} (HH:MM:SS)\n\n"
+        )
+        message = f"Unexpected error during encode (Preset: {task.preset}, CRF: {task.crf}): {e}"
+        final_log = time_summary + log_output
+        return _attach_task_log({"status": "error", "message": message, "preset": task.preset, "crf": task.crf}, task, final_log)
+    
+    # --- 5. 마무리 (정리 작업) ---
+    finally:
+        # 작업 성공/실패 여부와 관계없이 생성된 임시 파일들을 정리
+        passlogfile_name = f"ffmpeg2pass_{task.preset}_{task.crf}"
+        passlogfile_path = os.path.join(task.temp_dir, passlogfile_name)
+        
+        files_to_remove = [
+            task.encoded_path,
+            task.vmaf_log_path,
+            task.psnr_stats_path,
+            task.ssim_stats_path,
+            passlogfile_path,
+            f"{passlogfile_path}.log",
+            f"{passlogfile_path}.mbtree"
+        ]
+
+        if keep_encoded_output: # 분석 단계에서 사용할 인코딩 결과 파일은 남겨둠
+            files_to_remove.remove(task.encoded_path)
+
+        for p in files_to_remove:
+            if os.path.exists(p):
+                try:
+                    os.remove(p)
+                except OSError:
+                    logging.warning(f"Could not remove temporary file: {p}")
+                    pass # 파일 삭제 실패 시에도 전체 작업이 중단되지 않도록 함
+
+
+
+# A/B 비교용 샘플을 인코딩하는 함수 (멀티프로세싱으로 실행됨)
+def encode_comparison_sample(task: EncodingTask, output_filename: str) -> str:
+    """
+    A/B 비교를 위해 하나의 결과 설정으로 샘플 영상을 인코딩.
+
+    Args:
+        task: 인코딩 설정을 담은 EncodingTask 객체
+        output_filename: 임시 디렉토리에 생성할 출력 파일명
+
+    Returns:
+        str: 인코딩된 샘플 파일의 절대 경로
+
+    Raises:
+        subprocess.CalledProcessError: 인코딩이 실패한 경우
+    """
+    builder = FFmpegCommandBuilder(task)
+    cmd = builder.build_encode_command()
+    cmd[-1] = output_filename # 명령어의 마지막 요소인 출력 파일명을 덮어씀
+    subprocess.run(cmd, check=True, capture_output=True, startupinfo=_get_subprocess_startupinfo(), cwd=task.temp_dir)
+    return os.path.join(task.temp_dir, output_filename)
+
+
+# A/B 비교용 차이 영상을 생성하는 함수 (멀티프로세싱으로 실행됨)
+def create_difference_video(ffmpeg_path: str, temp_dir: str, original_sample_path: str, encoded_sample_path: str, output_diff_filename: str) -> str:
+    """
+    원본 샘플과 인코딩된 샘플 간의 차이 영상을 생성.
+
+    Args:
+        ffmpeg_path: FFmpeg 실행 파일 경로
+        temp_dir: 입력 파일이 있고 결과를 저장할 작업 디렉토리
+        original_sample_path: 원본 샘플 파일 경로
+        encoded_sample_path: 인코딩된 샘플 파일 경로
+        output_diff_filename: 생성할 차이 영상 파일명
+
+    Returns:
+        str: 생성된 차이 영상의 절대 경로
+
+    Raises:
+        subprocess.CalledProcessError: 차이 영상 생성이 실패한 경우
+    """
+    filter_complex = "[0:v]setpts=PTS-STARTPTS[dist];[1:v]setpts=PTS-STARTPTS[ref];[dist][ref]blend=all_mode=difference"
+    cmd = [
+        ffmpeg_path, '-y', '-hide_banner', '-loglevel', 'info',
+        '-i', os.path.basename(encoded_sample_path),
+        '-i', os.path.basename(original_sample_path),
+        '-filter_complex', filter_complex,
+        '-c:v', 'libx264', '-crf', '16', '-an',
+        output_diff_filename
+    ]
+    subprocess.run(cmd, check=True, capture_output=True, startupinfo=_get_subprocess_startupinfo(), cwd=temp_dir)
+    return os.path.join(temp_dir, output_diff_filename)
+
+# 실행 컨텍스트를 파일로 공유하는 함수
+def publish_run_context(context: RunContext) -> str:
+    """
+    실행 컨텍스트를 임시 디렉토리에 한 번만 직렬화하여 저장하고 그 경로를 반환.
+
+    워커 풀은 실행 간에 재사용되므로 풀 초기화 함수(initializer)로는 실행마다 다른 설정을 전달할 수 없음.
+    대신 컨텍스트를 파일로 한 번 저장하고, 각 워커가 처음 필요할 때 읽어 캐싱하도록 하여
+    작업마다 전체 설정을 직렬화하는 비용을 없앰.
+    임시 디렉토리 경로는 같은 파일을 다시 테스트할 때 반복되므로, 파일 이름에 실행마다 고유한 토큰을 넣어
+    워커에 남아 있는 이전 실행의 캐시가 재사용되지 않도록 함.
+
+    Args:
+        context (RunContext): 공유할 실행 컨텍스트
+
+    Returns:
+        str: 저장된 컨텍스트 파일의 경로
+    """
+    context_path = os.path.join(context.temp_dir, f"run_context_{uuid.uuid4().hex}.pkl") # 캐시 키가 실행마다 달라지도록 고유 토큰 사용
+    partial_path = context_path + ".part"
+    with open(partial_path, "wb") as f:
+        pickle.dump(context, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(partial_path, context_path) # 워커가 쓰기 중인 파일을 읽지 않도록 원자적으로 교체
+    return context_path
+
+# 워커 프로세스에 캐싱된 실행 컨텍스트 (경로 -> RunContext)
+_run_context_cache: Dict[str, RunContext] = {}
+
+def _load_run_context(context_path: str) -> RunContext:
+    """
+    워커 프로세스에서 실행 컨텍스트를 읽어 반환. 같은 실행의 이후 작업은 캐시된 객체를 사용함.
+
+    Args:
+        context_path (str): publish_run_context가 반환한 컨텍스트 파일 경로
+
+    Returns:
+        RunContext: 실행 컨텍스트
+    """
+    context = _run_context_cache.get(context_path)
+    if context is None:
+        with open(context_path, "rb") as f:
+            context = pickle.load(f)
+        _run_context_cache.clear() # 이전 실행의 컨텍스트는 더 이상 사용되지 않으므로 정리
+        _run_context_cache[context_path] = context
+    return context
+
+# Range Test의 (프리셋, CRF) 작업 묶음을 실행하는 함수 (멀티프로세싱으로 실행됨)
+def run_range_test_batch(batch):
+    """
+    (컨텍스트 경로, [(프리셋, CRF, 스레드 수), ...]) 작업 묶음을 순서대로 실행.
+
+    각 항목은 공유 컨텍스트와 결합하여 EncodingTask로 복원한 뒤 실행함.
+    작업을 묶어서 전달하면 프로세스 간 통신과 결과 전달 횟수가 묶음 크기만큼 줄어듦.
+    메인 프로세스는 같은 프리셋의 작업끼리 묶으므로, 작업 시작 조절은 묶음 하나를 해당 프리셋 작업 하나로 예약함.
+
+    Args:
+        batch (tuple): (context_path, [(preset, crf, threads), ...])
+
+    Returns:
+        list: 각 항목에 대한 perform_one_test 결과 딕셔너리 목록
+    """
+    context_path, items = batch
+    context = _load_run_context(context_path)
+    return [perform_one_test(context.make_task(preset, crf, threads)) for preset, crf, threads in items]
+
+# Target VMAF의 프리셋 탐색 하나를 실행하는 함수 (멀티프로세싱으로 실행됨)
+def run_target_vmaf_item(item):
+    """
+    (컨텍스트 경로, 프리셋, 스레드 수) 작업 항목에 대해 목표 VMAF를 만족하는 CRF를 탐색.
+
+    결과는 완료 순서대로 전달되므로, 어느 프리셋의 결과인지 함께 반환함.
+    탐색 중 예외가 발생해도 다른 프리셋의 결과가 유실되지 않도록 실패로 처리함.
+
+    Args:
+        item (tuple): (context_path, preset, threads)
+
+    Returns:
+        tuple: (프리셋, find_best_crf_for_preset의 결과 또는 None)
+    """
+    context_path, preset, threads = item
+    try:
+        return preset, find_best_crf_for_preset(preset, _load_run_context(context_path), threads)
+    except Exception as e:
+        logging.error(f"Target VMAF search failed for preset {preset}: {e}", exc_info=True)
+        return preset, None
+
+# Target VMAF 탐색의 CRF 테스트 하나를 실행하는 함수 (멀티프로세싱으로 실행됨)
+def run_target_probe_item(item):
+    """
+    (컨텍스트 경로, 프리셋, CRF, 스레드 수, 최종 여부) 작업 항목에 대해 CRF 하나를 테스트.
+
+    메인 프로세스의 작업 단위 스케줄러가 같은 프리셋의 여러 CRF를 동시에 실행할 때 사용함.
+    탐색 결과에 따라 더 이상 필요 없어진 테스트는 메인 프로세스가 취소 표시 파일을 만들어 중단시킬 수 있음.
+    최종 여부가 True이면 순차 검정 없이 전체 분석을 수행하여 결과 목록에 표시할 결과를 만듦.
+
+    Args:
+        item (tuple): (context_path, preset, crf, threads, final)
+
+    Returns:
+        tuple: (프리셋, CRF, VMAF 점수 또는 None, 결과 딕셔너리 또는 None)
+    """
+    context_path, preset, crf, threads, final = item
+    try:
+        context = _load_run_context(context_path)
+        task = context.make_task(preset, crf, threads)
+        task.cancellable = not final
+        vmaf_score, result = evaluate_target_crf(task, context.target_vmaf, allow_screening=not final)
+        return preset, crf, vmaf_score, result
+    except Exception as e:
+        logging.error(f"Target VMAF probe failed for preset {preset}, CRF {crf}: {e}", exc_info=True)
+        return preset, crf, None, None
+
+# 단계 분리 파이프라인의 인코딩 단계를 실행하는 함수 (멀티프로세싱으로 실행됨)
+def run_encode_stage_item(item):
+    """
+    (컨텍스트 경로, 프리셋, CRF, 스레드 수) 작업 항목의 인코딩 단계만 실행.
+
+    Args:
+        item (tuple): (context_path, preset, crf, threads)
+
+    Returns:
+        dict: status가 'encoded'인 중간 상태 (분석 단계에 전달), 실패한 경우 오류 결과 딕셔너리
+    """
+    context_path, preset, crf, threads = item
+    return perform_one_test(_load_run_context(context_path).make_task(preset, crf, threads), stage="encode")
+
+# 단계 분리 파이프라인의 분석 단계를 실행하는 함수 (멀티프로세싱으로 실행됨)
+def run_analysis_stage_item(item):
+    """
+    인코딩 단계가 남긴 결과 파일에 대해 분석 단계를 실행하고 최종 결과를 반환.
+
+    Args:
+        item (tuple): (context_path, preset, crf, threads, encode_state)
+
+    Returns:
+        dict: perform_one_test와 같은 형식의 최종 결과 딕셔너리
+    """
+    context_path, preset, crf, threads, encode_state = item
+    return perform_one_test(_load_run_context(context_path).make_task(preset, crf, threads), stage="analyze", encode_state=encode_state)
+
+# 작업별 스레드 수를 계획하는 함수
+def plan_core_budget(total_items: int, parallel_jobs: int, cores: int, piped: bool = False) -> Tuple[int, List[int]]:
+    """
+    CPU 코어 예산을 병렬 작업에 나누어 실행 전체의 인코더 스레드 수와 작업 순서별 libvmaf 스레드 수를 계획.
+
+    x264 등은 스레드 수에 따라 출력 비트스트림이 달라지므로, 인코더 스레드 수를 작업의 실행 위치에 따라 바꾸면
+    같은 (프리셋, CRF) 결과가 큐 위치에 따라 달라지고 프리셋끼리 다른 조건에서 비교됨.
+    따라서 인코더에는 작업 슬롯 하나의 예산(코어 수 / 병렬 작업 수)을 실행 내내 고정으로 할당하고,
+    다른 작업들이 끝나 가는 실행 막바지에 남는 코어는 점수에 영향을 주지 않는 libvmaf 스레드에만 몰아줌.
+    파이프 모드에서는 인코더와 libvmaf가 동시에 실행되므로, 슬롯 예산을 설정된 비율로 나누어 두 프로세스의 합이 예산을 넘지 않게 함.
+
+    Args:
+        total_items (int): 전체 작업 수
+        parallel_jobs (int): 동시에 실행되는 워커 프로세스 수
+        cores (int): 사용할 수 있는 논리 CPU 코어 수
+        piped (bool): 인코더 출력을 파이프로 분석에 전달하여 두 프로세스가 동시에 실행되는지 여부
+
+    Returns:
+        Tuple[int, List[int]]: (인코더 스레드 수, 작업 순서별 libvmaf 스레드 수) (모두 1 이상)
+    """
+    jobs = max(1, parallel_jobs)
+    slot_budget = max(1, cores // jobs) # 모든 워커가 사용 중일 때 작업 하나의 코어 예산
+    encoder_threads = slot_budget
+    if piped: # 인코더와 libvmaf가 슬롯 예산을 나누어 사용 (각각 최소 1개)
+        encoder_threads = min(max(1, round(slot_budget * APP_CONFIG['core_budget_pipe_encoder_share'])), max(1, slot_budget - 1))
+
+    plan = []
+    for i in range(total_items):
+        concurrent = min(jobs, total_items) if i < jobs else min(jobs, total_items - i) # 이 작업과 함께 실행되는 작업 수
+        budget = max(1, cores // concurrent)
+        plan.append(max(1, budget - encoder_threads) if piped else budget)
+    return encoder_threads, plan
+
+# 워커 프로세스 초기화 함수 (멀티프로세싱으로 실행됨)
+def _init_worker():
+    """
+    워커 프로세스가 시작될 때 한 번 호출되어 프로세스 단위 설정을 수행.
+
+    메인 스크립트를 임포트하지 않는 워커에서도 로그가 같은 파일에 기록되도록 로깅을 설정함.
+    """
+    configure_logging()
+
+# 엔진 모듈만 임포트하는 워커 풀을 생성하는 함수
+def create_worker_pool(processes: int):
+    """
+    GUI 의존성을 로드하지 않는 가벼운 워커 프로세스 풀을 생성.
+
+    spawn 방식(Windows, macOS 기본값)의 자식 프로세스는 부모의 메인 스크립트를 다시 실행하지만,
+    실행 스크립트('Video Encoding Optimizer.py')는 GUI 모듈을 메인 프로세스에서만 임포트하므로
+    처음 시작되는 워커와 나중에 다시 시작되는 워커 모두 작업 함수가 정의된 이 모듈만 임포트하게 됨.
+
+    Args:
+        processes (int): 생성할 워커 프로세스 수
+
+    Returns:
+        multiprocessing.pool.Pool: 생성된 워커 풀
+    """
+    return multiprocessing.Pool(processes=processes, initializer=_init_worker)